@@ -1,78 +1,166 @@
-"""Shared AI helpers and base structures."""
+"""Shared AI helpers and base structures.
+
+Public names are resolved lazily on first attribute access so importing the
+package does not pull in Jinja, Pydantic models, or the Agents SDK until they
+are actually used.
+"""
 
 from __future__ import annotations
 
-from .async_utils import run_coroutine_thread_safe, run_coroutine_with_fallback
-from .context_manager import (
-    AsyncManagedResource,
-    ManagedResource,
-    async_context,
-    ensure_closed,
-    ensure_closed_async,
-)
-from .errors import (
-    OpenAISDKError,
-    ConfigurationError,
-    PromptNotFoundError,
-    AgentExecutionError,
-    VectorStorageError,
-    ToolExecutionError,
-    ResponseGenerationError,
-    InputValidationError,
-    AsyncExecutionError,
-    ResourceCleanupError,
-)
-from .logging_config import LoggerFactory
-from .retry import with_exponential_backoff
-from .validation import (
-    validate_choice,
-    validate_dict_mapping,
-    validate_list_items,
-    validate_max_length,
-    validate_non_empty_string,
-    validate_safe_path,
-    validate_url_format,
-)
-from .structure import (
-    BaseStructure,
-    SchemaOptions,
-    PlanStructure,
-    TaskStructure,
-    WebSearchStructure,
-    VectorSearchStructure,
-    PromptStructure,
-    spec_field,
-    SummaryStructure,
-    ExtendedSummaryStructure,
-    ValidationResultStructure,
-    AgentBlueprint,
-)
-from .prompt import PromptRenderer
-from .config import OpenAISettings
-from .vector_storage import VectorStorage, VectorStorageFileInfo, VectorStorageFileStats
-from .agent import (
-    AgentBase,
-    AgentConfig,
-    AgentEnum,
-    CoordinatorAgent,
-    SummarizerAgent,
-    TranslatorAgent,
-    ValidatorAgent,
-    VectorSearch,
-    WebAgentSearch,
-)
-from .response import (
-    BaseResponse,
-    ResponseMessage,
-    ResponseMessages,
-    ResponseToolCall,
-    attach_vector_store,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._loop import install_uvloop
+    from .async_utils import (
+        run_coroutine_in_background,
+        run_coroutine_in_thread_runner,
+        run_coroutine_thread_safe,
+        run_coroutine_with_fallback,
+        shutdown_sync_runner,
+    )
+    from .context_manager import (
+        AsyncManagedResource,
+        ManagedResource,
+        async_context,
+        ensure_closed,
+        ensure_closed_async,
+    )
+    from .errors import (
+        OpenAISDKError,
+        ConfigurationError,
+        PromptNotFoundError,
+        AgentExecutionError,
+        VectorStorageError,
+        ToolExecutionError,
+        ResponseGenerationError,
+        InputValidationError,
+        AsyncExecutionError,
+        ResourceCleanupError,
+    )
+    from .logging_config import LoggerFactory
+    from .retry import with_exponential_backoff
+    from .validation import (
+        validate_choice,
+        validate_dict_mapping,
+        validate_list_items,
+        validate_max_length,
+        validate_non_empty_string,
+        validate_safe_path,
+        validate_url_format,
+    )
+    from .structure import (
+        BaseStructure,
+        SchemaOptions,
+        PlanStructure,
+        TaskStructure,
+        WebSearchStructure,
+        VectorSearchStructure,
+        PromptStructure,
+        spec_field,
+        SummaryStructure,
+        ExtendedSummaryStructure,
+        ValidationResultStructure,
+        AgentBlueprint,
+    )
+    from .prompt import PromptRenderer
+    from .config import OpenAISettings
+    from .vector_storage import (
+        VectorStorage,
+        VectorStorageFileInfo,
+        VectorStorageFileStats,
+    )
+    from .agent import (
+        AgentBase,
+        AgentConfig,
+        AgentEnum,
+        CoordinatorAgent,
+        SummarizerAgent,
+        TranslatorAgent,
+        ValidatorAgent,
+        VectorSearch,
+        WebAgentSearch,
+    )
+    from .response import (
+        BaseResponse,
+        ResponseMessage,
+        ResponseMessages,
+        ResponseToolCall,
+        attach_vector_store,
+    )
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "run_coroutine_in_background": ".async_utils",
+    "run_coroutine_thread_safe": ".async_utils",
+    "run_coroutine_with_fallback": ".async_utils",
+    "run_coroutine_in_thread_runner": ".async_utils",
+    "shutdown_sync_runner": ".async_utils",
+    "install_uvloop": "._loop",
+    "AsyncManagedResource": ".context_manager",
+    "ManagedResource": ".context_manager",
+    "async_context": ".context_manager",
+    "ensure_closed": ".context_manager",
+    "ensure_closed_async": ".context_manager",
+    "OpenAISDKError": ".errors",
+    "ConfigurationError": ".errors",
+    "PromptNotFoundError": ".errors",
+    "AgentExecutionError": ".errors",
+    "VectorStorageError": ".errors",
+    "ToolExecutionError": ".errors",
+    "ResponseGenerationError": ".errors",
+    "InputValidationError": ".errors",
+    "AsyncExecutionError": ".errors",
+    "ResourceCleanupError": ".errors",
+    "LoggerFactory": ".logging_config",
+    "with_exponential_backoff": ".retry",
+    "validate_choice": ".validation",
+    "validate_dict_mapping": ".validation",
+    "validate_list_items": ".validation",
+    "validate_max_length": ".validation",
+    "validate_non_empty_string": ".validation",
+    "validate_safe_path": ".validation",
+    "validate_url_format": ".validation",
+    "BaseStructure": ".structure",
+    "SchemaOptions": ".structure",
+    "PlanStructure": ".structure",
+    "TaskStructure": ".structure",
+    "WebSearchStructure": ".structure",
+    "VectorSearchStructure": ".structure",
+    "PromptStructure": ".structure",
+    "spec_field": ".structure",
+    "SummaryStructure": ".structure",
+    "ExtendedSummaryStructure": ".structure",
+    "ValidationResultStructure": ".structure",
+    "AgentBlueprint": ".structure",
+    "PromptRenderer": ".prompt",
+    "OpenAISettings": ".config",
+    "VectorStorage": ".vector_storage",
+    "VectorStorageFileInfo": ".vector_storage",
+    "VectorStorageFileStats": ".vector_storage",
+    "AgentBase": ".agent",
+    "AgentConfig": ".agent",
+    "AgentEnum": ".agent",
+    "CoordinatorAgent": ".agent",
+    "SummarizerAgent": ".agent",
+    "TranslatorAgent": ".agent",
+    "ValidatorAgent": ".agent",
+    "VectorSearch": ".agent",
+    "WebAgentSearch": ".agent",
+    "BaseResponse": ".response",
+    "ResponseMessage": ".response",
+    "ResponseMessages": ".response",
+    "ResponseToolCall": ".response",
+    "attach_vector_store": ".response",
+}
 
 __all__ = [
     # Async utilities
+    "run_coroutine_in_background",
     "run_coroutine_thread_safe",
     "run_coroutine_with_fallback",
+    "run_coroutine_in_thread_runner",
+    "shutdown_sync_runner",
+    "install_uvloop",
     # Error classes
     "OpenAISDKError",
     "ConfigurationError",
@@ -135,3 +223,40 @@ __all__ = [
     "ResponseToolCall",
     "attach_vector_store",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public attribute from its submodule on first access.
+
+    Parameters
+    ----------
+    name : str
+        Attribute requested from the package.
+
+    Returns
+    -------
+    Any
+        The resolved attribute, cached in the module globals.
+
+    Raises
+    ------
+    AttributeError
+        If ``name`` is not a public attribute of the package.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return module attributes including lazily imported names.
+
+    Returns
+    -------
+    list[str]
+        Sorted attribute names.
+    """
+    return sorted(set(globals()) | set(__all__))
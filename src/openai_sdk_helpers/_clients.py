@@ -0,0 +1,159 @@
+"""Shared OpenAI clients reused across agents.
+
+Building an ``AsyncOpenAI`` client creates a fresh SSL context and an empty
+connection pool, so agents that each construct their own client pay for TLS
+setup and handshakes on every run. ``get_async_openai`` hands out one pooled
+client per event loop instead; pooled connections are bound to the loop that
+opened them, so clients are never shared across loops. The SSL context is
+also shared with the synchronous clients built by
+``OpenAISettings.create_client``. Both use ``DEFAULT_POOL_LIMITS``, which keep
+many more connections alive than the SDK's defaults so concurrent requests
+do not each open a new TLS connection. Pool limits are built with the
+``Limits`` type of whichever HTTP library the installed SDK uses.
+
+Setting ``OPENAI_SDK_HELPERS_AIOHTTP=1`` backs the pooled clients with the
+OpenAI SDK's aiohttp transport, which sustains more concurrent requests than
+the default httpx transport. The flag is ignored when ``openai[aiohttp]`` is
+not installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import contextlib
+import os
+import ssl
+import threading
+import weakref
+from collections.abc import Mapping
+from typing import Any, Optional, TypeVar
+
+from openai import DEFAULT_CONNECTION_LIMITS, AsyncOpenAI, DefaultAsyncHttpxClient
+
+AIOHTTP_ENV_VAR = "OPENAI_SDK_HELPERS_AIOHTTP"
+DEFAULT_POOL_LIMITS: dict[str, Any] = {
+    "max_connections": 256,
+    "max_keepalive_connections": 128,
+    "keepalive_expiry": 30.0,
+}
+
+# Limits class of the HTTP library the SDK is built on.
+_SDK_LIMITS = type(DEFAULT_CONNECTION_LIMITS)
+_LimitsT = TypeVar("_LimitsT")
+
+_LOCK = threading.Lock()
+_SSL_CONTEXT: Optional[ssl.SSLContext] = None
+_LOOP_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+    weakref.WeakKeyDictionary()
+)
+_UNBOUND_CLIENT: Optional[AsyncOpenAI] = None
+
+
+def _get_ssl_context() -> ssl.SSLContext:
+    """Return the process-wide SSL context, creating it on first use."""
+    global _SSL_CONTEXT
+    if _SSL_CONTEXT is None:
+        _SSL_CONTEXT = ssl.create_default_context()
+    return _SSL_CONTEXT
+
+
+def _pool_limits(
+    overrides: Optional[Mapping[str, Any]] = None,
+    limits_type: type[_LimitsT] = _SDK_LIMITS,
+) -> _LimitsT:
+    """Return connection pool limits for an HTTP client.
+
+    Parameters
+    ----------
+    overrides : Mapping[str, Any] or None, default=None
+        ``Limits`` arguments replacing the matching entries of
+        ``DEFAULT_POOL_LIMITS``.
+    limits_type : type, default=_SDK_LIMITS
+        ``Limits`` class to build; defaults to the one the SDK's HTTP
+        clients accept.
+
+    Returns
+    -------
+    Limits
+        Pool limits for the client.
+    """
+    return limits_type(**{**DEFAULT_POOL_LIMITS, **(overrides or {})})
+
+
+def _build_http_client() -> DefaultAsyncHttpxClient:
+    """Return the HTTP client backing a new ``AsyncOpenAI`` client.
+
+    Returns
+    -------
+    DefaultAsyncHttpxClient
+        aiohttp-backed client when ``OPENAI_SDK_HELPERS_AIOHTTP`` is set and
+        available, otherwise the SDK's default client. For type checkers the
+        SDK aliases both to the client type ``AsyncOpenAI`` accepts.
+    """
+    if os.getenv(AIOHTTP_ENV_VAR, "").lower() in {"1", "true", "yes"}:
+        try:
+            from openai import DefaultAioHttpClient
+
+            return DefaultAioHttpClient(verify=_get_ssl_context())
+        except (ImportError, RuntimeError):
+            # Older SDK, or installed without the ``aiohttp`` extra.
+            pass
+    return DefaultAsyncHttpxClient(verify=_get_ssl_context(), limits=_pool_limits())
+
+
+def _build_client() -> AsyncOpenAI:
+    """Return a new ``AsyncOpenAI`` client with a pooled HTTP transport."""
+    return AsyncOpenAI(http_client=_build_http_client())
+
+
+def get_async_openai() -> AsyncOpenAI:
+    """Return the shared ``AsyncOpenAI`` client for the running event loop.
+
+    Authentication and routing are read from the standard ``OPENAI_*``
+    environment variables, as with ``AsyncOpenAI()``.
+
+    Returns
+    -------
+    AsyncOpenAI
+        Client reused by every caller on the same event loop. When no loop is
+        running, a single process-wide client is returned.
+
+    Examples
+    --------
+    >>> async def main():
+    ...     client = get_async_openai()
+    ...     return client is get_async_openai()
+    """
+    global _UNBOUND_CLIENT
+    try:
+        loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    with _LOCK:
+        if loop is None:
+            if _UNBOUND_CLIENT is None:
+                _UNBOUND_CLIENT = _build_client()
+            return _UNBOUND_CLIENT
+        client = _LOOP_CLIENTS.get(loop)
+        if client is None:
+            client = _build_client()
+            _LOOP_CLIENTS[loop] = client
+        return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close shared clients whose transports can still be shut down cleanly."""
+    with _LOCK:
+        clients = list(_LOOP_CLIENTS.values())
+        if _UNBOUND_CLIENT is not None:
+            clients.append(_UNBOUND_CLIENT)
+        _LOOP_CLIENTS.clear()
+    for client in clients:
+        with contextlib.suppress(Exception):
+            asyncio.run(client.close())
+
+
+__all__ = ["AIOHTTP_ENV_VAR", "get_async_openai"]
@@ -0,0 +1,48 @@
+"""Optional uvloop event loop support.
+
+Call :func:`install_uvloop` once at application startup, before any event
+loop is created, to make uvloop the asyncio event loop implementation. Every
+loop created afterwards, including the background loop behind ``run_sync``
+and the loops started by ``run_coroutine_with_fallback``, then uses uvloop.
+Importing the package never changes the event loop policy on its own.
+"""
+
+from __future__ import annotations
+
+import sys
+
+_installed = False
+
+
+def install_uvloop() -> bool:
+    """Install uvloop as the asyncio event loop implementation.
+
+    Does nothing on Windows or when uvloop is not installed.
+
+    Returns
+    -------
+    bool
+        True if uvloop is (already) installed as the event loop
+        implementation, False otherwise.
+
+    Examples
+    --------
+    >>> from openai_sdk_helpers import install_uvloop
+    >>> install_uvloop()  # doctest: +SKIP
+    True
+    """
+    global _installed
+    if _installed:
+        return True
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return False
+    uvloop.install()
+    _installed = True
+    return True
+
+
+__all__ = ["install_uvloop"]
@@ -9,7 +9,9 @@ from .coordination import CoordinatorAgent
 from .runner import run_sync, run_async, run_streamed
 from .search.base import SearchPlanner, SearchToolAgent, SearchWriter
 from .summarizer import SummarizerAgent
-from .translator import TranslatorAgent
+from .translator import TranslatorAgent, translation_context
+from .translator_batch import BatchTranslator
+from .translation_cache import TranslationCache
 from .validation import ValidatorAgent
 from .utils import run_coroutine_agent_sync
 from .search.vector import VectorSearch
@@ -29,6 +31,9 @@ __all__ = [
     "SearchWriter",
     "SummarizerAgent",
     "TranslatorAgent",
+    "BatchTranslator",
+    "TranslationCache",
+    "translation_context",
     "ValidatorAgent",
     "VectorSearch",
     "WebAgentSearch",
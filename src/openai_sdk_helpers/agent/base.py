@@ -2,16 +2,121 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Protocol
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Protocol
 
-from agents import Agent, RunResult, RunResultStreaming, Runner
+from agents import Agent, OpenAIResponsesModel, RunResult, RunResultStreaming, Runner
 from agents.run_context import RunContextWrapper
 from agents.tool import FunctionTool
-from jinja2 import Template
+from jinja2 import Environment, Template, meta
+from openai import AsyncOpenAI
 
 from .runner import run_async, run_streamed, run_sync
 
+_TEMPLATE_ENV = Environment(auto_reload=False, cache_size=-1)
+_EMPTY_TEMPLATE = _TEMPLATE_ENV.from_string("")
+_DEFAULT_INSTRUCTIONS = "."
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+_RENDER_CACHE_SIZE = 128
+_AGENT_CACHE_SIZE = 32
+
+
+def _read_utf8(path: str) -> str:
+    """Return the UTF-8 text of the file at ``path`` in a single read.
+
+    Unlike :meth:`Path.read_text`, line endings are not translated; Jinja
+    normalizes them while parsing.
+
+    Parameters
+    ----------
+    path : str
+        File to read.
+
+    Returns
+    -------
+    str
+        Decoded file contents.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size).decode("utf-8")
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=512)
+def _compile_template(path: str, mtime_ns: int) -> tuple[Template, bool]:
+    """Return the compiled Jinja template stored at ``path``.
+
+    Parameters
+    ----------
+    path : str
+        Resolved path to the template file.
+    mtime_ns : int
+        Modification time of the file, used to invalidate stale entries.
+
+    Returns
+    -------
+    tuple[Template, bool]
+        Compiled template shared by every agent using ``path`` and whether
+        it references no context variables.
+    """
+    parsed = _TEMPLATE_ENV.parse(_read_utf8(path))
+    is_static = not meta.find_undeclared_variables(parsed)
+    return _TEMPLATE_ENV.from_string(parsed), is_static
+
+
+def _get_template(prompt_path: Path) -> tuple[Template, bool]:
+    """Return a cached compiled template for ``prompt_path``.
+
+    Parameters
+    ----------
+    prompt_path : Path
+        Location of the Jinja template file.
+
+    Returns
+    -------
+    tuple[Template, bool]
+        Compiled template, reused until the file changes on disk, and
+        whether it references no context variables.
+    """
+    resolved = prompt_path.resolve()
+    return _compile_template(str(resolved), resolved.stat().st_mtime_ns)
+
+
+def _render(template: Template, context: Mapping[str, Any]) -> str:
+    """Render ``template`` by calling its compiled root function directly.
+
+    Skips the argument handling of :meth:`Template.render`. Errors are
+    passed through ``Environment.handle_exception`` so they carry Jinja's
+    template line information, as they would from ``Template.render``.
+
+    Parameters
+    ----------
+    template : Template
+        Template compiled by ``_TEMPLATE_ENV``. Other objects exposing
+        ``render`` are rendered through it unchanged.
+    context : Mapping[str, Any]
+        Variables available to the template.
+
+    Returns
+    -------
+    str
+        Rendered text.
+    """
+    if not isinstance(template, Template):
+        return template.render(context)
+    try:
+        return _TEMPLATE_ENV.concat(  # type: ignore[attr-defined]
+            template.root_render_func(template.new_context(dict(context)))
+        )
+    except Exception:
+        template.environment.handle_exception()
+
 
 class AgentConfigLike(Protocol):
     """Protocol describing the configuration attributes for AgentBase."""
@@ -26,6 +131,15 @@ class AgentConfigLike(Protocol):
     model_settings: Optional[Any]
 
 
+def _overrides_prompt(agent: AgentBase) -> bool:
+    """Return whether a subclass customizes how instructions are rendered."""
+    cls = type(agent)
+    return (
+        cls._build_prompt_from_jinja is not AgentBase._build_prompt_from_jinja
+        or cls.build_prompt_from_jinja is not AgentBase.build_prompt_from_jinja
+    )
+
+
 class AgentBase:
     """Factory for creating and configuring specialized agents.
 
@@ -68,10 +182,14 @@ class AgentBase:
     -------
     from_config(config, run_context_wrapper)
         Instantiate a ``AgentBase`` from configuration.
+    set_run_context_wrapper(run_context_wrapper)
+        Replace the default run context used for prompt rendering.
     build_prompt_from_jinja(run_context_wrapper)
         Render the agent prompt using Jinja and optional context.
     get_prompt(run_context_wrapper, _)
         Render the agent prompt using the provided run context.
+    invalidate_prompt_cache()
+        Discard memoized prompt renders.
     get_agent()
         Construct the configured :class:`agents.Agent` instance.
     run(input, context, output_type)
@@ -92,6 +210,7 @@ class AgentBase:
         run_context_wrapper: Optional[RunContextWrapper[Dict[str, Any]]] = None,
         prompt_dir: Optional[Path] = None,
         default_model: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
     ) -> None:
         """Initialize the AgentBase using a configuration object.
 
@@ -108,6 +227,9 @@ class AgentBase:
             ignored.
         default_model : str or None, default=None
             Optional fallback model identifier if the config does not supply one.
+        client : AsyncOpenAI or None, default=None
+            Client used to call the model. Overrides ``config.client`` when
+            provided; when neither is set the Agents SDK default client is used.
         """
         name = config.name
         description = config.description or ""
@@ -123,10 +245,11 @@ class AgentBase:
         else:
             prompt_path = None
 
+        is_static = True
         if prompt_path is None:
-            self._template = Template("")
+            self._template = _EMPTY_TEMPLATE
         elif prompt_path.exists():
-            self._template = Template(prompt_path.read_text())
+            self._template, is_static = _get_template(prompt_path)
         else:
             raise FileNotFoundError(
                 f"Prompt template for agent '{name}' not found at {prompt_path}."
@@ -140,7 +263,21 @@ class AgentBase:
         self._output_type = config.output_type or config.input_type
         self._tools = config.tools
         self._model_settings = config.model_settings
+        self._client = client if client is not None else getattr(config, "client", None)
+        self._model: str | OpenAIResponsesModel = model
+        if self._client is not None:
+            self._model = OpenAIResponsesModel(model=model, openai_client=self._client)
         self._run_context_wrapper = run_context_wrapper
+        self._context_ref: Optional[Mapping[str, Any]] = (
+            run_context_wrapper.context if run_context_wrapper is not None else None
+        )
+        self._render_cache: Dict[Any, str] = {}
+        self._agent_cache: Dict[Any, Agent] = {}
+        self._agent_cache_lock = threading.Lock()
+        # Templates without variables render identically for every context.
+        self._static_instructions: Optional[str] = (
+            self._template.render() or _DEFAULT_INSTRUCTIONS if is_static else None
+        )
 
     @classmethod
     def from_config(
@@ -186,9 +323,27 @@ class AgentBase:
         str
             Prompt text rendered from the Jinja template.
         """
-        return self.build_prompt_from_jinja(
-            run_context_wrapper=self._run_context_wrapper
+        return self.build_prompt_from_jinja()
+
+    def set_run_context_wrapper(
+        self, run_context_wrapper: Optional[RunContextWrapper[Dict[str, Any]]]
+    ) -> None:
+        """Replace the default run context used for prompt rendering.
+
+        Memoized prompt renders are discarded because they were produced from
+        the previous context.
+
+        Parameters
+        ----------
+        run_context_wrapper : RunContextWrapper or None
+            Wrapper whose ``context`` dictionary becomes the default render
+            context, or ``None`` to render without context.
+        """
+        self._run_context_wrapper = run_context_wrapper
+        self._context_ref = (
+            run_context_wrapper.context if run_context_wrapper is not None else None
         )
+        self._render_cache.clear()
 
     def build_prompt_from_jinja(
         self, run_context_wrapper: Optional[RunContextWrapper[Dict[str, Any]]] = None
@@ -199,18 +354,46 @@ class AgentBase:
         ----------
         run_context_wrapper : RunContextWrapper or None, default=None
             Wrapper whose ``context`` dictionary is used to render the Jinja
-            template.
+            template. When omitted, the context of the wrapper supplied at
+            construction or via ``set_run_context_wrapper`` is used.
 
         Returns
         -------
         str
             Rendered prompt text.
         """
-        context = {}
         if run_context_wrapper is not None:
             context = run_context_wrapper.context
-
-        return self._template.render(context)
+        else:
+            context = self._context_ref or _EMPTY_CONTEXT
+
+        try:
+            key = tuple(sorted(context.items())) if context else ()
+            cached = self._render_cache.get(key)
+        except TypeError:
+            # Unhashable or unorderable context values cannot be memoized.
+            return _render(self._template, context)
+        if cached is not None:
+            return cached
+
+        rendered = _render(self._template, context)
+        if len(self._render_cache) >= _RENDER_CACHE_SIZE:
+            self._render_cache.clear()
+        self._render_cache[key] = rendered
+        return rendered
+
+    def invalidate_prompt_cache(self) -> None:
+        """Discard memoized prompt renders.
+
+        Call this after replacing the template or mutating objects referenced
+        by the run context so the next render reflects the change. Cached
+        :class:`agents.Agent` instances and the pre-rendered static
+        instructions are discarded as well.
+        """
+        self._static_instructions = None
+        self._render_cache.clear()
+        with self._agent_cache_lock:
+            self._agent_cache.clear()
 
     def get_prompt(
         self, run_context_wrapper: RunContextWrapper[Dict[str, Any]], _: Agent
@@ -235,29 +418,56 @@ class AgentBase:
     def get_agent(self) -> Agent:
         """Construct and return the configured :class:`agents.Agent` instance.
 
+        The agent is cached per rendered prompt, output type, tool objects and
+        model settings, so repeated runs with unchanged instructions reuse the
+        same instance. Adding or removing tools is picked up automatically;
+        call :meth:`invalidate_prompt_cache` after mutating the model settings
+        in place.
+
         Returns
         -------
         Agent
             Initialized agent ready for execution.
         """
+        instructions = self._static_instructions
+        if instructions is None or _overrides_prompt(self):
+            instructions = self._build_prompt_from_jinja() or _DEFAULT_INSTRUCTIONS
+        key = (
+            instructions,
+            id(self._output_type),
+            tuple(map(id, self._tools or ())),
+            id(self._model_settings),
+        )
+        cached = self._agent_cache.get(key)
+        if cached is not None:
+            return cached
+
         agent_config: Dict[str, Any] = {
             "name": self.agent_name,
-            "instructions": self._build_prompt_from_jinja() or ".",
-            "model": self.model,
+            "instructions": instructions,
+            "model": self._model,
         }
         if self._output_type:
             agent_config["output_type"] = self._output_type
         if self._tools:
-            agent_config["tools"] = self._tools
+            # A copy keeps the cached tools alive, so their ids stay unique.
+            agent_config["tools"] = list(self._tools)
         if self._model_settings:
             agent_config["model_settings"] = self._model_settings
 
-        return Agent(**agent_config)
+        with self._agent_cache_lock:
+            cached = self._agent_cache.get(key)
+            if cached is None:
+                if len(self._agent_cache) >= _AGENT_CACHE_SIZE:
+                    self._agent_cache.clear()
+                cached = Agent(**agent_config)
+                self._agent_cache[key] = cached
+        return cached
 
     async def run_async(
         self,
         input: str,
-        context: Optional[Dict[str, Any]] = None,
+        context: Optional[Mapping[str, Any]] = None,
         output_type: Optional[Any] = None,
     ) -> Any:
         """Execute the agent asynchronously.
@@ -266,8 +476,8 @@ class AgentBase:
         ----------
         input : str
             Prompt or query for the agent.
-        context : dict or None, default=None
-            Optional dictionary passed to the agent.
+        context : Mapping or None, default=None
+            Optional mapping passed to the agent.
         output_type : type or None, default=None
             Optional type used to cast the final output.
 
@@ -288,7 +498,7 @@ class AgentBase:
     def run_sync(
         self,
         input: str,
-        context: Optional[Dict[str, Any]] = None,
+        context: Optional[Mapping[str, Any]] = None,
         output_type: Optional[Any] = None,
     ) -> Any:
         """Run the agent synchronously.
@@ -297,8 +507,8 @@ class AgentBase:
         ----------
         input : str
             Prompt or query for the agent.
-        context : dict or None, default=None
-            Optional dictionary passed to the agent.
+        context : Mapping or None, default=None
+            Optional mapping passed to the agent.
         output_type : type or None, default=None
             Optional type used to cast the final output.
 
@@ -317,7 +527,7 @@ class AgentBase:
     def run_streamed(
         self,
         input: str,
-        context: Optional[Dict[str, Any]] = None,
+        context: Optional[Mapping[str, Any]] = None,
         output_type: Optional[Any] = None,
     ) -> RunResultStreaming:
         """Stream the agent execution results.
@@ -326,8 +536,8 @@ class AgentBase:
         ----------
         input : str
             Prompt or query for the agent.
-        context : dict or None, default=None
-            Optional dictionary passed to the agent.
+        context : Mapping or None, default=None
+            Optional mapping passed to the agent.
         output_type : type or None, default=None
             Optional type used to cast the final output.
 
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
 from typing import Any, List, Optional, Type
 
 from agents.model_settings import ModelSettings
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ..structure import BaseStructure
 
@@ -13,6 +14,12 @@ from ..structure import BaseStructure
 class AgentConfig(BaseStructure):
     """Configuration required to build an AgentBase.
 
+    Tools and model settings are normalized once at creation: ``tools`` is
+    copied into a list owned by the configuration and mapping-style
+    ``model_settings`` are converted to :class:`ModelSettings`. Agents built
+    from the configuration can therefore pass them through unchanged and use
+    their identity as a stable cache key.
+
     Methods
     -------
     print()
@@ -51,6 +58,52 @@ class AgentConfig(BaseStructure):
     model_settings: Optional[ModelSettings] = Field(
         default=None, title="Model Settings", description="Additional model settings"
     )
+    client: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        title="Client",
+        description="AsyncOpenAI client used to call the model; defaults to the SDK client",
+    )
+
+    @field_validator("tools", mode="before")
+    @classmethod
+    def _normalize_tools(cls, value: Iterable[Any] | None) -> List[Any] | None:
+        """Copy tool definitions into a list owned by the configuration.
+
+        Parameters
+        ----------
+        value : Iterable[Any] or None
+            Tool definitions supplied as any iterable.
+
+        Returns
+        -------
+        list[Any] or None
+            Tool definitions as a new list.
+        """
+        if value is None:
+            return None
+        return list(value)
+
+    @field_validator("model_settings", mode="before")
+    @classmethod
+    def _normalize_model_settings(
+        cls, value: ModelSettings | Mapping[str, Any] | None
+    ) -> ModelSettings | None:
+        """Convert mapping-style model settings into ``ModelSettings``.
+
+        Parameters
+        ----------
+        value : ModelSettings, Mapping[str, Any], or None
+            Model settings instance or keyword mapping.
+
+        Returns
+        -------
+        ModelSettings or None
+            Canonical model settings instance.
+        """
+        if isinstance(value, Mapping):
+            return ModelSettings(**value)
+        return value
 
     def print(self) -> str:
         """Return a human-readable representation.
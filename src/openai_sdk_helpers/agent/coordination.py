@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
 
+from ..async_utils import run_coroutine_in_background
 from ..structure import TaskStructure, PlanStructure, PromptStructure
 from ..environment import DATETIME_FMT
 from ..utils import JSONSerializable, log
@@ -363,16 +364,7 @@ class CoordinatorAgent(AgentBase, JSONSerializable):
             return asyncio.run(coroutine)
 
         if loop.is_running():
-            resolved_result: Any = None
-
-            def _run_in_thread() -> None:
-                nonlocal resolved_result
-                resolved_result = asyncio.run(coroutine)
-
-            thread = threading.Thread(target=_run_in_thread, daemon=True)
-            thread.start()
-            thread.join()
-            return resolved_result
+            return run_coroutine_in_background(coroutine, timeout=None)
 
         return loop.run_until_complete(coroutine)
 
@@ -7,17 +7,20 @@ signatures whether they need asynchronous, synchronous, or streamed results.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 
-from agents import Agent, RunResult, RunResultStreaming, Runner
+from agents import Runner
 
-from openai_sdk_helpers.async_utils import run_coroutine_with_fallback
+from openai_sdk_helpers.async_utils import run_coroutine_in_background
+
+if TYPE_CHECKING:  # pragma: no cover - only for typing hints
+    from agents import Agent, RunResult, RunResultStreaming
 
 
 async def run_async(
     agent: Agent,
     input: str,
-    context: Optional[Dict[str, Any]] = None,
+    context: Optional[Mapping[str, Any]] = None,
     output_type: Optional[Any] = None,
 ) -> Any:
     """Run an Agent asynchronously.
@@ -28,8 +31,8 @@ async def run_async(
         Configured agent instance to execute.
     input : str
         Prompt or query string for the agent.
-    context : dict or None, default=None
-        Optional context dictionary passed to the agent.
+    context : Mapping or None, default=None
+        Optional context mapping passed to the agent.
     output_type : type or None, default=None
         Optional type used to cast the final output.
 
@@ -57,14 +60,14 @@ async def run_async(
 def run_sync(
     agent: Agent,
     input: str,
-    context: Optional[Dict[str, Any]] = None,
+    context: Optional[Mapping[str, Any]] = None,
     output_type: Optional[Any] = None,
 ) -> Any:
     """Run an Agent synchronously.
 
-    Internally uses async execution with proper event loop handling.
-    If an event loop is already running, creates a new thread to avoid
-    nested event loop errors.
+    Submits the run to a persistent background event loop so repeated
+    synchronous calls reuse one thread and loop instead of creating new
+    ones, and calls made from inside a running event loop do not nest.
 
     Parameters
     ----------
@@ -72,8 +75,8 @@ def run_sync(
         Configured agent instance to execute.
     input : str
         Prompt or query string for the agent.
-    context : dict or None, default=None
-        Optional context dictionary passed to the agent.
+    context : Mapping or None, default=None
+        Optional context mapping passed to the agent.
     output_type : type or None, default=None
         Optional type used to cast the final output.
 
@@ -94,7 +97,8 @@ def run_sync(
     >>> result = run_sync(agent, "What is 2+2?")  # doctest: +SKIP
     """
     coro = Runner.run(agent, input, context=context)
-    result: RunResult = run_coroutine_with_fallback(coro)
+    # Agent runs may take many turns; wait for them like asyncio.run would.
+    result: RunResult = run_coroutine_in_background(coro, timeout=None)
     if output_type is not None:
         return result.final_output_as(output_type)
     return result
@@ -103,7 +107,7 @@ def run_sync(
 def run_streamed(
     agent: Agent,
     input: str,
-    context: Optional[Dict[str, Any]] = None,
+    context: Optional[Mapping[str, Any]] = None,
     output_type: Optional[Any] = None,
 ) -> RunResultStreaming:
     """Stream agent execution results.
@@ -114,8 +118,8 @@ def run_streamed(
         Configured agent to execute.
     input : str
         Prompt or query string for the agent.
-    context : dict or None, default=None
-        Optional context dictionary passed to the agent.
+    context : Mapping or None, default=None
+        Optional context mapping passed to the agent.
     output_type : type or None, default=None
         Optional type used to cast the final output.
 
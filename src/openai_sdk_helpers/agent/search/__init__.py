@@ -1,6 +1,8 @@
 """Search-related agent workflows and helpers."""
 
 from .base import SearchPlanner, SearchToolAgent, SearchWriter
+from .plan_cache import PlanCache
+from .result_cache import ResultCache
 from .web import (
     MAX_CONCURRENT_SEARCHES as WEB_MAX_CONCURRENT_SEARCHES,
     WebAgentPlanner,
@@ -20,6 +22,8 @@ __all__ = [
     "SearchPlanner",
     "SearchToolAgent",
     "SearchWriter",
+    "PlanCache",
+    "ResultCache",
     "WEB_MAX_CONCURRENT_SEARCHES",
     "WebAgentPlanner",
     "WebSearchToolAgent",
@@ -0,0 +1,71 @@
+"""SQLite storage shared by the search caches.
+
+``PlanCache`` and ``ResultCache`` both keep timestamped rows in a single
+SQLite table behind a lock. ``SQLiteCache`` owns the connection, schema
+creation, expiry and cleanup so the caches only implement their lookups.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+
+class SQLiteCache:
+    """Timestamped SQLite table guarded by a lock.
+
+    Subclasses set ``_TABLE`` and ``_SCHEMA``; the schema must define a
+    ``ts`` integer column holding the time each row was last written or used.
+    Methods are blocking; async callers should run them through
+    :func:`asyncio.to_thread`.
+
+    Parameters
+    ----------
+    path : Path
+        Database file, created if needed.
+    ttl_seconds : int
+        Maximum age of a row.
+
+    Methods
+    -------
+    clear()
+        Remove every cached row.
+    close()
+        Close the underlying database connection.
+    """
+
+    _TABLE: str
+    _SCHEMA: str
+
+    def __init__(self, path: Path, ttl_seconds: int) -> None:
+        """Open (and create if needed) the cache database."""
+        self._path = path
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(self._SCHEMA)
+
+    def clear(self) -> None:
+        """Remove every cached row."""
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self._TABLE}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _cutoff(self, now: int) -> int:
+        """Return the oldest timestamp of an unexpired row."""
+        return now - self._ttl_seconds
+
+    def _purge_expired(self, now: int) -> None:
+        """Delete expired rows; the caller holds the lock and a transaction."""
+        self._conn.execute(
+            f"DELETE FROM {self._TABLE} WHERE ts < ?", (self._cutoff(now),)
+        )
+
+
+__all__ = ["SQLiteCache"]
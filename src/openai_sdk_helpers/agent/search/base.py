@@ -8,19 +8,153 @@ and providing a consistent interface for new search types.
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Generic, List, Optional, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from openai import AsyncOpenAI
+from pydantic import BaseModel
+
+from ...utils.core import log
 
 from ..base import AgentBase
 from ..config import AgentConfig
+from ..runner import run_streamed
+
+if TYPE_CHECKING:  # pragma: no cover - only for typing hints
+    from agents import RunResultStreaming
+
+_ItemT_co = TypeVar("_ItemT_co", covariant=True)
+
+
+class SearchPlanLike(Protocol[_ItemT_co]):
+    """Protocol for search plans exposing their items as ``searches``."""
+
+    @property
+    def searches(self) -> Sequence[_ItemT_co]:
+        """Search items to execute."""
+        ...
+
 
 # Type variables for search workflow components
 ItemType = TypeVar("ItemType")  # Search item structure (e.g., WebSearchItemStructure)
 ResultType = TypeVar("ResultType")  # Individual search result
-PlanType = TypeVar("PlanType")  # Complete search plan structure
+# Complete search plan structure
+PlanType = TypeVar("PlanType", bound=SearchPlanLike[Any])
 ReportType = TypeVar("ReportType")  # Final report structure
 OutputType = TypeVar("OutputType")  # Generic output type
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _content_digest(value: Any) -> str:
+    """Return a SHA-256 digest of ``value``'s serialized content.
+
+    Parameters
+    ----------
+    value : Any
+        Pydantic model or any value with a meaningful ``str``.
+
+    Returns
+    -------
+    str
+        Hex digest used as a deterministic sort key.
+    """
+    text = value.model_dump_json() if isinstance(value, BaseModel) else str(value)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _drop_empty(results: List[Optional[T]]) -> List[T]:
+    """Return ``results`` without ``None`` entries.
+
+    The common case where every search produced a result returns the list
+    itself instead of copying it.
+
+    Parameters
+    ----------
+    results : list[T or None]
+        Search results, possibly containing ``None``.
+
+    Returns
+    -------
+    list[T]
+        Non-empty results in their original order.
+    """
+    if None not in results:
+        return cast(List[T], results)
+    return [result for result in results if result is not None]
+
+
+async def _run_bounded(
+    semaphore: asyncio.Semaphore,
+    search: Callable[[T], Awaitable[R]],
+    item: T,
+) -> R:
+    """Run ``search(item)`` while holding ``semaphore``.
+
+    Parameters
+    ----------
+    semaphore : asyncio.Semaphore
+        Semaphore limiting concurrent searches.
+    search : Callable[[T], Awaitable[R]]
+        Search coroutine function.
+    item : T
+        Item passed to ``search``.
+
+    Returns
+    -------
+    R
+        Result of the search.
+    """
+    async with semaphore:
+        return await search(item)
+
+
+async def _run_all(awaitables: List[Awaitable[T]]) -> List[T]:
+    """Await ``awaitables`` concurrently and return their results in order.
+
+    Uses :class:`asyncio.TaskGroup` when available so the first failure
+    cancels the remaining work immediately; the original exception is
+    re-raised rather than an ``ExceptionGroup``. Falls back to
+    :func:`asyncio.gather` on Python 3.10.
+
+    Parameters
+    ----------
+    awaitables : list[Awaitable[T]]
+        Awaitables to run.
+
+    Returns
+    -------
+    list[T]
+        Results in the same order as ``awaitables``.
+    """
+    task_group: Any = getattr(asyncio, "TaskGroup", None)
+    if task_group is None:
+        return list(await asyncio.gather(*awaitables))
+    try:
+        async with task_group() as group:
+            tasks = [group.create_task(awaitable) for awaitable in awaitables]
+    except BaseExceptionGroup as exc_group:  # noqa: F821 - Python 3.11+
+        raise exc_group.exceptions[0]
+    return [task.result() for task in tasks]
 
 
 class SearchPlanner(AgentBase, Generic[PlanType]):
@@ -41,6 +175,7 @@ class SearchPlanner(AgentBase, Generic[PlanType]):
         self,
         prompt_dir: Optional[Path] = None,
         default_model: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
     ) -> None:
         """Initialize the planner agent.
 
@@ -50,12 +185,15 @@ class SearchPlanner(AgentBase, Generic[PlanType]):
             Directory containing prompt templates.
         default_model : str, optional
             Default model identifier to use when not defined in config.
+        client : AsyncOpenAI, optional
+            Client shared with the other agents of the workflow.
         """
         config = self._configure_agent()
         super().__init__(
             config=config,
             prompt_dir=prompt_dir,
             default_model=default_model,
+            client=client,
         )
 
     @abstractmethod
@@ -103,14 +241,20 @@ class SearchToolAgent(AgentBase, Generic[ItemType, ResultType, PlanType]):
 
     Executes individual searches in a plan with concurrency control.
     Subclasses implement search execution logic by overriding the
-    `_configure_agent` and `run_search` methods.
+    `_configure_agent` and `run_search` methods. Subclasses backed by an LLM
+    may also override `_batch_run_search` to execute every item in a single
+    agent run when ``batch_searches`` is enabled.
 
     Methods
     -------
     run_agent(search_plan)
         Execute all searches in the plan.
+    run_agent_stream(search_plan)
+        Yield search results as they complete.
     run_search(item)
         Execute a single search item.
+    _batch_run_search(items)
+        Execute several search items together.
     _configure_agent()
         Return AgentConfig for this tool agent.
     """
@@ -120,6 +264,8 @@ class SearchToolAgent(AgentBase, Generic[ItemType, ResultType, PlanType]):
         prompt_dir: Optional[Path] = None,
         default_model: Optional[str] = None,
         max_concurrent_searches: int = 10,
+        client: Optional[AsyncOpenAI] = None,
+        batch_searches: bool = False,
     ) -> None:
         """Initialize the search tool agent.
 
@@ -131,13 +277,22 @@ class SearchToolAgent(AgentBase, Generic[ItemType, ResultType, PlanType]):
             Default model identifier to use when not defined in config.
         max_concurrent_searches : int, default=10
             Maximum number of concurrent search operations.
+        client : AsyncOpenAI, optional
+            Client shared with the other agents of the workflow.
+        batch_searches : bool, default=False
+            Execute plans with more than one item through `_batch_run_search`
+            instead of one `run_search` call per item.
         """
         self._max_concurrent_searches = max_concurrent_searches
+        self._batch_searches = batch_searches
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
         config = self._configure_agent()
         super().__init__(
             config=config,
             prompt_dir=prompt_dir,
             default_model=default_model,
+            client=client,
         )
 
     @abstractmethod
@@ -177,9 +332,114 @@ class SearchToolAgent(AgentBase, Generic[ItemType, ResultType, PlanType]):
         """
         pass
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore limiting searches on the running loop.
+
+        The semaphore is shared by every ``run_agent`` call on the same event
+        loop, so concurrent plans together respect
+        ``max_concurrent_searches``. A new one is created when the agent is
+        used from a different loop.
+
+        Returns
+        -------
+        asyncio.Semaphore
+            Semaphore bound to the running loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_searches)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _search_key(self, item: ItemType) -> Hashable:
+        """Return the key used to detect duplicate items within a plan.
+
+        Pydantic items with identical field values (for example the same
+        query and reason) share a key; other items are never merged.
+
+        Parameters
+        ----------
+        item : ItemType
+            Search item from the plan.
+
+        Returns
+        -------
+        Hashable
+            Key identifying the item.
+        """
+        if isinstance(item, BaseModel):
+            return item.model_dump_json()
+        return id(item)
+
+    def _dedupe(
+        self, search_plan: PlanType
+    ) -> tuple[List[Hashable], Dict[Hashable, ItemType]]:
+        """Return the plan's item keys and its first item for each key.
+
+        Parameters
+        ----------
+        search_plan : PlanType
+            Plan structure containing search items.
+
+        Returns
+        -------
+        tuple[list[Hashable], dict[Hashable, ItemType]]
+            Key of every item in plan order, and unique items by key.
+        """
+        items = list(search_plan.searches)
+        keys = [self._search_key(item) for item in items]
+        unique: Dict[Hashable, ItemType] = {}
+        for key, item in zip(keys, items):
+            unique.setdefault(key, item)
+        if len(unique) < len(items):
+            log(f"deduped_items={len(items) - len(unique)}", level=logging.DEBUG)
+        return keys, unique
+
+    async def _search_each(self, items: List[ItemType]) -> List[Optional[ResultType]]:
+        """Execute `run_search` for each item within the concurrency limit.
+
+        Parameters
+        ----------
+        items : list[ItemType]
+            Search items from the plan.
+
+        Returns
+        -------
+        list[ResultType or None]
+            One entry per item, in the order of ``items``.
+        """
+        semaphore = self._get_semaphore()
+        return await _run_all(
+            [_run_bounded(semaphore, self.run_search, item) for item in items]
+        )
+
+    async def _batch_run_search(
+        self, items: List[ItemType]
+    ) -> List[Optional[ResultType]]:
+        """Execute several search items together.
+
+        The default implementation falls back to one `run_search` call per
+        item; LLM-backed subclasses override it to issue a single agent call
+        for the whole batch.
+
+        Parameters
+        ----------
+        items : list[ItemType]
+            Search items from the plan.
+
+        Returns
+        -------
+        list[ResultType or None]
+            One entry per item, in the order of ``items``.
+        """
+        return await self._search_each(items)
+
     async def run_agent(self, search_plan: PlanType) -> List[ResultType]:
         """Execute all searches in the plan with concurrency control.
 
+        Duplicate items are searched once; each duplicate receives the result
+        of its first occurrence.
+
         Parameters
         ----------
         search_plan : PlanType
@@ -190,18 +450,58 @@ class SearchToolAgent(AgentBase, Generic[ItemType, ResultType, PlanType]):
         list[ResultType]
             Completed search results from executing the plan.
         """
-        semaphore = asyncio.Semaphore(self._max_concurrent_searches)
+        keys, unique = self._dedupe(search_plan)
+        items = list(unique.values())
+        if self._batch_searches and len(items) > 1:
+            results = await self._batch_run_search(items)
+        else:
+            results = await self._search_each(items)
+        if len(unique) == len(keys):
+            return _drop_empty(results)
+        by_key = dict(zip(unique, results))
+        return [result for key in keys if (result := by_key[key]) is not None]
+
+    async def run_agent_stream(
+        self, search_plan: PlanType
+    ) -> AsyncIterator[ResultType]:
+        """Yield search results in completion order.
+
+        Unlike :meth:`run_agent`, callers can act on each result as soon as
+        its search finishes instead of waiting for the slowest one.
+        Duplicate items are searched and yielded once. When batching is
+        enabled the batch results are yielded after the single agent run.
 
-        async def _bounded_search(item: ItemType) -> Optional[ResultType]:
-            """Execute search within concurrency limit."""
-            async with semaphore:
-                return await self.run_search(item)
-
-        items = getattr(search_plan, "searches", [])
-        tasks = [asyncio.create_task(_bounded_search(item)) for item in items]
-        results = await asyncio.gather(*tasks)
+        Parameters
+        ----------
+        search_plan : PlanType
+            Plan structure containing search items.
 
-        return [result for result in results if result is not None]
+        Yields
+        ------
+        ResultType
+            Completed search results, in the order they finish.
+        """
+        _, unique = self._dedupe(search_plan)
+        if self._batch_searches and len(unique) > 1:
+            for result in await self._batch_run_search(list(unique.values())):
+                if result is not None:
+                    yield result
+            return
+        semaphore = self._get_semaphore()
+        tasks = [
+            asyncio.ensure_future(_run_bounded(semaphore, self.run_search, item))
+            for item in unique.values()
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result is not None:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled searches unwind before the generator closes.
+            await asyncio.gather(*tasks, return_exceptions=True)
 
 
 class SearchWriter(AgentBase, Generic[ReportType]):
@@ -214,6 +514,8 @@ class SearchWriter(AgentBase, Generic[ReportType]):
     -------
     run_agent(query, search_results)
         Generate a report from search results.
+    run_agent_streamed(query, search_results)
+        Stream report generation from search results.
     _configure_agent()
         Return AgentConfig for this writer instance.
     """
@@ -222,6 +524,7 @@ class SearchWriter(AgentBase, Generic[ReportType]):
         self,
         prompt_dir: Optional[Path] = None,
         default_model: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
     ) -> None:
         """Initialize the writer agent.
 
@@ -231,12 +534,15 @@ class SearchWriter(AgentBase, Generic[ReportType]):
             Directory containing prompt templates.
         default_model : str, optional
             Default model identifier to use when not defined in config.
+        client : AsyncOpenAI, optional
+            Client shared with the other agents of the workflow.
         """
         config = self._configure_agent()
         super().__init__(
             config=config,
             prompt_dir=prompt_dir,
             default_model=default_model,
+            client=client,
         )
 
     @abstractmethod
@@ -278,10 +584,7 @@ class SearchWriter(AgentBase, Generic[ReportType]):
         ReportType
             Final report structure of the configured output type.
         """
-        template_context = {
-            "original_query": query,
-            "search_results": search_results,
-        }
+        template_context = self._build_template_context(query, search_results)
         result: ReportType = await self.run_async(
             input=query,
             context=template_context,
@@ -289,8 +592,63 @@ class SearchWriter(AgentBase, Generic[ReportType]):
         )
         return result
 
+    @staticmethod
+    def _build_template_context(
+        query: str, search_results: List[ResultType]
+    ) -> Dict[str, Any]:
+        """Return the writer context with results in a stable order.
+
+        Results are sorted by a content hash so the rendered prompt is
+        byte-identical whenever the same results come back in a different
+        order, letting provider-side prompt caching reuse the prefix.
+
+        Parameters
+        ----------
+        query : str
+            Original search query.
+        search_results : list[ResultType]
+            Results from the search execution phase.
+
+        Returns
+        -------
+        dict[str, Any]
+            Context with ``original_query`` and ordered ``search_results``.
+        """
+        return {
+            "original_query": query,
+            "search_results": sorted(search_results, key=_content_digest),
+        }
+
+    def run_agent_streamed(
+        self,
+        query: str,
+        search_results: List[ResultType],
+    ) -> RunResultStreaming:
+        """Stream report generation from search results.
+
+        Parameters
+        ----------
+        query : str
+            Original search query.
+        search_results : list[ResultType]
+            Results from the search execution phase.
+
+        Returns
+        -------
+        RunResultStreaming
+            Streaming run whose ``stream_events()`` yields writer output as
+            it is generated and whose ``final_output`` holds the report.
+        """
+        template_context = self._build_template_context(query, search_results)
+        return run_streamed(
+            agent=self.get_agent(),
+            input=query,
+            context=template_context,
+        )
+
 
 __all__ = [
+    "SearchPlanLike",
     "SearchPlanner",
     "SearchToolAgent",
     "SearchWriter",
@@ -0,0 +1,250 @@
+"""Persistent cache of search plans keyed by normalized query.
+
+Search workflows spend one LLM round-trip generating a plan for every query.
+``PlanCache`` stores generated plans in a small SQLite database so repeated
+(or, when an embedding function is supplied, near-duplicate) queries can skip
+the planner stage entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, Generic, Optional, Sequence, Type, TypeVar
+
+from pydantic import BaseModel
+
+from ...environment import get_data_path
+from ._sqlite_cache import SQLiteCache
+
+PlanT = TypeVar("PlanT", bound=BaseModel)
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+DEFAULT_SIMILARITY_THRESHOLD = 0.90
+_SIMILARITY_SCAN_LIMIT = 256
+_WHITESPACE = re.compile(r"\s+")
+
+_PLAN_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plan_cache (
+    fingerprint TEXT PRIMARY KEY,
+    embedding BLOB,
+    plan_json BLOB NOT NULL,
+    ts INTEGER NOT NULL
+)
+"""
+
+
+def normalize_query(query: str) -> str:
+    """Return ``query`` lowercased with whitespace collapsed.
+
+    Parameters
+    ----------
+    query : str
+        Raw user query.
+
+    Returns
+    -------
+    str
+        Normalized query used as the cache key.
+    """
+    return _WHITESPACE.sub(" ", query.strip().lower())
+
+
+def _cosine_similarity(left: Sequence[float], right: Sequence[float]) -> float:
+    """Return the cosine similarity between two vectors."""
+    dot = sum(a * b for a, b in zip(left, right))
+    norm = math.sqrt(sum(a * a for a in left)) * math.sqrt(sum(b * b for b in right))
+    return dot / norm if norm else 0.0
+
+
+class PlanCache(SQLiteCache, Generic[PlanT]):
+    """SQLite-backed cache of search plans.
+
+    Lookups first try an exact match on the SHA-256 fingerprint of the
+    normalized query. When ``embed`` is provided, a miss falls back to a
+    cosine-similarity scan over the most recently used entries. Entries
+    expire after ``ttl_seconds`` and the least recently used ones are evicted
+    once stored plans exceed ``max_bytes``.
+
+    Parameters
+    ----------
+    plan_type : type[BaseModel]
+        Structure used to deserialize cached plans.
+    path : Path or None, default=None
+        Database file. Defaults to ``plan_cache.sqlite3`` in the
+        ``search`` data directory.
+    ttl_seconds : int, default=DEFAULT_TTL_SECONDS
+        Maximum age of a cached plan.
+    max_bytes : int, default=DEFAULT_MAX_BYTES
+        Upper bound on the total size of stored plans.
+    embed : callable or None, default=None
+        Function returning an embedding vector for a normalized query.
+    similarity_threshold : float, default=DEFAULT_SIMILARITY_THRESHOLD
+        Minimum cosine similarity for a near-duplicate hit.
+
+    Methods
+    -------
+    get(query)
+        Return the cached plan for ``query`` if present.
+    put(query, plan)
+        Store ``plan`` for ``query``.
+    clear()
+        Remove every cached plan.
+    close()
+        Close the underlying database connection.
+
+    Examples
+    --------
+    >>> from openai_sdk_helpers.structure import WebSearchPlanStructure
+    >>> cache = PlanCache(WebSearchPlanStructure)
+    >>> cache.get("latest AI news") is None
+    True
+    """
+
+    _TABLE = "plan_cache"
+    _SCHEMA = _PLAN_SCHEMA
+
+    def __init__(
+        self,
+        plan_type: Type[PlanT],
+        path: Optional[Path] = None,
+        *,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> None:
+        """Open (and create if needed) the plan cache database."""
+        self._plan_type = plan_type
+        self._max_bytes = max_bytes
+        self._embed = embed
+        self._similarity_threshold = similarity_threshold
+        super().__init__(
+            path or get_data_path("search") / "plan_cache.sqlite3", ttl_seconds
+        )
+
+    def get(self, query: str) -> Optional[PlanT]:
+        """Return the cached plan for ``query`` if present.
+
+        Parameters
+        ----------
+        query : str
+            User query.
+
+        Returns
+        -------
+        BaseModel or None
+            Cached plan, or ``None`` on a miss.
+        """
+        normalized = normalize_query(query)
+        fingerprint = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        now = int(time.time())
+        cutoff = self._cutoff(now)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, plan_json FROM plan_cache "
+                "WHERE fingerprint = ? AND ts >= ?",
+                (fingerprint, cutoff),
+            ).fetchone()
+        if row is None and self._embed is not None:
+            # The embedding call may be slow or remote; keep it off the lock.
+            target = list(self._embed(normalized))
+            with self._lock:
+                row = self._find_similar(target, cutoff)
+        if row is None:
+            return None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE plan_cache SET ts = ? WHERE fingerprint = ?",
+                (now, row[0]),
+            )
+        return self._plan_type.model_validate_json(row[1])
+
+    def put(self, query: str, plan: PlanT) -> None:
+        """Store ``plan`` for ``query``.
+
+        Expired entries are purged at the same time.
+
+        Parameters
+        ----------
+        query : str
+            User query the plan was generated for.
+        plan : BaseModel
+            Plan returned by the planner agent.
+        """
+        normalized = normalize_query(query)
+        fingerprint = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        embedding = None
+        if self._embed is not None:
+            embedding = array("d", self._embed(normalized)).tobytes()
+        plan_json = plan.model_dump_json().encode("utf-8")
+        now = int(time.time())
+        with self._lock, self._conn:
+            self._purge_expired(now)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO plan_cache VALUES (?, ?, ?, ?)",
+                (fingerprint, embedding, plan_json, now),
+            )
+            self._evict()
+
+    def _find_similar(
+        self, target: Sequence[float], cutoff: int
+    ) -> Optional[tuple[str, bytes]]:
+        """Return the most similar recent entry above the threshold.
+
+        Parameters
+        ----------
+        target : Sequence[float]
+            Embedding of the normalized query.
+        cutoff : int
+            Oldest timestamp of an unexpired entry.
+
+        Returns
+        -------
+        tuple[str, bytes] or None
+            Fingerprint and plan JSON of the best match, if any.
+        """
+        best: Optional[tuple[str, bytes]] = None
+        best_score = self._similarity_threshold
+        rows = self._conn.execute(
+            "SELECT fingerprint, embedding, plan_json FROM plan_cache "
+            "WHERE embedding IS NOT NULL AND ts >= ? ORDER BY ts DESC LIMIT ?",
+            (cutoff, _SIMILARITY_SCAN_LIMIT),
+        )
+        for fingerprint, blob, plan_json in rows:
+            score = _cosine_similarity(target, array("d", blob))
+            if score >= best_score:
+                best, best_score = (fingerprint, plan_json), score
+        return best
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under ``max_bytes``."""
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(plan_json)), 0) FROM plan_cache"
+        ).fetchone()[0]
+        if total <= self._max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT fingerprint, LENGTH(plan_json) FROM plan_cache ORDER BY ts ASC"
+        ).fetchall()
+        for fingerprint, size in rows:
+            if total <= self._max_bytes:
+                break
+            self._conn.execute(
+                "DELETE FROM plan_cache WHERE fingerprint = ?", (fingerprint,)
+            )
+            total -= size
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_SIMILARITY_THRESHOLD",
+    "DEFAULT_TTL_SECONDS",
+    "PlanCache",
+    "normalize_query",
+]
@@ -0,0 +1,150 @@
+"""Persistent cache of individual search item results.
+
+Search plans often repeat sub-queries across sessions. ``ResultCache`` stores
+the structured result of each executed item in SQLite, keyed by the item's
+query and reason, so repeated items skip the tool and LLM round-trip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Generic, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from ...environment import get_data_path
+from ._sqlite_cache import SQLiteCache
+
+ResultT = TypeVar("ResultT", bound=BaseModel)
+
+DEFAULT_RESULT_TTL_SECONDS = 60 * 60
+
+_RESULT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS result_cache (
+    fingerprint TEXT PRIMARY KEY,
+    result_json BLOB NOT NULL,
+    ts INTEGER NOT NULL
+)
+"""
+
+
+def result_fingerprint(query: str, reason: str) -> str:
+    """Return the cache key for a search item.
+
+    Parameters
+    ----------
+    query : str
+        Search query text.
+    reason : str
+        Reason the search was planned.
+
+    Returns
+    -------
+    str
+        Hex-encoded SHA-256 of ``query`` and ``reason``.
+    """
+    return hashlib.sha256(f"{query}\0{reason}".encode("utf-8")).hexdigest()
+
+
+class ResultCache(SQLiteCache, Generic[ResultT]):
+    """SQLite-backed cache of search item results.
+
+    Parameters
+    ----------
+    result_type : type[BaseModel]
+        Structure used to deserialize cached results.
+    path : Path or None, default=None
+        Database file. Defaults to ``result_cache.sqlite3`` in the
+        ``search`` data directory.
+    ttl_seconds : int, default=DEFAULT_RESULT_TTL_SECONDS
+        Maximum age of a cached result.
+
+    Methods
+    -------
+    get(query, reason)
+        Return the cached result for a search item if present.
+    put(query, reason, result)
+        Store the result of a search item.
+    clear()
+        Remove every cached result.
+    close()
+        Close the underlying database connection.
+
+    Examples
+    --------
+    >>> from openai_sdk_helpers.structure import WebSearchItemResultStructure
+    >>> cache = ResultCache(WebSearchItemResultStructure)
+    >>> cache.get("ai news", "latest developments") is None
+    True
+    """
+
+    _TABLE = "result_cache"
+    _SCHEMA = _RESULT_SCHEMA
+
+    def __init__(
+        self,
+        result_type: Type[ResultT],
+        path: Optional[Path] = None,
+        *,
+        ttl_seconds: int = DEFAULT_RESULT_TTL_SECONDS,
+    ) -> None:
+        """Open (and create if needed) the result cache database."""
+        self._result_type = result_type
+        super().__init__(
+            path or get_data_path("search") / "result_cache.sqlite3", ttl_seconds
+        )
+
+    def get(self, query: str, reason: str) -> Optional[ResultT]:
+        """Return the cached result for a search item if present.
+
+        Parameters
+        ----------
+        query : str
+            Search query text.
+        reason : str
+            Reason the search was planned.
+
+        Returns
+        -------
+        BaseModel or None
+            Cached result, or ``None`` on a miss or when it has expired.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result_json FROM result_cache WHERE fingerprint = ? AND ts >= ?",
+                (result_fingerprint(query, reason), self._cutoff(int(time.time()))),
+            ).fetchone()
+        if row is None:
+            return None
+        return self._result_type.model_validate_json(row[0])
+
+    def put(self, query: str, reason: str, result: ResultT) -> None:
+        """Store the result of a search item.
+
+        Expired entries are purged at the same time.
+
+        Parameters
+        ----------
+        query : str
+            Search query text.
+        reason : str
+            Reason the search was planned.
+        result : BaseModel
+            Result produced for the item.
+        """
+        now = int(time.time())
+        with self._lock, self._conn:
+            self._purge_expired(now)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO result_cache VALUES (?, ?, ?)",
+                (
+                    result_fingerprint(query, reason),
+                    result.model_dump_json().encode("utf-8"),
+                    now,
+                ),
+            )
+
+
+__all__ = ["DEFAULT_RESULT_TTL_SECONDS", "ResultCache", "result_fingerprint"]
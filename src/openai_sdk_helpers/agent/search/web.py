@@ -2,27 +2,140 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    ContextManager,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
+
+from agents import custom_span, gen_trace_id, get_current_trace, trace
+from openai import AsyncOpenAI
+from pydantic import BaseModel
 
-from agents import custom_span, gen_trace_id, trace
-from agents.model_settings import ModelSettings
-from agents.tool import WebSearchTool
+from ..._clients import get_async_openai
+from ...context_manager import AsyncManagedResource
+from ...utils.core import log
 
 from ...structure.web_search import (
     WebSearchItemStructure,
     WebSearchItemResultStructure,
+    WebSearchItemResultsStructure,
     WebSearchStructure,
     WebSearchPlanStructure,
     WebSearchReportStructure,
 )
 from ..config import AgentConfig
+from ..runner import run_async
 from ..utils import run_coroutine_agent_sync
 from .base import SearchPlanner, SearchToolAgent, SearchWriter
+from .plan_cache import PlanCache
+from .result_cache import ResultCache
+
+if TYPE_CHECKING:  # pragma: no cover - only for typing hints
+    from agents import StreamEvent
 
 MAX_CONCURRENT_SEARCHES = 10
 
 
+def _has_custom_validators(model: type[BaseModel]) -> bool:
+    """Return whether ``model`` declares field or model validators.
+
+    Parameters
+    ----------
+    model : type[BaseModel]
+        Structure class to inspect.
+
+    Returns
+    -------
+    bool
+        True when ``model_construct`` would skip validation logic.
+    """
+    decorators = model.__pydantic_decorators__
+    return bool(decorators.field_validators or decorators.model_validators)
+
+
+# Inputs to these structures are already typed, so validation is skipped
+# unless a validator would change the outcome.
+_CONSTRUCT_ITEM_RESULT = not _has_custom_validators(WebSearchItemResultStructure)
+_CONSTRUCT_SEARCH = not _has_custom_validators(WebSearchStructure)
+
+
+@lru_cache(maxsize=256)
+def _search_context(query: str, reason: str) -> Mapping[str, Any]:
+    """Return the read-only template context for a single search.
+
+    Repeated search items share one context object instead of building a new
+    dictionary for every run.
+
+    Parameters
+    ----------
+    query : str
+        Search query text.
+    reason : str
+        Reason the search was planned.
+
+    Returns
+    -------
+    Mapping[str, Any]
+        Context exposing ``search_term`` and ``reason``.
+    """
+    return MappingProxyType({"search_term": query, "reason": reason})
+
+
+def _item_result_from_text(text: str) -> WebSearchItemResultStructure:
+    """Return a new search result wrapping ``text``.
+
+    Validation is skipped when the structure has no custom validators, so
+    building a result is cheap and each caller gets its own instance.
+
+    Parameters
+    ----------
+    text : str
+        Text returned by the search agent.
+
+    Returns
+    -------
+    WebSearchItemResultStructure
+        Result wrapping ``text``.
+    """
+    if _CONSTRUCT_ITEM_RESULT:
+        return WebSearchItemResultStructure.model_construct(text=text)
+    return WebSearchItemResultStructure(text=text)
+
+
+# Marks the end of the events queued by ``WebAgentSearch._stream_workflow``.
+_STREAM_END = object()
+
+
+def _workflow_trace() -> ContextManager[Any]:
+    """Return the trace for one workflow run.
+
+    When the caller already opened a trace, for example around a batch of
+    research queries, the run's spans are attached to it instead of
+    exporting a separate trace per query.
+
+    Returns
+    -------
+    ContextManager[Any]
+        New ``WebAgentSearch`` trace, or a no-op inside an open trace.
+    """
+    if get_current_trace() is not None:
+        return nullcontext()
+    return trace("WebAgentSearch trace", trace_id=gen_trace_id())
+
+
 class WebAgentPlanner(SearchPlanner[WebSearchPlanStructure]):
     """Plan web searches to satisfy a user query.
 
@@ -33,7 +146,10 @@ class WebAgentPlanner(SearchPlanner[WebSearchPlanStructure]):
     """
 
     def __init__(
-        self, prompt_dir: Optional[Path] = None, default_model: Optional[str] = None
+        self,
+        prompt_dir: Optional[Path] = None,
+        default_model: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
     ) -> None:
         """Initialize the planner agent.
 
@@ -43,8 +159,12 @@ class WebAgentPlanner(SearchPlanner[WebSearchPlanStructure]):
             Directory containing prompt templates.
         default_model : str or None, default=None
             Default model identifier to use when not defined in config.
+        client : AsyncOpenAI or None, default=None
+            Client shared with the other agents of the workflow.
         """
-        super().__init__(prompt_dir=prompt_dir, default_model=default_model)
+        super().__init__(
+            prompt_dir=prompt_dir, default_model=default_model, client=client
+        )
 
     def _configure_agent(self) -> AgentConfig:
         """Return configuration for the web planner agent.
@@ -77,7 +197,12 @@ class WebSearchToolAgent(
     """
 
     def __init__(
-        self, prompt_dir: Optional[Path] = None, default_model: Optional[str] = None
+        self,
+        prompt_dir: Optional[Path] = None,
+        default_model: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
+        batch_searches: bool = False,
+        result_cache: Optional[ResultCache[WebSearchItemResultStructure]] = None,
     ) -> None:
         """Initialize the search tool agent.
 
@@ -87,11 +212,22 @@ class WebSearchToolAgent(
             Directory containing prompt templates.
         default_model : str or None, default=None
             Default model identifier to use when not defined in config.
+        client : AsyncOpenAI or None, default=None
+            Client shared with the other agents of the workflow.
+        batch_searches : bool, default=False
+            Run every search of a plan in one agent call instead of one call
+            per item. Cheaper in tokens, but the searches no longer run in
+            parallel.
+        result_cache : ResultCache or None, default=None
+            Optional cache of item results keyed by query and reason.
         """
+        self._result_cache = result_cache
         super().__init__(
             prompt_dir=prompt_dir,
             default_model=default_model,
             max_concurrent_searches=MAX_CONCURRENT_SEARCHES,
+            client=client,
+            batch_searches=batch_searches,
         )
 
     def _configure_agent(self) -> AgentConfig:
@@ -102,6 +238,9 @@ class WebSearchToolAgent(
         AgentConfig
             Configuration with name, description, input type, and tools.
         """
+        from agents.model_settings import ModelSettings
+        from agents.tool import WebSearchTool
+
         return AgentConfig(
             name="web_search",
             description="Agent that performs web searches and summarizes results.",
@@ -111,7 +250,7 @@ class WebSearchToolAgent(
         )
 
     async def run_search(
-        self, item: WebSearchItemStructure
+        self, item: WebSearchItemStructure, cache: bool = True
     ) -> WebSearchItemResultStructure:
         """Perform a single web search using the search agent.
 
@@ -119,24 +258,120 @@ class WebSearchToolAgent(
         ----------
         item : WebSearchItemStructure
             Search item containing the query and reason.
+        cache : bool, default=True
+            Read from the result cache, when one is configured. Pass
+            ``False`` to force a fresh search; its result is still stored.
 
         Returns
         -------
         WebSearchItemResultStructure
             Search result summarizing the page.
         """
+        result_cache = self._result_cache
+        if cache and result_cache is not None:
+            cached = await asyncio.to_thread(result_cache.get, item.query, item.reason)
+            if cached is not None:
+                return cached
         with custom_span("Search the web"):
+            result = await self.run_async(
+                input=item.query,
+                context=_search_context(item.query, item.reason),
+                output_type=str,
+            )
+            item_result = self._coerce_item_result(result)
+        if result_cache is not None:
+            await asyncio.to_thread(
+                result_cache.put, item.query, item.reason, item_result
+            )
+        return item_result
+
+    async def _batch_run_search(
+        self, items: List[WebSearchItemStructure]
+    ) -> List[Optional[WebSearchItemResultStructure]]:
+        """Perform several web searches in a single agent run.
+
+        Items found in the result cache are answered from it and only the
+        misses are sent to the agent; their results are cached in turn.
+
+        Parameters
+        ----------
+        items : list[WebSearchItemStructure]
+            Search items containing the queries and reasons.
+
+        Returns
+        -------
+        list[WebSearchItemResultStructure or None]
+            One search result per item, in plan order.
+        """
+        result_cache = self._result_cache
+        if result_cache is None:
+            return await self._batch_search_uncached(items)
+
+        cached = await asyncio.to_thread(
+            lambda: [result_cache.get(item.query, item.reason) for item in items]
+        )
+        misses = [item for item, result in zip(items, cached) if result is None]
+        if not misses:
+            return list(cached)
+
+        fresh = await self._batch_search_uncached(misses)
+
+        def _store() -> None:
+            for item, result in zip(misses, fresh):
+                if result is not None:
+                    result_cache.put(item.query, item.reason, result)
+
+        await asyncio.to_thread(_store)
+        fresh_iter = iter(fresh)
+        return [result if result is not None else next(fresh_iter) for result in cached]
+
+    async def _batch_search_uncached(
+        self, items: List[WebSearchItemStructure]
+    ) -> List[Optional[WebSearchItemResultStructure]]:
+        """Run one agent call for items that are not cached.
+
+        When the agent returns a different number of results than items,
+        the results cannot be matched to their items and every item is
+        searched individually instead.
+
+        Parameters
+        ----------
+        items : list[WebSearchItemStructure]
+            Search items containing the queries and reasons.
+
+        Returns
+        -------
+        list[WebSearchItemResultStructure or None]
+            One search result per item, in the order of ``items``.
+        """
+        with custom_span("Search the web (batched)"):
             template_context: Dict[str, Any] = {
-                "search_term": item.query,
-                "reason": item.reason,
+                "search_term": "; ".join(item.query for item in items),
+                "reason": "; ".join(item.reason for item in items),
+                "searches": items,
             }
-
-            result = await super(SearchToolAgent, self).run_async(
-                input=item.query,
+            prompt = "\n".join(
+                f"{index}. {item.query} (reason: {item.reason})"
+                for index, item in enumerate(items, start=1)
+            )
+            agent = self.get_agent().clone(output_type=WebSearchItemResultsStructure)
+            result: WebSearchItemResultsStructure = await run_async(
+                agent=agent,
+                input=prompt,
                 context=template_context,
-                output_type=str,
+                output_type=WebSearchItemResultsStructure,
             )
-            return self._coerce_item_result(result)
+        item_results = result.item_results
+        if len(item_results) == len(items):
+            return list(item_results)
+        log(
+            "Batched search returned %d results for %d items; "
+            "searching items individually.",
+            len(item_results),
+            len(items),
+            level=logging.WARNING,
+        )
+        return await self._search_each(items)
 
     @staticmethod
     def _coerce_item_result(
@@ -156,10 +391,7 @@ class WebSearchToolAgent(
         """
         if isinstance(result, WebSearchItemResultStructure):
             return result
-        try:
-            return WebSearchItemResultStructure(text=str(result))
-        except Exception:
-            return WebSearchItemResultStructure(text="")
+        return _item_result_from_text(str(result))
 
 
 class WebAgentWriter(SearchWriter[WebSearchReportStructure]):
@@ -172,7 +404,10 @@ class WebAgentWriter(SearchWriter[WebSearchReportStructure]):
     """
 
     def __init__(
-        self, prompt_dir: Optional[Path] = None, default_model: Optional[str] = None
+        self,
+        prompt_dir: Optional[Path] = None,
+        default_model: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
     ) -> None:
         """Initialize the writer agent.
 
@@ -182,8 +417,12 @@ class WebAgentWriter(SearchWriter[WebSearchReportStructure]):
             Directory containing prompt templates.
         default_model : str or None, default=None
             Default model identifier to use when not defined in config.
+        client : AsyncOpenAI or None, default=None
+            Client shared with the other agents of the workflow.
         """
-        super().__init__(prompt_dir=prompt_dir, default_model=default_model)
+        super().__init__(
+            prompt_dir=prompt_dir, default_model=default_model, client=client
+        )
 
     def _configure_agent(self) -> AgentConfig:
         """Return configuration for the web writer agent.
@@ -200,25 +439,37 @@ class WebAgentWriter(SearchWriter[WebSearchReportStructure]):
         )
 
 
-class WebAgentSearch:
+class WebAgentSearch(AsyncManagedResource["WebAgentSearch"]):
     """Manage the complete web search workflow.
 
+    The planner, tool and writer agents are built on first use and reused by
+    later runs on the same client. Use the instance as an async context
+    manager, or call :meth:`close`, to release them.
+
     Methods
     -------
     run_agent_async(search_query)
         Execute the research workflow asynchronously.
+    run_agent_stream(search_query)
+        Execute the workflow and stream the writer's events.
     run_agent_sync(search_query)
         Execute the research workflow synchronously.
     run_web_agent_async(search_query)
         Convenience asynchronous entry point for the workflow.
     run_web_agent_sync(search_query)
         Convenience synchronous entry point for the workflow.
+    close()
+        Drop the cached planner, tool and writer agents.
     """
 
     def __init__(
         self,
         prompt_dir: Optional[Path] = None,
         default_model: Optional[str] = None,
+        plan_cache: Optional[PlanCache[WebSearchPlanStructure]] = None,
+        client: Optional[AsyncOpenAI] = None,
+        batch_searches: bool = False,
+        result_cache: Optional[ResultCache[WebSearchItemResultStructure]] = None,
     ) -> None:
         """Create the main web search agent.
 
@@ -228,13 +479,154 @@ class WebAgentSearch:
             Directory containing prompt templates.
         default_model : str or None, default=None
             Default model identifier to use when not defined in config.
+        plan_cache : PlanCache or None, default=None
+            Optional cache of search plans. On a hit the planner agent is
+            skipped; plans from successful runs are written back.
+        client : AsyncOpenAI or None, default=None
+            Client shared by the planner, tool and writer agents. Defaults to
+            the pooled client returned by ``get_async_openai``.
+        batch_searches : bool, default=False
+            Run all planned searches in one agent call; see
+            ``WebSearchToolAgent``.
+        result_cache : ResultCache or None, default=None
+            Optional cache of individual search results shared across runs.
         """
         self._prompt_dir = prompt_dir
         self._default_model = default_model
+        self._plan_cache = plan_cache
+        self._client = client
+        self._batch_searches = batch_searches
+        self._result_cache = result_cache
+        self._bound_client: Optional[AsyncOpenAI] = None
+        self._planner: Optional[WebAgentPlanner] = None
+        self._tool: Optional[WebSearchToolAgent] = None
+        self._writer: Optional[WebAgentWriter] = None
+
+    def _bind_client(self) -> AsyncOpenAI:
+        """Return the client for this run, dropping agents bound to another.
+
+        Returns
+        -------
+        AsyncOpenAI
+            Explicit client, or the shared client for the running loop.
+        """
+        client = self._client or get_async_openai()
+        if client is not self._bound_client:
+            self._planner = self._tool = self._writer = None
+            self._bound_client = client
+        return client
+
+    def _get_planner(self) -> WebAgentPlanner:
+        """Return the cached planner agent, creating it on first use.
+
+        Returns
+        -------
+        WebAgentPlanner
+            Planner bound to the current client.
+        """
+        if self._planner is None:
+            self._planner = WebAgentPlanner(
+                prompt_dir=self._prompt_dir,
+                default_model=self._default_model,
+                client=self._bound_client,
+            )
+        return self._planner
+
+    def _get_tool(self) -> WebSearchToolAgent:
+        """Return the cached search tool agent, creating it on first use.
+
+        Returns
+        -------
+        WebSearchToolAgent
+            Search tool agent bound to the current client.
+        """
+        if self._tool is None:
+            self._tool = WebSearchToolAgent(
+                prompt_dir=self._prompt_dir,
+                default_model=self._default_model,
+                client=self._bound_client,
+                batch_searches=self._batch_searches,
+                result_cache=self._result_cache,
+            )
+        return self._tool
+
+    def _get_writer(self) -> WebAgentWriter:
+        """Return the cached writer agent, creating it on first use.
+
+        Returns
+        -------
+        WebAgentWriter
+            Writer bound to the current client.
+        """
+        if self._writer is None:
+            self._writer = WebAgentWriter(
+                prompt_dir=self._prompt_dir,
+                default_model=self._default_model,
+                client=self._bound_client,
+            )
+        return self._writer
+
+    async def _get_agents(
+        self,
+    ) -> tuple[WebAgentPlanner, WebSearchToolAgent, WebAgentWriter]:
+        """Return the workflow agents, building missing ones concurrently.
+
+        Agent construction loads and compiles prompt templates, so missing
+        agents are built in worker threads alongside each other.
+
+        Returns
+        -------
+        tuple[WebAgentPlanner, WebSearchToolAgent, WebAgentWriter]
+            Planner, tool and writer agents bound to the current client.
+        """
+        if self._planner is None or self._tool is None or self._writer is None:
+            return await asyncio.gather(
+                asyncio.to_thread(self._get_planner),
+                asyncio.to_thread(self._get_tool),
+                asyncio.to_thread(self._get_writer),
+            )
+        return self._planner, self._tool, self._writer
+
+    async def close(self) -> None:
+        """Drop the cached planner, tool and writer agents."""
+        self._planner = self._tool = self._writer = None
+        self._bound_client = None
+
+    async def _plan_and_search(
+        self, search_query: str
+    ) -> tuple[WebSearchPlanStructure, List[WebSearchItemResultStructure], bool]:
+        """Plan searches for ``search_query`` and execute them.
+
+        Parameters
+        ----------
+        search_query : str
+            User's research query.
+
+        Returns
+        -------
+        tuple[WebSearchPlanStructure, list[WebSearchItemResultStructure], bool]
+            Search plan, search results, and whether the plan came from the
+            plan cache.
+        """
+        planner, tool, _ = await self._get_agents()
+        search_plan = None
+        if self._plan_cache is not None:
+            search_plan = await asyncio.to_thread(self._plan_cache.get, search_query)
+        plan_cached = search_plan is not None
+        if search_plan is None:
+            with custom_span("web_search.plan"):
+                search_plan = await planner.run_agent(query=search_query)
+        with custom_span("web_search.search"):
+            search_results = await tool.run_agent(search_plan=search_plan)
+        return search_plan, search_results, plan_cached
 
     async def run_agent_async(self, search_query: str) -> WebSearchStructure:
         """Execute the entire research workflow for ``search_query``.
 
+        Each run is exported as its own trace unless it is called inside an
+        open trace, in which case its spans join that trace. Wrap batches of
+        queries in a single ``trace(...)`` block to export them together.
+
         Parameters
         ----------
         search_query : str
@@ -245,27 +637,88 @@ class WebAgentSearch:
         WebSearchStructure
             Completed research output.
         """
-        trace_id = gen_trace_id()
-        with trace("WebAgentSearch trace", trace_id=trace_id):
-            planner = WebAgentPlanner(
-                prompt_dir=self._prompt_dir, default_model=self._default_model
+        self._bind_client()
+        with _workflow_trace():
+            search_plan, search_results, plan_cached = await self._plan_and_search(
+                search_query
             )
-            tool = WebSearchToolAgent(
-                prompt_dir=self._prompt_dir, default_model=self._default_model
-            )
-            writer = WebAgentWriter(
-                prompt_dir=self._prompt_dir, default_model=self._default_model
-            )
-            search_plan = await planner.run_agent(query=search_query)
-            search_results = await tool.run_agent(search_plan=search_plan)
-            search_report = await writer.run_agent(search_query, search_results)
-        return WebSearchStructure(
+            writer = self._get_writer()
+            with custom_span("web_search.write"):
+                search_report = await writer.run_agent(search_query, search_results)
+        if self._plan_cache is not None and not plan_cached:
+            await asyncio.to_thread(self._plan_cache.put, search_query, search_plan)
+        build = (
+            WebSearchStructure.model_construct
+            if _CONSTRUCT_SEARCH
+            else WebSearchStructure
+        )
+        return build(
             query=search_query,
             web_search_plan=search_plan,
             web_search_results=search_results,
             web_search_report=search_report,
         )
 
+    async def run_agent_stream(self, search_query: str) -> AsyncIterator[StreamEvent]:
+        """Execute the workflow and stream the writer's events.
+
+        Planning and searching run to completion first; the report is then
+        streamed so callers receive output as soon as the writer produces
+        its first tokens. Use :meth:`run_agent_async` when the structured
+        ``WebSearchStructure`` is needed.
+
+        Parameters
+        ----------
+        search_query : str
+            User's research query.
+
+        Yields
+        ------
+        StreamEvent
+            Events emitted by the writer agent run.
+        """
+        self._bind_client()
+        events: asyncio.Queue[Any] = asyncio.Queue()
+        # The trace is entered and exited inside the producer task. Holding
+        # it across this generator's yields would reset its context variable
+        # from whatever context the consumer resumes or closes us in.
+        producer = asyncio.ensure_future(self._stream_workflow(search_query, events))
+        try:
+            while (event := await events.get()) is not _STREAM_END:
+                yield event
+            await producer
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    async def _stream_workflow(
+        self, search_query: str, events: asyncio.Queue[Any]
+    ) -> None:
+        """Run the workflow for ``search_query``, queueing the writer's events.
+
+        Parameters
+        ----------
+        search_query : str
+            User's research query.
+        events : asyncio.Queue[Any]
+            Queue receiving the writer's stream events, followed by
+            ``_STREAM_END`` once the workflow finishes or fails.
+        """
+        try:
+            with _workflow_trace():
+                search_plan, search_results, plan_cached = await self._plan_and_search(
+                    search_query
+                )
+                result = self._get_writer().run_agent_streamed(
+                    search_query, search_results
+                )
+                async for event in result.stream_events():
+                    events.put_nowait(event)
+            if self._plan_cache is not None and not plan_cached:
+                await asyncio.to_thread(self._plan_cache.put, search_query, search_plan)
+        finally:
+            events.put_nowait(_STREAM_END)
+
     def run_agent_sync(self, search_query: str) -> WebSearchStructure:
         """Run :meth:`run_agent_async` synchronously for ``search_query``.
 
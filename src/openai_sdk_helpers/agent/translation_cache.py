@@ -0,0 +1,194 @@
+"""Exact-match cache of translated texts.
+
+Repeated translations of the same text into the same language with the same
+model return the same answer in practice. ``TranslationCache`` keeps recent
+translations in memory and, optionally, in SQLite so they survive restarts,
+letting ``TranslatorAgent`` skip the LLM round-trip on a hit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from ..environment import get_data_path
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translation_cache (
+    fingerprint TEXT PRIMARY KEY,
+    translation TEXT NOT NULL
+)
+"""
+
+
+def translation_fingerprint(text: str, target_language: str, model: str) -> str:
+    """Return the cache key for a translation.
+
+    Parameters
+    ----------
+    text : str
+        Source content.
+    target_language : str
+        Language the content is translated into.
+    model : str
+        Model producing the translation.
+
+    Returns
+    -------
+    str
+        Hex-encoded BLAKE2b digest of the three values.
+    """
+    return hashlib.blake2b(
+        f"{model}\0{target_language}\0{text}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+class TranslationCache:
+    """In-memory LRU cache of translations with an optional SQLite tier.
+
+    Parameters
+    ----------
+    max_entries : int, default=DEFAULT_MAX_ENTRIES
+        Number of translations kept in memory.
+    persistent : bool, default=False
+        Also store translations in SQLite so they outlive the process.
+    path : Path or None, default=None
+        Database file used when ``persistent`` is set. Defaults to
+        ``translation_cache.sqlite3`` in the ``translator`` data directory.
+
+    Methods
+    -------
+    get(text, target_language, model)
+        Return the cached translation if present.
+    put(text, target_language, model, translation)
+        Store a translation.
+    clear()
+        Remove every cached translation.
+    close()
+        Close the underlying database connection, if any.
+
+    Examples
+    --------
+    >>> cache = TranslationCache()
+    >>> cache.put("Hello", "French", "gpt-4o-mini", "Bonjour")
+    >>> cache.get("Hello", "French", "gpt-4o-mini")
+    'Bonjour'
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        *,
+        persistent: bool = False,
+        path: Optional[Path] = None,
+    ) -> None:
+        """Create the cache, opening the database when persistent."""
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if persistent:
+            db_path = path or get_data_path("translator") / "translation_cache.sqlite3"
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            with self._conn:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(_SCHEMA)
+
+    def get(self, text: str, target_language: str, model: str) -> Optional[str]:
+        """Return the cached translation if present.
+
+        Parameters
+        ----------
+        text : str
+            Source content.
+        target_language : str
+            Language the content is translated into.
+        model : str
+            Model producing the translation.
+
+        Returns
+        -------
+        str or None
+            Cached translation, or ``None`` on a miss.
+        """
+        key = translation_fingerprint(text, target_language, model)
+        with self._lock:
+            translation = self._entries.get(key)
+            if translation is not None:
+                self._entries.move_to_end(key)
+                return translation
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT translation FROM translation_cache WHERE fingerprint = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._remember(key, row[0])
+            return row[0]
+
+    def put(
+        self, text: str, target_language: str, model: str, translation: str
+    ) -> None:
+        """Store a translation.
+
+        Parameters
+        ----------
+        text : str
+            Source content.
+        target_language : str
+            Language the content is translated into.
+        model : str
+            Model producing the translation.
+        translation : str
+            Translated text.
+        """
+        key = translation_fingerprint(text, target_language, model)
+        with self._lock:
+            self._remember(key, translation)
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO translation_cache VALUES (?, ?)",
+                        (key, translation),
+                    )
+
+    def _remember(self, key: str, translation: str) -> None:
+        """Store ``translation`` in memory, evicting the oldest entry if full.
+
+        Parameters
+        ----------
+        key : str
+            Translation fingerprint.
+        translation : str
+            Translated text.
+        """
+        self._entries[key] = translation
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every cached translation."""
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM translation_cache")
+
+    def close(self) -> None:
+        """Close the underlying database connection, if any."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+__all__ = ["DEFAULT_MAX_ENTRIES", "TranslationCache", "translation_fingerprint"]
@@ -2,12 +2,79 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence
 
+from ..structure.translation import TranslationBatchStructure
 from .base import AgentBase
 from .config import AgentConfig
 from .prompt_utils import DEFAULT_PROMPT_DIR
+from .runner import run_async
+from .translation_cache import TranslationCache
+from .utils import run_coroutine_agent_sync
+
+MAX_CONCURRENT_TRANSLATIONS = 10
+
+_BASE_CONTEXT: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "translator_base_context", default=None
+)
+
+
+@contextmanager
+def translation_context(context: Dict[str, Any]) -> Iterator[None]:
+    """Apply ``context`` to every translation made within the block.
+
+    Values shared by many translations, such as a glossary or formality
+    level, are set once for the current thread or task instead of being
+    passed with each call. Per-call context takes precedence over them.
+
+    Parameters
+    ----------
+    context : dict
+        Template context values applied to translations in the block.
+
+    Yields
+    ------
+    None
+        Control returns to the caller with the context applied.
+
+    Examples
+    --------
+    >>> translator = TranslatorAgent(default_model="gpt-4o-mini")
+    >>> with translation_context({"formality": "formal"}):
+    ...     translator.run_sync("Hello", target_language="German")  # doctest: +SKIP
+    """
+    token = _BASE_CONTEXT.set(context)
+    try:
+        yield
+    finally:
+        _BASE_CONTEXT.reset(token)
+
+
+def _template_context(
+    target_language: str, context: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Return the template context for a translation.
+
+    Parameters
+    ----------
+    target_language : str
+        Language to translate the content into.
+    context : dict or None
+        Per-call context values, overriding the active base context.
+
+    Returns
+    -------
+    dict
+        Context with ``target_language`` and any base and per-call values.
+    """
+    base = _BASE_CONTEXT.get()
+    if base is None:
+        return {"target_language": target_language, **(context or {})}
+    return {"target_language": target_language, **base, **(context or {})}
 
 
 class TranslatorAgent(AgentBase):
@@ -45,6 +112,12 @@ class TranslatorAgent(AgentBase):
         Translate the supplied text into the target language.
     run_sync(text, target_language, context)
         Translate the supplied text synchronously.
+    run_agent_many(texts, target_language, context, max_concurrency)
+        Translate several texts concurrently.
+    run_many_sync(texts, target_language, context, max_concurrency)
+        Translate several texts concurrently from synchronous code.
+    run_agent_batch(texts, target_language, context)
+        Translate several texts in a single agent run.
     """
 
     def __init__(
@@ -52,6 +125,7 @@ class TranslatorAgent(AgentBase):
         *,
         prompt_dir: Optional[Path] = None,
         default_model: Optional[str] = None,
+        cache: Optional[TranslationCache] = None,
     ) -> None:
         """Initialize the translation agent configuration.
 
@@ -62,7 +136,12 @@ class TranslatorAgent(AgentBase):
             packaged ``prompt`` directory when not provided.
         default_model : str or None, default=None
             Fallback model identifier when not specified elsewhere.
+        cache : TranslationCache or None, default=None
+            Optional cache of translations. Requests without extra context
+            are answered from it when the same text was already translated
+            into the same language by the same model.
         """
+        self._cache = cache
         config = AgentConfig(
             name="translator",
             description="Translate text into the requested language.",
@@ -95,21 +174,143 @@ class TranslatorAgent(AgentBase):
         str
             Translated text returned by the agent.
         """
-        template_context: Dict[str, Any] = {"target_language": target_language}
-        if context:
-            template_context.update(context)
+        cache = self._cache
+        if context or _BASE_CONTEXT.get() is not None:
+            cache = None
+        if cache is not None:
+            cached = cache.get(text, target_language, self.model)
+            if cached is not None:
+                return cached
+        template_context = _template_context(target_language, context)
 
         result: str = await self.run_async(
             input=text,
             context=template_context,
             output_type=str,
         )
+        if cache is not None:
+            cache.put(text, target_language, self.model, result)
         return result
 
+    async def run_agent_many(
+        self,
+        texts: Sequence[str],
+        target_language: str,
+        context: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = MAX_CONCURRENT_TRANSLATIONS,
+    ) -> List[str]:
+        """Translate each of ``texts`` to ``target_language`` concurrently.
+
+        All translations share one agent and the agent's client, so they
+        are multiplexed over the same connection pool instead of being sent
+        one after another.
+
+        Parameters
+        ----------
+        texts : Sequence[str]
+            Source contents to translate.
+        target_language : str
+            Language to translate the contents into.
+        context : dict or None, default=None
+            Additional context values to merge into the prompt.
+        max_concurrency : int, default=MAX_CONCURRENT_TRANSLATIONS
+            Maximum number of translations in flight at once.
+
+        Returns
+        -------
+        list[str]
+            Translated texts, in the order of ``texts``.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _translate(text: str) -> str:
+            """Translate one text within the concurrency limit."""
+            async with semaphore:
+                return await self.run_agent(text, target_language, context)
+
+        return list(await asyncio.gather(*(_translate(text) for text in texts)))
+
+    async def run_agent_batch(
+        self,
+        texts: Sequence[str],
+        target_language: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> List[str]:
+        """Translate ``texts`` to ``target_language`` in a single agent run.
+
+        Cheaper in requests and tokens than :meth:`run_agent_many`, at the
+        cost of one longer response. When the model does not return one
+        translation per text, the texts are translated individually instead.
+
+        Parameters
+        ----------
+        texts : Sequence[str]
+            Source contents to translate.
+        target_language : str
+            Language to translate the contents into.
+        context : dict or None, default=None
+            Additional context values to merge into the prompt.
+
+        Returns
+        -------
+        list[str]
+            Translated texts, in the order of ``texts``.
+        """
+        if len(texts) == 1:
+            return [await self.run_agent(texts[0], target_language, context)]
+        template_context = _template_context(target_language, context)
+        prompt = "\n".join(
+            f"{index}. {text}" for index, text in enumerate(texts, start=1)
+        )
+        agent = self.get_agent().clone(output_type=TranslationBatchStructure)
+        result: TranslationBatchStructure = await run_async(
+            agent=agent,
+            input=prompt,
+            context=template_context,
+            output_type=TranslationBatchStructure,
+        )
+        if len(result.translations) != len(texts):
+            return await self.run_agent_many(texts, target_language, context)
+        return result.translations
+
+    def run_many_sync(
+        self,
+        texts: Sequence[str],
+        target_language: str,
+        context: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = MAX_CONCURRENT_TRANSLATIONS,
+    ) -> List[str]:
+        """Run :meth:`run_agent_many` synchronously.
+
+        Parameters
+        ----------
+        texts : Sequence[str]
+            Source contents to translate.
+        target_language : str
+            Language to translate the contents into.
+        context : dict or None, default=None
+            Additional context values to merge into the prompt.
+        max_concurrency : int, default=MAX_CONCURRENT_TRANSLATIONS
+            Maximum number of translations in flight at once.
+
+        Returns
+        -------
+        list[str]
+            Translated texts, in the order of ``texts``.
+        """
+        return run_coroutine_agent_sync(
+            self.run_agent_many(
+                texts,
+                target_language,
+                context=context,
+                max_concurrency=max_concurrency,
+            )
+        )
+
     def run_sync(
         self,
         input: str,
-        context: Optional[Dict[str, Any]] = None,
+        context: Optional[Mapping[str, Any]] = None,
         output_type: Optional[Any] = None,
         *,
         target_language: Optional[str] = None,
@@ -121,8 +322,9 @@ class TranslatorAgent(AgentBase):
         ----------
         input : str
             Source content to translate.
-        context : dict or None, default=None
-            Additional context values to merge into the prompt.
+        context : Mapping[str, Any] or None, default=None
+            Additional context values to merge into the prompt, on top of
+            any active :func:`translation_context`.
         output_type : type or None, default=None
             Optional output type cast for the response.
         target_language : str or None, optional
@@ -142,16 +344,14 @@ class TranslatorAgent(AgentBase):
         ValueError
             If ``target_language`` is not provided.
         """
-        merged_context: Dict[str, Any] = {}
-
-        if context:
-            merged_context.update(context)
-        if "context" in kwargs and kwargs["context"]:
-            merged_context.update(kwargs["context"])
+        merged_context = {
+            **(_BASE_CONTEXT.get() or {}),
+            **(context or {}),
+            **(kwargs.get("context") or {}),
+        }
         if target_language:
             merged_context["target_language"] = target_language
-
-        if "target_language" not in merged_context:
+        elif "target_language" not in merged_context:
             msg = "target_language is required for translation"
             raise ValueError(msg)
 
@@ -163,4 +363,4 @@ class TranslatorAgent(AgentBase):
         return result
 
 
-__all__ = ["TranslatorAgent"]
+__all__ = ["MAX_CONCURRENT_TRANSLATIONS", "TranslatorAgent", "translation_context"]
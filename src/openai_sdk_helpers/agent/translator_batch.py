@@ -0,0 +1,153 @@
+"""Coalesce concurrent translation requests into batched agent runs."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from .translator import TranslatorAgent
+
+DEFAULT_BATCH_WINDOW = 0.01
+DEFAULT_MAX_BATCH_SIZE = 20
+
+_Pending = List[Tuple[str, "asyncio.Future[str]"]]
+
+
+class BatchTranslator:
+    """Buffer translation requests and send them as batched agent runs.
+
+    Requests arriving within ``window`` seconds of each other for the same
+    target language are translated together through
+    :meth:`TranslatorAgent.run_agent_batch`, turning a burst of single-text
+    calls into a few larger ones. A bucket is sent early once it holds
+    ``max_batch_size`` texts.
+
+    Methods
+    -------
+    translate(text, target_language)
+        Translate ``text``, sharing an agent run with concurrent requests.
+    flush()
+        Send every buffered request immediately.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> async def main():
+    ...     batcher = BatchTranslator(TranslatorAgent(default_model="gpt-4o-mini"))
+    ...     return await asyncio.gather(
+    ...         batcher.translate("Hello", "French"),
+    ...         batcher.translate("Goodbye", "French"),
+    ...     )
+    >>> asyncio.run(main())  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        translator: Optional[TranslatorAgent] = None,
+        *,
+        window: float = DEFAULT_BATCH_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        """Initialize the batching translator.
+
+        Parameters
+        ----------
+        translator : TranslatorAgent or None, default=None
+            Agent performing the translations. A default ``TranslatorAgent``
+            is created when omitted.
+        window : float, default=DEFAULT_BATCH_WINDOW
+            Seconds to wait for more requests before sending a batch.
+        max_batch_size : int, default=DEFAULT_MAX_BATCH_SIZE
+            Number of buffered texts that triggers an immediate send.
+        """
+        self._translator = translator or TranslatorAgent()
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._pending: Dict[str, _Pending] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def translate(self, text: str, target_language: str) -> str:
+        """Translate ``text``, sharing an agent run with concurrent requests.
+
+        Parameters
+        ----------
+        text : str
+            Source content to translate.
+        target_language : str
+            Language to translate the content into.
+
+        Returns
+        -------
+        str
+            Translated text.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+        bucket = self._pending.setdefault(target_language, [])
+        bucket.append((text, future))
+        if len(bucket) >= self._max_batch_size:
+            self._send(target_language)
+        elif target_language not in self._timers:
+            self._timers[target_language] = loop.call_later(
+                self._window, self._send, target_language
+            )
+        return await future
+
+    def flush(self) -> None:
+        """Send every buffered request immediately."""
+        for target_language in list(self._pending):
+            self._send(target_language)
+
+    def _send(self, target_language: str) -> None:
+        """Start a batched agent run for the buffered ``target_language`` texts.
+
+        Parameters
+        ----------
+        target_language : str
+            Bucket to send.
+        """
+        timer = self._timers.pop(target_language, None)
+        if timer is not None:
+            timer.cancel()
+        pending = self._pending.pop(target_language, None)
+        if not pending:
+            return
+        task = asyncio.get_running_loop().create_task(
+            self._dispatch(target_language, pending)
+        )
+        # Keep a reference so the task is not garbage collected mid-flight.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, target_language: str, pending: _Pending) -> None:
+        """Translate ``pending`` in one run and resolve their futures.
+
+        Parameters
+        ----------
+        target_language : str
+            Language to translate the texts into.
+        pending : list[tuple[str, asyncio.Future[str]]]
+            Buffered texts with the futures awaiting their translations.
+        """
+        texts = [text for text, _ in pending]
+        try:
+            translations = await self._translator.run_agent_batch(
+                texts, target_language
+            )
+            for (_, future), translation in zip(pending, translations):
+                if not future.done():
+                    future.set_result(translation)
+        except Exception as exc:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+        finally:
+            # Cancellation skips both branches above; never leave a caller
+            # awaiting a future that nothing will resolve.
+            for _, future in pending:
+                if not future.done():
+                    future.cancel()
+
+
+__all__ = ["BatchTranslator", "DEFAULT_BATCH_WINDOW", "DEFAULT_MAX_BATCH_SIZE"]
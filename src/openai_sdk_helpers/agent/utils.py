@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 import asyncio
-import threading
 from typing import Any, Coroutine, TypeVar
 
+from ..async_utils import run_coroutine_in_background, run_coroutine_in_thread_runner
+
 T = TypeVar("T")
 
 
 def run_coroutine_agent_sync(coro: Coroutine[Any, Any, T]) -> T:
     """Run a coroutine from synchronous code.
 
+    Without a running event loop the coroutine runs on the calling thread's
+    persistent loop, so repeated calls reuse one loop. Inside a running loop
+    it is handed to the shared background loop instead of a new thread.
+
     Parameters
     ----------
     coro : Coroutine[Any, Any, T]
@@ -25,18 +30,10 @@ def run_coroutine_agent_sync(coro: Coroutine[Any, Any, T]) -> T:
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
-        return asyncio.run(coro)
+        return run_coroutine_in_thread_runner(coro)
 
     if loop.is_running():
-        result: T | None = None
-
-        def _thread_runner() -> None:
-            nonlocal result
-            result = asyncio.run(coro)
-
-        thread = threading.Thread(target=_thread_runner, daemon=True)
-        thread.start()
-        thread.join()
+        result = run_coroutine_in_background(coro, timeout=None)
         if result is None:
             raise RuntimeError("Coroutine execution did not return a result.")
         return result
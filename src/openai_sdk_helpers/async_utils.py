@@ -5,6 +5,9 @@ with proper exception propagation and timeout handling.
 """
 
 import asyncio
+import atexit
+import concurrent.futures
+import contextvars
 import queue
 import threading
 from typing import Any, Coroutine, Generic, TypeVar
@@ -18,10 +21,71 @@ T = TypeVar("T")
 DEFAULT_COROUTINE_TIMEOUT = 300.0  # 5 minutes
 THREAD_JOIN_TIMEOUT = 5.0  # 5 seconds
 
+_MAIN_RUNNER: Any = None
+
+
+def run_coroutine_in_thread_runner(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine, reusing the main thread's event loop.
+
+    Must be called from a thread without a running event loop. On Python
+    3.11+ the main thread keeps one :class:`asyncio.Runner` whose loop is
+    reused by later calls, instead of creating and closing a loop per call
+    as :func:`asyncio.run` does. Other threads, which may be short-lived
+    pool or request threads, use :func:`asyncio.run` so their loops are
+    closed when the call returns. Each call runs in a copy of the caller's
+    current context, so context variables set between calls are visible.
+    Tasks left running by one call on the main thread are not cancelled
+    before the next. On Python 3.10 this always falls back to
+    :func:`asyncio.run`.
+
+    Parameters
+    ----------
+    coro : Coroutine
+        The coroutine to execute.
+
+    Returns
+    -------
+    Any
+        Result from the coroutine.
+
+    Examples
+    --------
+    >>> async def fetch_data():
+    ...     return "data"
+    >>> run_coroutine_in_thread_runner(fetch_data())
+    'data'
+    """
+    global _MAIN_RUNNER
+    runner_cls = getattr(asyncio, "Runner", None)
+    if runner_cls is None or threading.current_thread() is not threading.main_thread():
+        return asyncio.run(coro)
+    if _MAIN_RUNNER is None:
+        _MAIN_RUNNER = runner_cls()
+    return _MAIN_RUNNER.run(coro, context=contextvars.copy_context())
+
+
+def shutdown_sync_runner() -> None:
+    """Close the persistent loop created by ``run_coroutine_in_thread_runner``.
+
+    Registered with :mod:`atexit`; safe to call more than once. Later calls
+    to ``run_coroutine_in_thread_runner`` create a fresh loop.
+    """
+    global _MAIN_RUNNER
+    runner, _MAIN_RUNNER = _MAIN_RUNNER, None
+    if runner is None:
+        return
+    try:
+        runner.close()
+    except RuntimeError as exc:
+        log(f"Could not close sync runner: {exc}", level=30)  # logging.WARNING
+
+
+atexit.register(shutdown_sync_runner)
+
 
 def run_coroutine_thread_safe(
     coro: Coroutine[Any, Any, T],
-    timeout: float = DEFAULT_COROUTINE_TIMEOUT,
+    timeout: float | None = DEFAULT_COROUTINE_TIMEOUT,
 ) -> T:
     """Run a coroutine in a thread-safe manner from a sync context.
 
@@ -32,9 +96,9 @@ def run_coroutine_thread_safe(
     ----------
     coro : Coroutine
         The coroutine to execute.
-    timeout : float
+    timeout : float or None
         Maximum time in seconds to wait for the coroutine to complete.
-        Default is 300 (5 minutes).
+        Default is 300 (5 minutes); None waits indefinitely.
 
     Returns
     -------
@@ -121,8 +185,8 @@ def run_coroutine_with_fallback(
         # Try to get currently running loop
         loop = asyncio.get_running_loop()
     except RuntimeError:
-        # No running loop, safe to use asyncio.run()
-        return asyncio.run(coro)
+        # No running loop, safe to run on this thread's persistent loop
+        return run_coroutine_in_thread_runner(coro)
 
     # Loop is already running, must use thread
     if loop.is_running():
@@ -130,3 +194,110 @@ def run_coroutine_with_fallback(
 
     # This shouldn't happen but handle defensive
     return loop.run_until_complete(coro)
+
+
+class _BackgroundEventLoop:
+    """Persistent event loop running on a dedicated daemon thread.
+
+    The loop and its thread are created lazily on first use and reused for
+    every subsequent submission, so synchronous callers avoid paying for a
+    fresh thread and event loop on each call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the holder without starting the loop."""
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background loop, starting it if necessary.
+
+        Returns
+        -------
+        asyncio.AbstractEventLoop
+            Running event loop owned by the background thread.
+        """
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            return loop
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run_forever,
+                    args=(loop,),
+                    name="openai-sdk-helpers-loop",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    def owns_current_thread(self) -> bool:
+        """Return whether the caller is running on the background thread.
+
+        Returns
+        -------
+        bool
+            True when called from inside the background loop.
+        """
+        return self._thread is threading.current_thread()
+
+    @staticmethod
+    def _run_forever(loop: asyncio.AbstractEventLoop) -> None:
+        """Run ``loop`` until the interpreter exits."""
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+
+_BACKGROUND_LOOP = _BackgroundEventLoop()
+
+
+def run_coroutine_in_background(
+    coro: Coroutine[Any, Any, T],
+    timeout: float | None = DEFAULT_COROUTINE_TIMEOUT,
+) -> T:
+    """Run a coroutine on the shared background event loop.
+
+    Submits the coroutine to a persistent loop hosted on a daemon thread and
+    blocks until it completes. When called from the background loop itself,
+    falls back to :func:`run_coroutine_thread_safe` to avoid deadlocking.
+
+    Parameters
+    ----------
+    coro : Coroutine
+        The coroutine to execute.
+    timeout : float or None, default DEFAULT_COROUTINE_TIMEOUT
+        Maximum time in seconds to wait for the coroutine to complete. Pass
+        None to wait indefinitely.
+
+    Returns
+    -------
+    Any
+        Result from the coroutine.
+
+    Raises
+    ------
+    AsyncExecutionError
+        If the timeout elapses before the coroutine completes.
+
+    Examples
+    --------
+    >>> async def fetch_data():
+    ...     return "data"
+    >>> result = run_coroutine_in_background(fetch_data())
+    """
+    if _BACKGROUND_LOOP.owns_current_thread():
+        return run_coroutine_thread_safe(coro, timeout=timeout)
+
+    future = asyncio.run_coroutine_threadsafe(coro, _BACKGROUND_LOOP.loop)
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise AsyncExecutionError(
+            f"Coroutine execution timed out after {timeout} seconds"
+        ) from None
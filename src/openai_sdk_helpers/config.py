@@ -12,9 +12,10 @@ from pathlib import Path
 from typing import Any
 
 from dotenv import dotenv_values
-from openai import OpenAI
+from openai import DefaultHttpxClient, OpenAI
 from pydantic import BaseModel, ConfigDict, Field
 
+from openai_sdk_helpers._clients import _get_ssl_context, _pool_limits
 from openai_sdk_helpers.utils import (
     coerce_dict,
     coerce_optional_float,
@@ -105,6 +106,15 @@ class OpenAISettings(BaseModel):
             " Defaults to OPENAI_MAX_RETRIES."
         ),
     )
+    pool_kwargs: dict[str, Any] = Field(
+        default_factory=dict,
+        description=(
+            "Connection limit arguments overriding the pool defaults, such as"
+            " max_connections, max_keepalive_connections or"
+            " keepalive_expiry. Ignored when http_client is supplied through"
+            " extra_client_kwargs."
+        ),
+    )
     extra_client_kwargs: dict[str, Any] = Field(
         default_factory=dict,
         description=(
@@ -176,6 +186,7 @@ class OpenAISettings(BaseModel):
             or os.getenv("OPENAI_MODEL"),
             "timeout": coerce_optional_float(timeout_raw),
             "max_retries": coerce_optional_int(max_retries_raw),
+            "pool_kwargs": coerce_dict(overrides.get("pool_kwargs")),
             "extra_client_kwargs": coerce_dict(overrides.get("extra_client_kwargs")),
         }
 
@@ -224,14 +235,23 @@ class OpenAISettings(BaseModel):
         """Instantiate an OpenAI client using the stored configuration.
 
         Uses client_kwargs() to build the client with all configured
-        authentication and routing parameters.
+        authentication and routing parameters. Unless ``http_client`` is
+        supplied through ``extra_client_kwargs``, the HTTP transport reuses
+        the process-wide SSL context instead of loading CA certificates for
+        every client, and its connection pool is sized by
+        ``DEFAULT_POOL_LIMITS`` updated with ``pool_kwargs``.
 
         Returns
         -------
         OpenAI
             Client initialized with the configured settings.
         """
-        return OpenAI(**self.client_kwargs())
+        kwargs = self.client_kwargs()
+        if "http_client" not in kwargs:
+            kwargs["http_client"] = DefaultHttpxClient(
+                verify=_get_ssl_context(), limits=_pool_limits(self.pool_kwargs)
+            )
+        return OpenAI(**kwargs)
 
 
 __all__ = ["OpenAISettings"]
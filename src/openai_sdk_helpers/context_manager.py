@@ -7,24 +7,73 @@ with guaranteed cleanup on exit or exception.
 from __future__ import annotations
 
 import asyncio
+import weakref
 from contextlib import asynccontextmanager
 from types import TracebackType
-from typing import Any, AsyncIterator, Generic, Optional, TypeVar
-
-from openai_sdk_helpers.utils.core import log
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Optional,
+    TypeGuard,
+    TypeVar,
+)
+
+from openai_sdk_helpers.logging_config import LoggerFactory
 
 T = TypeVar("T")
 
+_IS_COROUTINE_CLOSE: "weakref.WeakKeyDictionary[Callable[..., Any], bool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _is_coroutine_close(
+    close_method: Callable[..., Any],
+) -> TypeGuard[Callable[..., Awaitable[Any]]]:
+    """Return whether ``close_method`` is a coroutine function.
+
+    Results are cached per underlying function, so closing many instances
+    of the same class inspects ``close`` once.
+
+    Parameters
+    ----------
+    close_method : Callable[..., Any]
+        Bound or plain ``close`` callable.
+
+    Returns
+    -------
+    TypeGuard[Callable[..., Awaitable[Any]]]
+        True when calling ``close_method`` returns a coroutine.
+    """
+    func = getattr(close_method, "__func__", close_method)
+    try:
+        is_coro = _IS_COROUTINE_CLOSE.get(func)
+    except TypeError:
+        # Callables that cannot be weakly referenced are not cached.
+        return asyncio.iscoroutinefunction(close_method)
+    if is_coro is None:
+        is_coro = asyncio.iscoroutinefunction(close_method)
+        _IS_COROUTINE_CLOSE[func] = is_coro
+    return is_coro
+
 
 class ManagedResource(Generic[T]):
     """Base class for resources that need cleanup.
 
     Provides context manager support for guaranteed resource cleanup
-    even when exceptions occur.
+    even when exceptions occur. The base class declares empty
+    ``__slots__``; subclasses that declare their own ``__slots__`` get
+    instances without a per-instance ``__dict__``.
 
     Examples
     --------
     >>> class DatabaseConnection(ManagedResource[Connection]):
+    ...     __slots__ = ("connection",)
+    ...
     ...     def __init__(self, connection):
     ...         self.connection = connection
     ...
@@ -36,6 +85,8 @@ class ManagedResource(Generic[T]):
     ...     db.query("SELECT ...")
     """
 
+    __slots__ = ()
+
     def __enter__(self) -> T:
         """Enter context manager.
 
@@ -71,7 +122,7 @@ class ManagedResource(Generic[T]):
         try:
             self.close()
         except Exception as exc:
-            log(f"Error during cleanup: {exc}", level=30)  # logging.WARNING
+            LoggerFactory.get_logger(__name__).warning("Error during cleanup: %s", exc)
             # Don't suppress cleanup errors
             if exc_type is None:
                 raise
@@ -96,11 +147,15 @@ class AsyncManagedResource(Generic[T]):
     """Base class for async resources that need cleanup.
 
     Provides async context manager support for guaranteed resource cleanup
-    even when exceptions occur.
+    even when exceptions occur. The base class declares empty
+    ``__slots__``; subclasses that declare their own ``__slots__`` get
+    instances without a per-instance ``__dict__``.
 
     Examples
     --------
     >>> class AsyncDatabaseConnection(AsyncManagedResource[AsyncConnection]):
+    ...     __slots__ = ("connection",)
+    ...
     ...     def __init__(self, connection):
     ...         self.connection = connection
     ...
@@ -112,6 +167,8 @@ class AsyncManagedResource(Generic[T]):
     ...     await db.query("SELECT ...")
     """
 
+    __slots__ = ()
+
     async def __aenter__(self) -> T:
         """Enter async context manager.
 
@@ -147,13 +204,39 @@ class AsyncManagedResource(Generic[T]):
         try:
             await self.close()
         except Exception as exc:
-            log(f"Error during async cleanup: {exc}", level=30)  # logging.WARNING
+            LoggerFactory.get_logger(__name__).warning(
+                "Error during async cleanup: %s", exc
+            )
             # Don't suppress cleanup errors
             if exc_type is None:
                 raise
 
         return False  # Re-raise exceptions
 
+    @classmethod
+    async def aclose_all(cls, resources: Iterable[AsyncManagedResource[Any]]) -> None:
+        """Close several resources concurrently.
+
+        Cleanup failures are logged rather than raised, so one failing
+        resource does not prevent the others from closing.
+
+        Parameters
+        ----------
+        resources : Iterable[AsyncManagedResource]
+            Resources to close.
+        """
+        resources = list(resources)
+        results = await asyncio.gather(
+            *(resource.close() for resource in resources), return_exceptions=True
+        )
+        for resource, result in zip(resources, results):
+            if isinstance(result, Exception):
+                LoggerFactory.get_logger(__name__).warning(
+                    "Error during async cleanup of %s: %s",
+                    type(resource).__name__,
+                    result,
+                )
+
     async def close(self) -> None:
         """Close and cleanup the resource asynchronously.
 
@@ -186,7 +269,9 @@ def ensure_closed(resource: Any) -> None:
         try:
             close_method()
         except Exception as exc:
-            log(f"Error closing {type(resource).__name__}: {exc}", level=30)
+            LoggerFactory.get_logger(__name__).warning(
+                "Error closing %s: %s", type(resource).__name__, exc
+            )
 
 
 async def ensure_closed_async(resource: Any) -> None:
@@ -205,14 +290,13 @@ async def ensure_closed_async(resource: Any) -> None:
     close_method = getattr(resource, "close", None)
     if callable(close_method):
         try:
-            if asyncio.iscoroutinefunction(close_method):
+            if _is_coroutine_close(close_method):
                 await close_method()
             else:
                 close_method()
         except Exception as exc:
-            log(
-                f"Error closing async {type(resource).__name__}: {exc}",
-                level=30,
+            LoggerFactory.get_logger(__name__).warning(
+                "Error closing async %s: %s", type(resource).__name__, exc
             )
 
 
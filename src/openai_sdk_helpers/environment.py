@@ -14,21 +14,28 @@ Functions
 ---------
 get_data_path(name)
     Return a writable data directory for the given module name.
+configure_environment(dotenv_path)
+    Load variables from a ``.env`` file into the process environment.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 DATETIME_FMT = "%Y%m%d_%H%M%S"
 DEFAULT_MODEL = "gpt-4o-mini"
 
 
+@lru_cache(maxsize=64)
 def get_data_path(name: str) -> Path:
     """Return a writable data directory for the given module name.
 
     Creates a module-specific directory under ~/.openai-sdk-helpers/ for
-    storing data, logs, or other persistent files.
+    storing data, logs, or other persistent files. The path is resolved
+    and created once per name; later calls return the cached path. Call
+    ``get_data_path.cache_clear()`` after removing the directory or
+    changing the home directory.
 
     Parameters
     ----------
@@ -52,3 +59,33 @@ def get_data_path(name: str) -> Path:
     path = base / name
     path.mkdir(parents=True, exist_ok=True)
     return path
+
+
+def configure_environment(dotenv_path: Path | None = None) -> bool:
+    """Load variables from a ``.env`` file into the process environment.
+
+    Importing the package has no side effects on the environment;
+    applications that keep settings such as ``OPENAI_API_KEY`` in a
+    ``.env`` file call this once at startup. Variables already set in the
+    environment are not overridden.
+
+    Parameters
+    ----------
+    dotenv_path : Path or None, default=None
+        File to load. When omitted, ``.env`` is searched for from the
+        current working directory upwards.
+
+    Returns
+    -------
+    bool
+        True if at least one variable was loaded.
+
+    Examples
+    --------
+    >>> from openai_sdk_helpers.environment import configure_environment
+    >>> configure_environment()  # doctest: +SKIP
+    True
+    """
+    from dotenv import load_dotenv
+
+    return load_dotenv(dotenv_path)
@@ -35,6 +35,7 @@ class LoggerFactory:
     _initialized = False
     _log_level = logging.INFO
     _handlers: list[logging.Handler] = []
+    _loggers: dict[str, logging.Logger] = {}
     _lock = threading.Lock()
 
     @classmethod
@@ -85,21 +86,28 @@ class LoggerFactory:
         -------
         logging.Logger
             Configured logger instance.
-        """
-        logger = logging.getLogger(name)
 
-        # Skip configuration if already configured
-        if logger.handlers:
+        Notes
+        -----
+        Loggers returned before are served from a cache without taking any
+        lock, so concurrent lookups of known names do not contend.
+        """
+        logger = cls._loggers.get(name)
+        if logger is not None:
             return logger
 
-        with cls._lock:
-            if not cls._initialized:
-                cls.configure()
-
-            for handler in cls._handlers:
-                logger.addHandler(handler)
+        if not cls._initialized:
+            cls.configure()
 
-            logger.setLevel(cls._log_level)
-            logger.propagate = False
+        logger = logging.getLogger(name)
+        with cls._lock:
+            # Skip configuration if already configured
+            if not logger.handlers:
+                for handler in cls._handlers:
+                    logger.addHandler(handler)
+
+                logger.setLevel(cls._log_level)
+                logger.propagate = False
+            cls._loggers[name] = logger
 
         return logger
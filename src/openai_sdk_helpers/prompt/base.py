@@ -3,19 +3,255 @@
 This module provides the PromptRenderer class for loading and rendering
 Jinja2 templates with context variables. Templates can be loaded from a
 specified directory or by absolute path.
+
+Setting ``OPENAI_SDK_HELPERS_MINIJINJA=1`` renders templates with the
+Rust-backed ``minijinja`` engine when it is installed, falling back to
+Jinja2 for templates it cannot handle.
+
+Templates made only of plain text and ``{{ name }}`` substitutions are
+rendered with ``str.format_map`` instead of the Jinja2 runtime.
 """
 
 from __future__ import annotations
 
-import warnings
+import os
+import re
+import threading
+import weakref
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any
 
-from dotenv import load_dotenv
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    TemplateError,
+    TemplateNotFound,
+)
+
+try:
+    import minijinja  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover - optional dependency
+    minijinja = None  # type: ignore[assignment]
+
+# Errors that make a minijinja render fall back to Jinja2; empty without it.
+_MJ_ERROR: tuple[type[Exception], ...] = (
+    (minijinja.TemplateError,) if minijinja is not None else ()
+)
+
+MINIJINJA_ENV_VAR = "OPENAI_SDK_HELPERS_MINIJINJA"
+
+_BYTECODE_CACHE = FileSystemBytecodeCache()
+_ENVIRONMENTS: dict[str, Environment] = {}
+_ENVIRONMENTS_LOCK = threading.Lock()
+_WARMED_DIRS: set[str] = set()
+_MINIJINJA_ENVIRONMENTS: dict[str, Any] = {}
+
+_SIMPLE_FIELD = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+# Names Jinja2 resolves to constants or special objects rather than context.
+_RESERVED_NAMES = frozenset({"true", "false", "none", "True", "False", "None", "self"})
+_FORMAT_STRINGS: "weakref.WeakKeyDictionary[Template, str | None]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _BlankMissing(dict):
+    """Mapping rendering missing keys as empty text, like Jinja2 ``Undefined``."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+def _get_environment(directory: str | Path) -> Environment:
+    """Return the shared Jinja2 environment for ``directory``.
+
+    Environments are created once per directory and shared by every
+    renderer, so compiled templates are reused across instances. Compiled
+    bytecode is also persisted on disk so new processes skip parsing.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory used as the template loader root.
+
+    Returns
+    -------
+    Environment
+        Environment loading templates from ``directory``.
+    """
+    key = str(directory)
+    env = _ENVIRONMENTS.get(key)
+    if env is None:
+        with _ENVIRONMENTS_LOCK:
+            env = _ENVIRONMENTS.get(key)
+            if env is None:
+                env = Environment(
+                    loader=FileSystemLoader(key),
+                    autoescape=False,  # Prompts are plain text
+                    bytecode_cache=_BYTECODE_CACHE,
+                )
+                _ENVIRONMENTS[key] = env
+    return env
+
+
+@lru_cache(maxsize=256)
+def _validate_template_path(base_dir: str, template_path: str) -> Path:
+    """Validate a relative template path once per base directory.
+
+    Successful validations are cached, so repeated renders of the same
+    template skip path resolution. Failures are not cached.
+
+    Parameters
+    ----------
+    base_dir : str
+        Directory the template must stay within.
+    template_path : str
+        Template path relative to ``base_dir``.
+
+    Returns
+    -------
+    Path
+        Resolved template path.
+
+    Raises
+    ------
+    InputValidationError
+        If the path contains suspicious patterns or escapes ``base_dir``.
+    """
+    from openai_sdk_helpers.validation import validate_safe_path
+
+    base = Path(base_dir)
+    return validate_safe_path(
+        base / template_path, base_dir=base, field_name="template_path"
+    )
+
+
+def _to_format_string(env: Environment, source: str) -> str | None:
+    """Convert a substitution-only template source to a format string.
 
-load_dotenv()
-warnings.filterwarnings("ignore")
+    Parameters
+    ----------
+    env : Environment
+        Environment the template was compiled in.
+    source : str
+        Template source.
+
+    Returns
+    -------
+    str or None
+        Equivalent ``str.format_map`` pattern, or None when the template
+        uses anything beyond plain text and ``{{ name }}`` substitutions.
+    """
+    if "{%" in source or "{#" in source or "\r" in source:
+        return None
+    pieces: list[str] = []
+    position = 0
+    for match in _SIMPLE_FIELD.finditer(source):
+        literal = source[position : match.start()]
+        name = match.group(1)
+        if "{{" in literal or name in _RESERVED_NAMES or name in env.globals:
+            return None
+        pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+        pieces.append("{" + name + "}")
+        position = match.end()
+    tail = source[position:]
+    if "{{" in tail:
+        return None
+    if tail.endswith("\n") and not env.keep_trailing_newline:
+        tail = tail[:-1]
+    pieces.append(tail.replace("{", "{{").replace("}", "}}"))
+    return "".join(pieces)
+
+
+def _get_format_string(
+    env: Environment, template: Template, template_name: str
+) -> str | None:
+    """Return the cached fast-path format string for ``template``.
+
+    The decision is cached per compiled template, so it is recomputed only
+    when Jinja2 reloads a changed file.
+
+    Parameters
+    ----------
+    env : Environment
+        Environment ``template`` was loaded from.
+    template : Template
+        Compiled template.
+    template_name : str
+        Name ``template`` was loaded under.
+
+    Returns
+    -------
+    str or None
+        Format string for substitution-only templates, otherwise None.
+    """
+    try:
+        return _FORMAT_STRINGS[template]
+    except KeyError:
+        pass
+    format_string = None
+    if env.loader is not None:
+        try:
+            source = env.loader.get_source(env, template_name)[0]
+        except TemplateNotFound:
+            source = None
+        if source is not None:
+            format_string = _to_format_string(env, source)
+    _FORMAT_STRINGS[template] = format_string
+    return format_string
+
+
+def _load_source(directory: Path, name: str) -> str | None:
+    """Return the source of template ``name`` in ``directory``.
+
+    Parameters
+    ----------
+    directory : Path
+        Directory used as the template loader root.
+    name : str
+        Template path relative to ``directory``.
+
+    Returns
+    -------
+    str or None
+        Template source, or None when the file does not exist.
+    """
+    try:
+        return (directory / name).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _get_minijinja_environment(directory: str | Path) -> Any | None:
+    """Return the shared MiniJinja environment for ``directory``.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory used as the template loader root.
+
+    Returns
+    -------
+    minijinja.Environment or None
+        Environment loading templates from ``directory``, or None when
+        ``OPENAI_SDK_HELPERS_MINIJINJA`` is unset or minijinja is not
+        installed.
+    """
+    if minijinja is None:
+        return None
+    if os.getenv(MINIJINJA_ENV_VAR, "").lower() not in {"1", "true", "yes"}:
+        return None
+    key = str(directory)
+    env = _MINIJINJA_ENVIRONMENTS.get(key)
+    if env is None:
+        with _ENVIRONMENTS_LOCK:
+            env = _MINIJINJA_ENVIRONMENTS.get(key)
+            if env is None:
+                env = minijinja.Environment(loader=partial(_load_source, Path(key)))
+                _MINIJINJA_ENVIRONMENTS[key] = env
+    return env
 
 
 class PromptRenderer:
@@ -28,6 +264,13 @@ class PromptRenderer:
     Templates are loaded from a base directory (defaulting to the built-in
     prompt package directory) or can be specified with absolute paths.
     Autoescape is disabled by default since prompts are plain text.
+    Environments are shared per directory, so compiled templates are cached
+    across renderer instances and reloaded when the file changes. With
+    ``OPENAI_SDK_HELPERS_MINIJINJA=1`` templates are rendered by minijinja,
+    which does not reload templates edited after their first render.
+    Templates that only substitute ``{{ name }}`` variables are rendered
+    with ``str.format_map``; missing variables render as empty text, as
+    they do in Jinja2.
 
     Attributes
     ----------
@@ -98,10 +341,38 @@ class PromptRenderer:
         else:
             self.base_dir = base_dir
 
-        self._env = Environment(
-            loader=FileSystemLoader(str(self.base_dir)),
-            autoescape=False,  # Prompts are plain text
-        )
+        self._base_dir_str = str(self.base_dir)
+        self._env = _get_environment(self._base_dir_str)
+        if base_dir is None:
+            # Only the small built-in set is warmed; user directories may be
+            # arbitrarily large and are compiled lazily on first render.
+            self._warm(self.base_dir)
+
+    @classmethod
+    def _warm(cls, base_dir: Path) -> None:
+        """Compile every ``*.jinja`` template under ``base_dir`` once.
+
+        Runs on the first renderer created for the built-in template
+        directory so the first render of each template does not pay the
+        parse cost. Templates that fail to load are skipped; the error
+        surfaces on render.
+
+        Parameters
+        ----------
+        base_dir : Path
+            Template directory to warm.
+        """
+        key = str(base_dir)
+        with _ENVIRONMENTS_LOCK:
+            if key in _WARMED_DIRS:
+                return
+            _WARMED_DIRS.add(key)
+        env = _get_environment(base_dir)
+        for path in base_dir.rglob("*.jinja"):
+            try:
+                env.get_template(path.relative_to(base_dir).as_posix())
+            except TemplateError:
+                continue
 
     def render(self, template_path: str, context: dict[str, Any] | None = None) -> str:
         """Render a Jinja2 template with the given context variables.
@@ -151,22 +422,36 @@ class PromptRenderer:
         ...     context={"key": "value"}
         ... )
         """
-        from openai_sdk_helpers.validation import validate_safe_path
-
-        path = Path(template_path)
-        if path.is_absolute():
+        # Plain string operations avoid building Path objects on every call.
+        if os.path.isabs(template_path):
             # Absolute paths allowed but not validated against base_dir
-            template_path_ = path
+            directory, template_name = os.path.split(template_path)
+            env = _get_environment(directory)
         else:
             # Relative paths validated to prevent directory traversal
-            template_path_ = validate_safe_path(
-                self.base_dir / template_path,
-                base_dir=self.base_dir,
-                field_name="template_path",
-            )
-        template_path_text = template_path_.read_text()
-        template = Template(template_path_text)
+            _validate_template_path(self._base_dir_str, template_path)
+            directory = self._base_dir_str
+            env = self._env
+            template_name = template_path
+            if os.sep != "/":
+                template_name = template_name.replace(os.sep, "/")
+        mj_env = _get_minijinja_environment(directory)
+        if mj_env is not None:
+            try:
+                return mj_env.render_template(template_name, **(context or {}))
+            except _MJ_ERROR:
+                pass  # Unsupported syntax or missing file; let Jinja2 decide
+        try:
+            template = env.get_template(template_name)
+        except TemplateNotFound as exc:
+            raise FileNotFoundError(f"Template not found: {template_path}") from exc
+        format_string = _get_format_string(env, template, template_name)
+        if format_string is not None:
+            try:
+                return format_string.format_map(context or {})
+            except KeyError:
+                return format_string.format_map(_BlankMissing(context or {}))
         return template.render(context or {})
 
 
-__all__ = ["PromptRenderer"]
+__all__ = ["MINIJINJA_ENV_VAR", "PromptRenderer"]
@@ -9,17 +9,24 @@ parsing.
 from __future__ import annotations
 
 import asyncio
+import copy
+import hashlib
 import inspect
 import json
 import logging
 import threading
 import uuid
+from functools import lru_cache
+from collections import OrderedDict
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
     Callable,
+    Collection,
     Generic,
+    MutableMapping,
     Sequence,
     TypeVar,
     cast,
@@ -35,6 +42,8 @@ from openai.types.responses.response_input_text_param import ResponseInputTextPa
 from openai.types.responses.response_output_message import ResponseOutputMessage
 
 from .messages import ResponseMessage, ResponseMessages
+from .tool_call import loads_json, serialize_tool_result
+from ..async_utils import run_coroutine_in_background, run_coroutine_in_thread_runner
 from ..config import OpenAISettings
 from ..structure import BaseStructure
 from ..types import OpenAIClient
@@ -50,6 +59,193 @@ ProcessContent = Callable[[str], tuple[str, list[str]]]
 
 RB = TypeVar("RB", bound="BaseResponse[BaseStructure]")
 
+MAX_TOOL_USE_CONCURRENCY = 10
+MAX_ATTACHMENT_UPLOAD_CONCURRENCY = 8
+DEFAULT_TOOL_CACHE_SIZE = 256
+PREWARM_TIMEOUT = 2.0
+
+_CLIENTS: dict[tuple[Any, ...], OpenAIClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _prewarm_client(client: OpenAIClient) -> None:
+    """Open a pooled connection to the API host in the background.
+
+    Sends a ``HEAD`` request to the client's base URL on a daemon thread so
+    the TCP and TLS handshakes are done before the first real request.
+    Failures are ignored; the first request then connects as usual.
+
+    Parameters
+    ----------
+    client : OpenAIClient
+        Client whose connection pool is warmed.
+    """
+    http_client = getattr(client, "_client", None)
+    base_url = getattr(client, "base_url", None)
+    if http_client is None or base_url is None:
+        return
+
+    def _head() -> None:
+        """Send the preflight request."""
+        try:
+            http_client.head(str(base_url), timeout=PREWARM_TIMEOUT)
+        except Exception as exc:
+            log("Connection prewarm failed: %s", exc, level=logging.DEBUG)
+
+    threading.Thread(
+        target=_head, name="openai-sdk-helpers-prewarm", daemon=True
+    ).start()
+
+
+def _get_or_create_client(
+    settings: OpenAISettings, prewarm: bool = False
+) -> OpenAIClient:
+    """Return the shared OpenAI client for ``settings``.
+
+    Responses created with the same credentials and routing share one
+    client, and with it one HTTP connection pool, for the lifetime of the
+    process. Settings carrying ``extra_client_kwargs`` always get a new
+    client since those options may be specific to the caller.
+
+    Parameters
+    ----------
+    settings : OpenAISettings
+        Settings describing the client.
+    prewarm : bool, default False
+        Open a connection to the API host in the background when a new
+        client is created.
+
+    Returns
+    -------
+    OpenAIClient
+        Client configured from ``settings``.
+    """
+    if settings.extra_client_kwargs:
+        client = settings.create_client()
+        if prewarm:
+            _prewarm_client(client)
+        return client
+    key = (
+        settings.api_key,
+        settings.org_id,
+        settings.project_id,
+        settings.base_url or "",
+        settings.timeout,
+        settings.max_retries,
+        tuple(sorted(settings.pool_kwargs.items())),
+    )
+    client = _CLIENTS.get(key)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                client = settings.create_client()
+                _CLIENTS[key] = client
+                if prewarm:
+                    _prewarm_client(client)
+    return client
+
+
+@lru_cache(maxsize=256)
+def _system_content(instructions: str) -> ResponseInputMessageContentListParam:
+    """Return the system message content for ``instructions``.
+
+    Sessions created with the same instructions share one content list.
+    Message history stores content by reference and never modifies it.
+
+    Parameters
+    ----------
+    instructions : str
+        System instructions for the session.
+
+    Returns
+    -------
+    ResponseInputMessageContentListParam
+        Shared system message content.
+    """
+    return [ResponseInputTextParam(type="input_text", text=instructions)]
+
+
+def _response_cache_key(request: dict[str, Any]) -> str:
+    """Return the response cache key for a ``responses.create`` request.
+
+    Parameters
+    ----------
+    request : dict[str, Any]
+        Keyword arguments sent to ``responses.create``: model, input
+        (including the system instructions), tools and text format.
+
+    Returns
+    -------
+    str
+        Hex-encoded BLAKE2b digest of the canonical JSON request.
+    """
+    payload = json.dumps(request, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def _upload_attachments(storage: Any, file_paths: Sequence[str]) -> list[Any]:
+    """Upload ``file_paths`` to ``storage`` concurrently.
+
+    Parameters
+    ----------
+    storage : VectorStorage
+        Vector store receiving the files.
+    file_paths : Sequence[str]
+        Local paths of the files to upload.
+
+    Returns
+    -------
+    list[VectorStorageFileInfo]
+        Upload results, in the order of ``file_paths``.
+    """
+    if len(file_paths) == 1:
+        return [await asyncio.to_thread(storage.upload_file, file_paths[0])]
+    semaphore = asyncio.Semaphore(MAX_ATTACHMENT_UPLOAD_CONCURRENCY)
+
+    async def _upload(file_path: str) -> Any:
+        """Upload one file within the concurrency limit."""
+        async with semaphore:
+            return await asyncio.to_thread(storage.upload_file, file_path)
+
+    return list(await asyncio.gather(*(_upload(path) for path in file_paths)))
+
+
+def _partition_tool_calls(
+    tool_calls: Sequence[ResponseFunctionToolCall],
+    concurrency_safe: Collection[str],
+) -> list[list[ResponseFunctionToolCall]]:
+    """Split tool calls into batches that may run concurrently.
+
+    Consecutive calls to concurrency-safe tools share a batch; every other
+    call gets a batch of its own so it runs after the preceding calls
+    finished and before the following calls start.
+
+    Parameters
+    ----------
+    tool_calls : Sequence[ResponseFunctionToolCall]
+        Tool calls in the order the model issued them.
+    concurrency_safe : Collection[str]
+        Names of tools whose handlers may run concurrently.
+
+    Returns
+    -------
+    list[list[ResponseFunctionToolCall]]
+        Batches preserving the original call order.
+    """
+    batches: list[list[ResponseFunctionToolCall]] = []
+    safe_batch: list[ResponseFunctionToolCall] | None = None
+    for call in tool_calls:
+        if call.name in concurrency_safe:
+            if safe_batch is None:
+                safe_batch = []
+                batches.append(safe_batch)
+            safe_batch.append(call)
+        else:
+            safe_batch = None
+            batches.append([call])
+    return batches
+
 
 class BaseResponse(Generic[T]):
     """Manage OpenAI API interactions for structured responses.
@@ -121,6 +317,12 @@ class BaseResponse(Generic[T]):
         system_vector_store: list[str] | None = None,
         data_path_fn: Callable[[str], Path] | None = None,
         save_path: Path | str | None = None,
+        concurrency_safe_tools: Collection[str] | None = None,
+        response_cache: MutableMapping[str, Any] | None = None,
+        stream: bool = False,
+        prewarm: bool = True,
+        cacheable_tools: Collection[str] | None = None,
+        tool_cache_size: int = DEFAULT_TOOL_CACHE_SIZE,
     ) -> None:
         """Initialize a response session with OpenAI configuration.
 
@@ -140,8 +342,8 @@ class BaseResponse(Generic[T]):
             response_format() method. Pass None for unstructured responses.
         tool_handlers : dict[str, ToolHandler]
             Mapping from tool names to callable handlers. Each handler receives
-            a ResponseFunctionToolCall and returns a string or any serializable
-            result.
+            a ResponseFunctionToolCall and returns a JSON string, UTF-8 JSON
+            bytes (e.g. from ``orjson.dumps``), or any serializable result.
         openai_settings : OpenAISettings
             Fully configured OpenAI settings with API key and default model.
         process_content : callable or None, default None
@@ -156,6 +358,32 @@ class BaseResponse(Generic[T]):
         save_path : Path, str, or None, default None
             Optional path to a directory or file where message history is saved.
             If a directory, files are named using the session UUID.
+        concurrency_safe_tools : Collection[str] or None, default None
+            Names of tools whose handlers have no side effects on each other.
+            When the model requests several of them at once, their handlers
+            run concurrently. Other handlers run one at a time.
+        response_cache : MutableMapping[str, Any] or None, default None
+            Optional mapping storing API responses by request. A request
+            identical to an earlier one (same model, instructions, history,
+            tools and output format) reuses the stored response instead of
+            calling the API. Tool calls in a reused response are executed
+            again.
+        stream : bool, default False
+            Stream responses from the API instead of waiting for the full
+            response. Handlers of concurrency-safe tools requested at the
+            start of the output begin running as soon as their arguments
+            are complete, while the rest of the response is still arriving.
+        prewarm : bool, default True
+            When a new client is created for these settings, open a
+            connection to the API host in the background so the first
+            request does not wait for the TLS handshake.
+        cacheable_tools : Collection[str] or None, default None
+            Names of tools whose handlers are pure: the same arguments
+            always give the same result and calling them has no side
+            effects. Their results are reused when the model repeats a call
+            with identical arguments during the session.
+        tool_cache_size : int, default DEFAULT_TOOL_CACHE_SIZE
+            Number of tool results kept for ``cacheable_tools``.
 
         Raises
         ------
@@ -178,13 +406,33 @@ class BaseResponse(Generic[T]):
         ... )
         """
         self._tool_handlers = tool_handlers
+        # Classify handlers once so dispatch skips per-call introspection.
+        self._handler_table: dict[str, tuple[ToolHandler, bool]] = {
+            name: (handler, inspect.iscoroutinefunction(handler))
+            for name, handler in tool_handlers.items()
+        }
+        self._concurrency_safe_tools = frozenset(concurrency_safe_tools or ())
+        self._cacheable_tools = frozenset(cacheable_tools or ())
+        self._tool_cache_size = tool_cache_size
+        self._tool_result_cache: OrderedDict[tuple[str, bytes], Any] = OrderedDict()
+        self._response_cache = response_cache
+        self._stream = stream
+        self._save_pending = False
         self._process_content = process_content
         self._name = name
         self._data_path_fn = data_path_fn
         self._save_path = Path(save_path) if save_path is not None else None
         self._instructions = instructions
-        self._tools = tools if tools is not None else []
+        # Copy so attachments adding a file_search tool do not touch the
+        # caller's list.
+        self._tools = list(tools) if tools is not None else []
+        self._has_file_search = any(
+            tool.get("type") == "file_search" for tool in self._tools
+        )
         self._output_structure = output_structure
+        self._response_format = (
+            output_structure.response_format() if output_structure is not None else None
+        )
         self._openai_settings = openai_settings
 
         if not self._openai_settings.api_key:
@@ -192,7 +440,7 @@ class BaseResponse(Generic[T]):
 
         self._client: OpenAIClient
         try:
-            self._client = self._openai_settings.create_client()
+            self._client = _get_or_create_client(self._openai_settings, prewarm)
         except Exception as exc:  # pragma: no cover - defensive guard
             raise RuntimeError("Failed to initialize OpenAI client") from exc
 
@@ -203,11 +451,11 @@ class BaseResponse(Generic[T]):
             )
 
         self.uuid = uuid.uuid4()
-        self.name = self.__class__.__name__.lower()
-
-        system_content: ResponseInputMessageContentListParam = [
-            ResponseInputTextParam(type="input_text", text=instructions)
-        ]
+        self._cls_name_lower = type(self).__name__.lower()
+        self.name = self._cls_name_lower
+        self._session_filename = f"{str(self.uuid).lower()}.json"
+        self._save_target: Path | None = None
+        self._save_target_source: tuple[Any, ...] | None = None
 
         self._user_vector_storage: Any | None = None
 
@@ -226,7 +474,7 @@ class BaseResponse(Generic[T]):
             )
 
         self.messages = ResponseMessages()
-        self.messages.add_system_message(content=system_content)
+        self.messages.add_system_message(content=_system_content(instructions))
         if self._save_path is not None or (
             self._data_path_fn is not None and self._name is not None
         ):
@@ -260,9 +508,41 @@ class BaseResponse(Generic[T]):
                 "data_path_fn and name are required to build data paths."
             )
         base_path = self._data_path_fn(self._name)
-        return base_path / self.__class__.__name__.lower() / self.name
+        return base_path / self._cls_name_lower / self.name
+
+    def _get_user_vector_storage(self) -> Any:
+        """Return the vector store for user attachments, creating it if needed.
+
+        The store is created on the first attachment of the session. A
+        file_search tool pointing at it is added unless one is already
+        configured, e.g. for a system vector store.
+
+        Returns
+        -------
+        VectorStorage
+            Vector store receiving this session's attachments.
+        """
+        if self._user_vector_storage is None:
+            from openai_sdk_helpers.vector_storage import VectorStorage
+
+            store_name = f"{self._cls_name_lower}_{self.name}_{self.uuid}_user"
+            self._user_vector_storage = VectorStorage(
+                store_name=store_name,
+                client=self._client,
+                model=self._model,
+            )
+            user_vector_storage = cast(Any, self._user_vector_storage)
+            if not self._has_file_search:
+                self._tools.append(
+                    {
+                        "type": "file_search",
+                        "vector_store_ids": [user_vector_storage.id],
+                    }
+                )
+                self._has_file_search = True
+        return self._user_vector_storage
 
-    def _build_input(
+    async def _build_input(
         self,
         content: str | list[str],
         attachments: list[str] | None = None,
@@ -284,48 +564,31 @@ class BaseResponse(Generic[T]):
         -----
         If attachments are provided and no user vector storage exists, this
         method automatically creates one and adds a file_search tool to
-        the tools list.
+        the tools list. The attachments of a message are uploaded
+        concurrently. The process_content callback runs on a worker thread
+        so it does not block the event loop.
         """
-        contents = ensure_list(content)
+        contents = content if isinstance(content, list) else (content,)
 
         for raw_content in contents:
             if self._process_content is None:
                 processed_text, content_attachments = raw_content, []
             else:
-                processed_text, content_attachments = self._process_content(raw_content)
+                processed_text, content_attachments = await asyncio.to_thread(
+                    self._process_content, raw_content
+                )
             input_content: list[ResponseInputTextParam | ResponseInputFileParam] = [
                 ResponseInputTextParam(type="input_text", text=processed_text)
             ]
 
             all_attachments = (attachments or []) + content_attachments
-
-            for file_path in all_attachments:
-                if self._user_vector_storage is None:
-                    from openai_sdk_helpers.vector_storage import VectorStorage
-
-                    store_name = f"{self.__class__.__name__.lower()}_{self.name}_{self.uuid}_user"
-                    self._user_vector_storage = VectorStorage(
-                        store_name=store_name,
-                        client=self._client,
-                        model=self._model,
-                    )
-                    user_vector_storage = cast(Any, self._user_vector_storage)
-                    if not any(
-                        tool.get("type") == "file_search" for tool in self._tools
-                    ):
-                        self._tools.append(
-                            {
-                                "type": "file_search",
-                                "vector_store_ids": [user_vector_storage.id],
-                            }
-                        )
-                    else:
-                        # If system vector store is attached, its ID will be in tool config
-                        pass
-                user_vector_storage = cast(Any, self._user_vector_storage)
-                uploaded_file = user_vector_storage.upload_file(file_path)
-                input_content.append(
-                    ResponseInputFileParam(type="input_file", file_id=uploaded_file.id)
+            if all_attachments:
+                uploaded_files = await _upload_attachments(
+                    self._get_user_vector_storage(), all_attachments
+                )
+                input_content.extend(
+                    ResponseInputFileParam(type="input_file", file_id=uploaded.id)
+                    for uploaded in uploaded_files
                 )
 
             message = cast(
@@ -371,10 +634,50 @@ class BaseResponse(Generic[T]):
         >>> result = await response.run_async("Analyze this text")
         >>> print(result)
         """
-        log(f"{self.__class__.__name__}::run_response")
+        try:
+            return await self._run_response(content, attachments)
+        finally:
+            await self._flush_save()
+
+    def _mark_unsaved(self) -> None:
+        """Record that the message history changed since the last save."""
+        self._save_pending = True
+
+    async def _flush_save(self) -> None:
+        """Save the message history once if it changed during this run.
+
+        Tool and assistant messages added during a run are written in a
+        single save at the end, on a worker thread, so disk I/O neither
+        repeats per message nor blocks the event loop.
+        """
+        if self._save_pending:
+            self._save_pending = False
+            await asyncio.to_thread(self.save)
+
+    async def _run_response(
+        self,
+        content: str | list[str],
+        attachments: str | list[str] | None,
+    ) -> T | None:
+        """Send the request and process the output for :meth:`run_async`.
+
+        Parameters
+        ----------
+        content : str or list[str]
+            Prompt text or list of prompt texts to send.
+        attachments : str, list[str], or None
+            Optional file path or list of file paths to upload and attach.
+
+        Returns
+        -------
+        T or None
+            Parsed response object, or None if no structured output was
+            produced.
+        """
+        log("%s::run_response", self.__class__.__name__)
         parsed_result: T | None = None
 
-        self._build_input(
+        await self._build_input(
             content=content,
             attachments=(ensure_list(attachments) if attachments else None),
         )
@@ -383,53 +686,66 @@ class BaseResponse(Generic[T]):
             "input": self.messages.to_openai_payload(),
             "model": self._model,
         }
-        if not self._tools and self._output_structure is not None:
-            kwargs["text"] = self._output_structure.response_format()
+        if not self._tools and self._response_format is not None:
+            kwargs["text"] = self._response_format
 
         if self._tools:
             kwargs["tools"] = self._tools
             kwargs["tool_choice"] = "auto"
-        response = self._client.responses.create(**kwargs)
+        cache_key = ""
+        response = None
+        if self._response_cache is not None:
+            cache_key = _response_cache_key(kwargs)
+            response = self._response_cache.get(cache_key)
+        started: dict[str, asyncio.Task[Any]] = {}
+        if response is None:
+            if self._stream:
+                response, started = await self._stream_response(kwargs)
+            else:
+                response = await asyncio.to_thread(
+                    self._client.responses.create, **kwargs
+                )
+            if self._response_cache is not None and response.output:
+                self._response_cache[cache_key] = response
+        else:
+            log("Reusing cached response.", level=logging.DEBUG)
 
         if not response.output:
+            for task in started.values():
+                task.cancel()
             log("No output returned from OpenAI.", level=logging.ERROR)
             raise RuntimeError("No output returned from OpenAI.")
 
+        tool_calls = [
+            item
+            for item in response.output
+            if isinstance(item, ResponseFunctionToolCall)
+        ]
+        tool_results = iter(await self._execute_tool_calls(tool_calls, started))
+
         for response_output in response.output:
             if isinstance(response_output, ResponseFunctionToolCall):
-                log(
-                    f"Tool call detected. Executing {response_output.name}.",
-                    level=logging.INFO,
-                )
-
                 tool_name = response_output.name
-                handler = self._tool_handlers.get(tool_name)
-
-                if handler is None:
-                    log(
-                        f"No handler found for tool '{tool_name}'",
-                        level=logging.ERROR,
-                    )
-                    raise ValueError(f"No handler for tool: {tool_name}")
-
+                tool_result_json = next(tool_results)
                 try:
-                    if inspect.iscoroutinefunction(handler):
-                        tool_result_json = await handler(response_output)
-                    else:
-                        tool_result_json = handler(response_output)
                     if isinstance(tool_result_json, str):
-                        tool_result = json.loads(tool_result_json)
+                        tool_result = loads_json(tool_result_json)
                         tool_output = tool_result_json
+                    elif isinstance(tool_result_json, (bytes, bytearray)):
+                        tool_result = loads_json(tool_result_json)
+                        tool_output = tool_result_json.decode()
                     else:
                         tool_result = tool_result_json
-                        tool_output = json.dumps(tool_result)
+                        tool_output = serialize_tool_result(tool_result)
                     self.messages.add_tool_message(
                         content=response_output, output=tool_output
                     )
-                    self.save()
+                    self._mark_unsaved()
                 except Exception as exc:
                     log(
-                        f"Error executing tool handler '{tool_name}': {exc}",
+                        "Error executing tool handler '%s': %s",
+                        tool_name,
+                        exc,
                         level=logging.ERROR,
                     )
                     raise RuntimeError(f"Error in tool handler '{tool_name}': {exc}")
@@ -441,15 +757,14 @@ class BaseResponse(Generic[T]):
                 else:
                     print(tool_result)
                     parsed_result = cast(T, tool_result)
-
-            if isinstance(response_output, ResponseOutputMessage):
+            elif isinstance(response_output, ResponseOutputMessage):
                 self.messages.add_assistant_message(response_output, kwargs)
-                self.save()
+                self._mark_unsaved()
                 if hasattr(response, "output_text") and response.output_text:
                     raw_text = response.output_text
                     log("No tool call. Parsing output_text.")
                     try:
-                        output_dict = json.loads(raw_text)
+                        output_dict = loads_json(raw_text)
                         if self._output_structure:
                             return self._output_structure.from_raw_input(output_dict)
                         return output_dict
@@ -459,6 +774,197 @@ class BaseResponse(Generic[T]):
             return parsed_result
         return None
 
+    async def _stream_response(
+        self, request: dict[str, Any]
+    ) -> tuple[Any, dict[str, asyncio.Task[Any]]]:
+        """Stream a response and start early tool calls as they complete.
+
+        The stream is consumed on a worker thread. Each function call is
+        handed to the event loop once its arguments are complete, and
+        calls to concurrency-safe tools are started right away as long as
+        no other tool call precedes them, so their handlers overlap with
+        the rest of the model output.
+
+        Parameters
+        ----------
+        request : dict[str, Any]
+            Keyword arguments for ``responses.stream``.
+
+        Returns
+        -------
+        tuple[Response, dict[str, asyncio.Task[Any]]]
+            Final response and the handler tasks already started, keyed by
+            call ID.
+        """
+        loop = asyncio.get_running_loop()
+        started: dict[str, asyncio.Task[Any]] = {}
+        semaphore = asyncio.Semaphore(MAX_TOOL_USE_CONCURRENCY)
+        leading = True
+
+        async def _run_bounded(call: ResponseFunctionToolCall) -> Any:
+            """Invoke the handler for ``call`` within the concurrency limit."""
+            async with semaphore:
+                return await self._run_tool(call)
+
+        def _on_tool_call(call: ResponseFunctionToolCall) -> None:
+            """Start ``call`` if it belongs to the leading safe batch."""
+            nonlocal leading
+            if (
+                leading
+                and call.name in self._concurrency_safe_tools
+                and call.name in self._handler_table
+            ):
+                started[call.call_id] = loop.create_task(_run_bounded(call))
+            else:
+                leading = False
+
+        def _consume() -> Any:
+            """Read the stream, forwarding finished tool calls to the loop."""
+            with self._client.responses.stream(**request) as stream:
+                for event in stream:
+                    if event.type == "response.output_item.done" and isinstance(
+                        event.item, ResponseFunctionToolCall
+                    ):
+                        loop.call_soon_threadsafe(_on_tool_call, event.item)
+                return stream.get_final_response()
+
+        try:
+            response = await asyncio.to_thread(_consume)
+        except BaseException:
+            for task in started.values():
+                task.cancel()
+            raise
+        return response, started
+
+    async def _run_tool(self, call: ResponseFunctionToolCall) -> Any:
+        """Invoke the registered handler for ``call``.
+
+        Synchronous handlers run on a worker thread so a blocking handler
+        does not stall other sessions sharing the event loop. Results of
+        ``cacheable_tools`` are reused for repeated calls with identical
+        arguments.
+
+        Parameters
+        ----------
+        call : ResponseFunctionToolCall
+            Tool call to execute.
+
+        Returns
+        -------
+        Any
+            Raw handler result.
+        """
+        cache_key: tuple[str, bytes] | None = None
+        if call.name in self._cacheable_tools:
+            digest = hashlib.blake2b(call.arguments.encode("utf-8"), digest_size=16)
+            cache_key = (call.name, digest.digest())
+            if cache_key in self._tool_result_cache:
+                self._tool_result_cache.move_to_end(cache_key)
+                log("Reusing cached result for %s.", call.name, level=logging.DEBUG)
+                return copy.deepcopy(self._tool_result_cache[cache_key])
+
+        log("Tool call detected. Executing %s.", call.name, level=logging.INFO)
+        handler, is_coroutine = self._handler_table[call.name]
+        if is_coroutine:
+            result = await cast(Awaitable[Any], handler(call))
+        else:
+            result = await asyncio.to_thread(handler, call)
+        if cache_key is not None:
+            # Store and hand out copies so callers mutating a result cannot
+            # change what later calls receive.
+            self._tool_result_cache[cache_key] = copy.deepcopy(result)
+            if len(self._tool_result_cache) > self._tool_cache_size:
+                self._tool_result_cache.popitem(last=False)
+        return result
+
+    async def _execute_tool_calls(
+        self,
+        tool_calls: Sequence[ResponseFunctionToolCall],
+        started: dict[str, asyncio.Task[Any]] | None = None,
+    ) -> list[Any]:
+        """Run the registered handlers for ``tool_calls``.
+
+        Handlers of tools listed in ``concurrency_safe_tools`` run
+        concurrently when the model requests them back to back. All other
+        handlers run one at a time in call order. Synchronous handlers run
+        on worker threads.
+
+        Parameters
+        ----------
+        tool_calls : Sequence[ResponseFunctionToolCall]
+            Tool calls returned by the model.
+        started : dict[str, asyncio.Task[Any]] or None, default None
+            Handler tasks already running for some of the calls, keyed by
+            call ID. Their results are awaited instead of calling the
+            handlers again.
+
+        Returns
+        -------
+        list[Any]
+            Raw handler results, in the order of ``tool_calls``.
+
+        Raises
+        ------
+        ValueError
+            If a tool has no registered handler.
+        RuntimeError
+            If a tool handler raises an exception.
+        """
+        started = dict(started or {})
+        try:
+            for call in tool_calls:
+                if call.name not in self._handler_table:
+                    log(
+                        "No handler found for tool '%s'", call.name, level=logging.ERROR
+                    )
+                    raise ValueError(f"No handler for tool: {call.name}")
+
+            semaphore = asyncio.Semaphore(MAX_TOOL_USE_CONCURRENCY)
+
+            async def _run_bounded(call: ResponseFunctionToolCall) -> Any:
+                """Invoke the handler for ``call`` within the concurrency limit."""
+                task = started.pop(call.call_id, None)
+                if task is not None:
+                    return await task
+                async with semaphore:
+                    return await self._run_tool(call)
+
+            results: list[Any] = []
+            for batch in _partition_tool_calls(
+                tool_calls, self._concurrency_safe_tools
+            ):
+                if len(batch) == 1:
+                    call = batch[0]
+                    try:
+                        task = started.pop(call.call_id, None)
+                        if task is not None:
+                            outcomes: list[Any] = [await task]
+                        else:
+                            outcomes = [await self._run_tool(call)]
+                    except Exception as exc:
+                        outcomes = [exc]
+                else:
+                    outcomes = await asyncio.gather(
+                        *(_run_bounded(call) for call in batch),
+                        return_exceptions=True,
+                    )
+                for call, outcome in zip(batch, outcomes):
+                    if isinstance(outcome, Exception):
+                        log(
+                            "Error executing tool handler '%s': %s",
+                            call.name,
+                            outcome,
+                            level=logging.ERROR,
+                        )
+                        raise RuntimeError(
+                            f"Error in tool handler '{call.name}': {outcome}"
+                        )
+                results.extend(outcomes)
+            return results
+        finally:
+            for task in started.values():
+                task.cancel()
+
     def run_sync(
         self,
         content: str | list[str],
@@ -466,9 +972,11 @@ class BaseResponse(Generic[T]):
     ) -> T | None:
         """Execute run_async synchronously with proper event loop handling.
 
-        Automatically detects if an event loop is already running and uses
-        a separate thread if necessary. This enables safe usage in both
-        synchronous and asynchronous contexts.
+        Without a running event loop the call runs on the calling thread's
+        persistent loop. When a loop is already running, the call is handed
+        to the shared background loop instead of a new thread and loop.
+        This enables safe usage in both synchronous and asynchronous
+        contexts.
 
         Parameters
         ----------
@@ -487,24 +995,12 @@ class BaseResponse(Generic[T]):
         >>> result = response.run_sync("Summarize this document")
         >>> print(result)
         """
-
-        async def runner() -> T | None:
-            return await self.run_async(content=content, attachments=attachments)
-
+        coro = self.run_async(content=content, attachments=attachments)
         try:
             asyncio.get_running_loop()
         except RuntimeError:
-            return asyncio.run(runner())
-        result: T | None = None
-
-        def _thread_func() -> None:
-            nonlocal result
-            result = asyncio.run(runner())
-
-        thread = threading.Thread(target=_thread_func)
-        thread.start()
-        thread.join()
-        return result
+            return run_coroutine_in_thread_runner(coro)
+        return run_coroutine_in_background(coro, timeout=None)
 
     def run_streamed(
         self,
@@ -648,18 +1144,8 @@ class BaseResponse(Generic[T]):
         >>> response.save("/path/to/session.json")
         >>> response.save()  # Uses configured save_path or data_path
         """
-        if filepath is not None:
-            target = Path(filepath)
-        elif self._save_path is not None:
-            if self._save_path.suffix == ".json":
-                target = self._save_path
-            else:
-                filename = f"{str(self.uuid).lower()}.json"
-                target = self._save_path / filename
-        elif self._data_path_fn is not None and self._name is not None:
-            filename = f"{str(self.uuid).lower()}.json"
-            target = self.data_path / filename
-        else:
+        target = Path(filepath) if filepath is not None else self._get_save_target()
+        if target is None:
             log(
                 "Skipping save: no filepath, save_path, or data_path_fn configured.",
                 level=logging.DEBUG,
@@ -667,7 +1153,33 @@ class BaseResponse(Generic[T]):
             return
 
         self.messages.to_json_file(str(target))
-        log(f"Saved messages to {target}")
+        log("Saved messages to %s", target)
+
+    def _get_save_target(self) -> Path | None:
+        """Return the file the message history is saved to by default.
+
+        The target is resolved once and reused by later saves until
+        the save path, data path function or names change.
+
+        Returns
+        -------
+        Path or None
+            Path of the JSON file, or None if no save location is
+            configured.
+        """
+        source = (self._save_path, self._data_path_fn, self._name, self.name)
+        if source != self._save_target_source:
+            target: Path | None = None
+            if self._save_path is not None:
+                if self._save_path.suffix == ".json":
+                    target = self._save_path
+                else:
+                    target = self._save_path / self._session_filename
+            elif self._data_path_fn is not None and self._name is not None:
+                target = self.data_path / self._session_filename
+            self._save_target = target
+            self._save_target_source = source
+        return self._save_target
 
     def __repr__(self) -> str:
         """Return a detailed string representation of the response session.
@@ -714,7 +1226,8 @@ class BaseResponse(Generic[T]):
 
         Saves the current message history and deletes managed vector stores.
         User vector stores are always cleaned up. System vector store cleanup
-        is handled via tool configuration.
+        is handled via tool configuration. The OpenAI client is shared with
+        other responses using the same settings and is left open.
 
         Notes
         -----
@@ -730,7 +1243,7 @@ class BaseResponse(Generic[T]):
         ... finally:
         ...     response.close()
         """
-        log(f"Closing session {self.uuid} for {self.__class__.__name__}")
+        log("Closing session %s for %s", self.uuid, self.__class__.__name__)
         self.save()
         # Always clean user vector storage if it exists
         try:
@@ -738,6 +1251,6 @@ class BaseResponse(Generic[T]):
                 self._user_vector_storage.delete()
                 log("User vector store deleted.")
         except Exception as exc:
-            log(f"Error deleting user vector store: {exc}", level=logging.WARNING)
+            log("Error deleting user vector store: %s", exc, level=logging.WARNING)
         # System vector store cleanup is now handled via tool configuration
-        log(f"Session {self.uuid} closed.")
+        log("Session %s closed.", self.uuid)
@@ -9,7 +9,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import cast
+from itertools import islice
+from typing import Any, cast
 
 from openai.types.responses.response_function_tool_call import ResponseFunctionToolCall
 from openai.types.responses.response_function_tool_call_param import (
@@ -107,6 +108,8 @@ class ResponseMessages(JSONSerializable):
         Record a tool call and its output.
     to_openai_payload()
         Convert stored messages to OpenAI input payload format.
+    to_json()
+        Return a JSON-compatible dict representation.
     get_last_assistant_message()
         Return the most recent assistant message or None.
     get_last_tool_message()
@@ -117,6 +120,14 @@ class ResponseMessages(JSONSerializable):
 
     messages: list[ResponseMessage] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        """Initialize the incremental payload and JSON caches."""
+        self._payload: list[Any] = []
+        self._payload_source: list[ResponseMessage] | None = None
+        self._payload_count = 0
+        self._json_messages: list[dict[str, Any]] = []
+        self._json_source: list[ResponseMessage] | None = None
+
     def add_system_message(
         self, content: ResponseInputMessageContentListParam, **metadata
     ) -> None:
@@ -221,10 +232,46 @@ class ResponseMessages(JSONSerializable):
         -----
         Assistant messages are not included in the returned payload since
         they represent model outputs rather than inputs for the next request.
+
+        The payload is built incrementally: only messages appended since the
+        previous call are converted. Replacing ``messages`` or removing
+        entries from it rebuilds the payload from scratch.
+        """
+        messages = self.messages
+        if messages is not self._payload_source or len(messages) < self._payload_count:
+            self._payload = []
+            self._payload_source = messages
+            self._payload_count = 0
+        for msg in islice(messages, self._payload_count, None):
+            if msg.role != "assistant":
+                self._payload.append(msg.to_openai_format())
+        self._payload_count = len(messages)
+        # Callers keep the returned list (e.g. in message metadata), so hand
+        # out a copy rather than the cache itself.
+        return list(self._payload)
+
+    def to_json(self) -> dict[str, Any]:
+        """Return a JSON-compatible dict representation.
+
+        Returns
+        -------
+        dict[str, Any]
+            Mapping with the serialized ``messages``.
+
+        Notes
+        -----
+        Messages are serialized once, when first saved, and reused by later
+        calls, so saving after every turn only converts the new messages.
+        Like :meth:`to_openai_payload`, replacing ``messages`` or removing
+        entries from it rebuilds the cache from scratch.
         """
-        return [
-            msg.to_openai_format() for msg in self.messages if msg.role != "assistant"
-        ]
+        messages = self.messages
+        cached = self._json_messages
+        if messages is not self._json_source or len(messages) < len(cached):
+            cached = self._json_messages = []
+            self._json_source = messages
+        cached.extend(msg.to_json() for msg in islice(messages, len(cached), None))
+        return {"messages": list(cached)}
 
     def _get_last_message(self, role: str) -> ResponseMessage | None:
         """Return the most recent message for the given role.
@@ -10,11 +10,22 @@ from __future__ import annotations
 import ast
 import json
 from dataclasses import dataclass
+from typing import Any
 
 from openai.types.responses.response_function_tool_call_param import (
     ResponseFunctionToolCallParam,
 )
 from openai.types.responses.response_input_param import FunctionCallOutput
+from pydantic import BaseModel, TypeAdapter
+
+from ..utils import customJSONEncoder
+
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+_ADAPTER_CACHE: dict[Any, TypeAdapter[Any]] = {}
 
 
 @dataclass
@@ -94,6 +105,41 @@ class ResponseToolCall:
         return function_call, function_call_output
 
 
+def loads_json(text: str | bytes | bytearray) -> Any:
+    """Parse a JSON document.
+
+    Uses ``orjson`` when it is installed, falling back to the standard
+    ``json`` module for input ``orjson`` rejects, such as ``NaN`` literals
+    or integers wider than 64 bits.
+
+    Parameters
+    ----------
+    text : str, bytes or bytearray
+        JSON document to parse. Bytes must be UTF-8 encoded.
+
+    Returns
+    -------
+    Any
+        Decoded value.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If ``text`` is not valid JSON.
+
+    Examples
+    --------
+    >>> loads_json('{"key": "value"}')
+    {'key': 'value'}
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
 def parse_tool_arguments(arguments: str) -> dict:
     """Parse tool call arguments with fallback for malformed JSON.
 
@@ -125,9 +171,69 @@ def parse_tool_arguments(arguments: str) -> dict:
     {'key': 'value'}
     """
     try:
-        return json.loads(arguments)
+        return loads_json(arguments)
     except json.JSONDecodeError:
         try:
             return ast.literal_eval(arguments)
         except Exception as exc:  # noqa: BLE001
             raise ValueError(f"Invalid JSON arguments: {arguments}") from exc
+
+
+def _get_type_adapter(type_: Any) -> TypeAdapter[Any]:
+    """Return a cached ``TypeAdapter`` for ``type_``.
+
+    Parameters
+    ----------
+    type_ : Any
+        Type to build the adapter for.
+
+    Returns
+    -------
+    TypeAdapter
+        Adapter reused across calls for the same type.
+    """
+    adapter = _ADAPTER_CACHE.get(type_)
+    if adapter is None:
+        adapter = TypeAdapter(type_)
+        _ADAPTER_CACHE[type_] = adapter
+    return adapter
+
+
+def serialize_tool_result(result: Any) -> str:
+    """Serialize a tool handler result into a JSON string.
+
+    Pydantic models, and lists of a single model type, are dumped straight to
+    JSON through a cached ``TypeAdapter``. Other values are encoded with
+    ``orjson`` when it is installed, falling back to the standard ``json``
+    module with ``customJSONEncoder`` for types ``orjson`` cannot handle.
+
+    Parameters
+    ----------
+    result : Any
+        Value returned by a tool handler.
+
+    Returns
+    -------
+    str
+        JSON representation of ``result``. Strings are returned unchanged.
+
+    Examples
+    --------
+    >>> serialize_tool_result({"key": "value"})  # doctest: +SKIP
+    '{"key":"value"}'
+    """
+    if isinstance(result, str):
+        return result
+    if isinstance(result, BaseModel):
+        return _get_type_adapter(type(result)).dump_json(result).decode()
+    if isinstance(result, list) and result and isinstance(result[0], BaseModel):
+        item_type = type(result[0])
+        if all(type(item) is item_type for item in result):
+            adapter = _get_type_adapter(list[item_type])
+            return adapter.dump_json(result).decode()
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(result, cls=customJSONEncoder)
@@ -83,6 +83,7 @@ def attach_vector_store(
         response._tools.append(
             {"type": "file_search", "vector_store_ids": resolved_ids}
         )
+        response._has_file_search = True
         return resolved_ids
 
     existing_ids = ensure_list(file_search_tool.get("vector_store_ids", []))
@@ -35,6 +35,8 @@ WebSearchItemStructure
     Individual web search item.
 WebSearchItemResultStructure
     Result from executing a web search item.
+WebSearchItemResultsStructure
+    Results from web search items executed in one batch.
 WebSearchReportStructure
     Complete web search report with findings.
 VectorSearchStructure
@@ -51,6 +53,8 @@ VectorSearchReportStructure
     Complete vector search report.
 ValidationResultStructure
     Validation results with pass/fail status.
+TranslationBatchStructure
+    Translations of several texts produced in one agent run.
 
 Functions
 ---------
@@ -74,6 +78,7 @@ from .plan import *
 from .prompt import PromptStructure
 from .responses import *
 from .summary import *
+from .translation import TranslationBatchStructure
 from .validation import ValidationResultStructure
 from .vector_search import *
 from .web_search import *
@@ -94,6 +99,7 @@ __all__ = [
     "WebSearchPlanStructure",
     "WebSearchItemStructure",
     "WebSearchItemResultStructure",
+    "WebSearchItemResultsStructure",
     "WebSearchReportStructure",
     "VectorSearchReportStructure",
     "VectorSearchItemStructure",
@@ -102,6 +108,7 @@ __all__ = [
     "VectorSearchPlanStructure",
     "VectorSearchStructure",
     "ValidationResultStructure",
+    "TranslationBatchStructure",
     "assistant_tool_definition",
     "assistant_format",
     "response_tool_definition",
@@ -29,13 +29,67 @@ from typing import (
 from pydantic import BaseModel, ConfigDict, Field
 from openai.types.responses.response_text_config_param import ResponseTextConfigParam
 
-
 # Internal imports
 
 from ..utils import check_filepath, customJSONEncoder, log
 
 T = TypeVar("T", bound="BaseStructure")
 DEFAULT_DATA_PATH: Path | None = None
+_SEQUENCE_ORIGINS = frozenset({list, Sequence, tuple, set})
+
+
+def _is_list_annotation(annotation: Any) -> bool:
+    """Return whether ``annotation`` describes a sequence-like field.
+
+    Parameters
+    ----------
+    annotation : Any
+        Field annotation to inspect. Unions are checked member by member.
+
+    Returns
+    -------
+    bool
+        True when the annotation (or a union member) is a sequence type.
+    """
+    if annotation is None:
+        return False
+
+    origin = get_origin(annotation)
+    if origin in _SEQUENCE_ORIGINS or annotation in _SEQUENCE_ORIGINS:
+        return True
+
+    # Check for Union types (e.g., list[str] | None)
+    if origin is not None:
+        return any(
+            get_origin(arg) in _SEQUENCE_ORIGINS or arg in _SEQUENCE_ORIGINS
+            for arg in get_args(annotation)
+        )
+    return False
+
+
+def _convert_json_value(obj: Any) -> Any:
+    """Recursively convert enums and nested structures to JSON-ready values.
+
+    Parameters
+    ----------
+    obj : Any
+        Value produced by ``model_dump``.
+
+    Returns
+    -------
+    Any
+        Value with enums replaced by their values and mappings/sequences
+        converted to dicts and lists.
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, BaseStructure):
+        return obj.to_json()
+    if isinstance(obj, Mapping):
+        return {str(k): _convert_json_value(v) for k, v in obj.items()}
+    if isinstance(obj, Sequence) and not isinstance(obj, (str, bytes, bytearray)):
+        return [_convert_json_value(item) for item in obj]
+    return obj
 
 
 class BaseStructure(BaseModel):
@@ -163,6 +217,28 @@ class BaseStructure(BaseModel):
             setattr(cls, cache_attr, fields)
         return getattr(cls, cache_attr)
 
+    @classmethod
+    def _get_list_field_names(cls) -> tuple[str, ...]:
+        """Return the names of fields annotated as sequence types.
+
+        Results are computed once per class and cached for performance.
+
+        Returns
+        -------
+        tuple[str, ...]
+            Field names whose annotation is a list, tuple, set, or sequence,
+            optionally wrapped in a union.
+        """
+        cache_attr = "_list_field_names_cache"
+        if cache_attr not in cls.__dict__:
+            names = tuple(
+                name
+                for name, field in cls.model_fields.items()
+                if _is_list_annotation(getattr(field, "annotation", None))
+            )
+            setattr(cls, cache_attr, names)
+        return cls.__dict__[cache_attr]
+
     @classmethod
     def _get_field_prompt(
         cls, field_name: str, field, add_enum_values: bool = True
@@ -320,6 +396,9 @@ class BaseStructure(BaseModel):
         completions API to return structured output matching this
         structure's schema.
 
+        Results are computed once per class and cached for performance, so
+        the returned mapping is shared and must not be mutated.
+
         Returns
         -------
         ResponseTextConfigParam
@@ -334,9 +413,12 @@ class BaseStructure(BaseModel):
         ...     response_format=format_spec
         ... )
         """
-        from .responses import response_format
+        cache_attr = "_response_format_cache"
+        if cache_attr not in cls.__dict__:
+            from .responses import response_format
 
-        return response_format(cls)
+            setattr(cls, cache_attr, response_format(cls))
+        return cls.__dict__[cache_attr]
 
     @classmethod
     def get_schema(cls) -> dict[str, Any]:
@@ -480,54 +562,15 @@ class BaseStructure(BaseModel):
         >>> data = instance.to_json()
         >>> print(json.dumps(data))
         """
+        payload = _convert_json_value(self.model_dump())
 
-        def convert(obj: Any) -> Any:
-            if isinstance(obj, Enum):
-                return obj.value
-            if isinstance(obj, BaseStructure):
-                return obj.to_json()
-            if isinstance(obj, Mapping):
-                return {str(k): convert(v) for k, v in obj.items()}
-            if isinstance(obj, Sequence) and not isinstance(
-                obj, (str, bytes, bytearray)
-            ):
-                return [convert(item) for item in obj]
-            return obj
-
-        payload = convert(self.model_dump())
-
-        def is_list_field(field) -> bool:
-            annotation = getattr(field, "annotation", None)
-            if annotation is None:
-                return False
-
-            origins_to_match = {list, Sequence, tuple, set}
-
-            origin = get_origin(annotation)
-            if origin in origins_to_match or annotation in origins_to_match:
-                return True
-
-            # Check for Union types (e.g., list[str] | None)
-            if origin is not None:
-                # Handle Union by checking args
-                args = get_args(annotation)
-                return any(
-                    get_origin(arg) in origins_to_match or arg in origins_to_match
-                    for arg in args
-                )
-            return False
-
-        for name, field in self.__class__.model_fields.items():
+        for name in self.__class__._get_list_field_names():
             if name not in payload:
                 continue
-            if not is_list_field(field):
-                continue
             value = payload[name]
             if value is None:
                 continue
-            if isinstance(value, (str, bytes, bytearray)):
-                payload[name] = [value]
-            elif not isinstance(value, list):
+            if not isinstance(value, list):
                 payload[name] = [value]
 
         return payload
@@ -595,24 +638,25 @@ class BaseStructure(BaseModel):
         Used by from_raw_input to correctly process enum values from
         raw API responses.
 
+        Results are computed once per class and cached for performance.
+
         Returns
         -------
         dict[str, type[Enum]]
             Mapping of field names to Enum types.
         """
-        mapping: dict[str, type[Enum]] = {}
-
-        for name, model_field in cls.model_fields.items():
-            field_type = model_field.annotation
-            enum_cls = cls._extract_enum_class(field_type)
-
-            if enum_cls is not None:
-                mapping[name] = enum_cls
-
-        return mapping
+        cache_attr = "_enum_field_mapping_cache"
+        if cache_attr not in cls.__dict__:
+            mapping: dict[str, type[Enum]] = {}
+            for name, model_field in cls.model_fields.items():
+                enum_cls = cls._extract_enum_class(model_field.annotation)
+                if enum_cls is not None:
+                    mapping[name] = enum_cls
+            setattr(cls, cache_attr, mapping)
+        return cls.__dict__[cache_attr]
 
     @classmethod
-    def from_raw_input(cls: type[T], data: dict) -> T:
+    def from_raw_input(cls: type[T], data: dict | str | bytes) -> T:
         """Construct an instance from a dictionary of raw input data.
 
         Particularly useful for converting data from OpenAI API tool calls
@@ -621,8 +665,9 @@ class BaseStructure(BaseModel):
 
         Parameters
         ----------
-        data : dict
-            Raw input data dictionary from API response.
+        data : dict, str, or bytes
+            Raw input data dictionary from API response, or the JSON
+            document encoding it.
 
         Returns
         -------
@@ -635,7 +680,11 @@ class BaseStructure(BaseModel):
         >>> instance = MyStructure.from_raw_input(raw_data)
         """
         mapping = cls._build_enum_field_mapping()
-        clean_data = data.copy()
+        if isinstance(data, (str, bytes, bytearray)):
+            # Freshly decoded, so it can be cleaned in place.
+            clean_data = json.loads(data)
+        else:
+            clean_data = data.copy()
 
         for field, enum_cls in mapping.items():
             raw_value = clean_data.get(field)
@@ -643,19 +692,21 @@ class BaseStructure(BaseModel):
             if raw_value is None:
                 continue
 
+            value_map = enum_cls._value2member_map_
             # List of enum values
             if isinstance(raw_value, list):
+                members = enum_cls.__members__
                 converted = []
                 for v in raw_value:
                     if isinstance(v, enum_cls):
                         converted.append(v)
                     elif isinstance(v, str):
                         # Check if it's a valid value
-                        if v in enum_cls._value2member_map_:
-                            converted.append(enum_cls(v))
+                        if v in value_map:
+                            converted.append(value_map[v])
                         # Check if it's a valid name
-                        elif v in enum_cls.__members__:
-                            converted.append(enum_cls.__members__[v])
+                        elif v in members:
+                            converted.append(members[v])
                         else:
                             log(
                                 f"[{cls.__name__}] Skipping invalid value for '{field}': '{v}' not in {enum_cls.__name__}",
@@ -664,10 +715,8 @@ class BaseStructure(BaseModel):
                 clean_data[field] = converted
 
             # Single enum value
-            elif (
-                isinstance(raw_value, str) and raw_value in enum_cls._value2member_map_
-            ):
-                clean_data[field] = enum_cls(raw_value)
+            elif isinstance(raw_value, str) and raw_value in value_map:
+                clean_data[field] = value_map[raw_value]
 
             elif isinstance(raw_value, enum_cls):
                 # already the correct type
@@ -8,12 +8,12 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-import threading
 from datetime import datetime, timezone
 from typing import Any, Awaitable, Callable, Coroutine, cast
 from collections.abc import Mapping
 
 from .enum import AgentEnum
+from ...async_utils import run_coroutine_in_background
 from ..base import BaseStructure, spec_field
 from .task import TaskStructure
 
@@ -148,12 +148,16 @@ class PlanStructure(BaseStructure):
         >>> results = plan.execute(registry)  # doctest: +SKIP
         """
         aggregated_results: list[str] = []
+        dispatch = self._build_dispatch(agent_registry)
         for task in self.tasks:
-            callable_key = self._resolve_registry_key(task.task_type)
-            if callable_key not in agent_registry:
-                raise KeyError(f"No agent registered for '{callable_key}'.")
+            # AgentEnum is a str enum, so members hash like their values.
+            agent_callable = dispatch.get(task.task_type)
+            if agent_callable is None:
+                callable_key = self._resolve_registry_key(task.task_type)
+                agent_callable = dispatch.get(callable_key)
+                if agent_callable is None:
+                    raise KeyError(f"No agent registered for '{callable_key}'.")
 
-            agent_callable = agent_registry[callable_key]
             task.start_date = datetime.now(timezone.utc)
             task.status = "running"
 
@@ -180,6 +184,32 @@ class PlanStructure(BaseStructure):
 
         return aggregated_results
 
+    @staticmethod
+    def _build_dispatch(
+        agent_registry: Mapping[
+            AgentEnum | str, Callable[..., object | Coroutine[Any, Any, object]]
+        ],
+    ) -> dict[str, Callable[..., object | Coroutine[Any, Any, object]]]:
+        """Return a dispatch table keyed by normalized agent values.
+
+        Normalizing the registry once per execution avoids resolving each
+        task's key against the enum on every dispatch.
+
+        Parameters
+        ----------
+        agent_registry : Mapping[AgentEnum | str, Callable[..., Any]]
+            Lookup of agent identifiers to callables.
+
+        Returns
+        -------
+        dict[str, Callable[..., Any]]
+            Callables keyed by the string value of their agent type.
+        """
+        return {
+            PlanStructure._resolve_registry_key(key): agent_callable
+            for key, agent_callable in agent_registry.items()
+        }
+
     @staticmethod
     def _resolve_registry_key(task_type: AgentEnum | str) -> str:
         """Return a normalized registry key for the given task_type.
@@ -275,7 +305,7 @@ class PlanStructure(BaseStructure):
         """Await the provided result, handling running event loops.
 
         Properly handles awaiting results whether an event loop is running
-        or not, using a separate thread when necessary.
+        or not, using the shared background loop when necessary.
 
         Parameters
         ----------
@@ -293,15 +323,7 @@ class PlanStructure(BaseStructure):
             return asyncio.run(result)
 
         if loop.is_running():
-            container: dict[str, object | None] = {"value": None}
-
-            def _runner() -> None:
-                container["value"] = asyncio.run(result)
-
-            thread = threading.Thread(target=_runner, daemon=True)
-            thread.start()
-            thread.join()
-            return container["value"]
+            return run_coroutine_in_background(result, timeout=None)
 
         return loop.run_until_complete(result)
 
@@ -0,0 +1,41 @@
+"""Structures describing batched translation results.
+
+This module defines the Pydantic model returned when several texts are
+translated in a single agent run.
+"""
+
+from __future__ import annotations
+
+from .base import BaseStructure, spec_field
+
+
+class TranslationBatchStructure(BaseStructure):
+    """Translations of several texts produced in a single agent run.
+
+    Used as the output type when translation requests are coalesced into
+    one call instead of being sent one call per text.
+
+    Attributes
+    ----------
+    translations : list[str]
+        One translated text per input text, in input order.
+
+    Methods
+    -------
+    print()
+        Return a formatted string representation of the stored fields.
+
+    Examples
+    --------
+    >>> batch = TranslationBatchStructure(translations=["Hola", "Adiós"])
+    """
+
+    translations: list[str] = spec_field(
+        "translations",
+        allow_null=False,
+        default_factory=list,
+        description="One translated text per input text, in input order.",
+    )
+
+
+__all__ = ["TranslationBatchStructure"]
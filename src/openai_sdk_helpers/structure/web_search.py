@@ -86,6 +86,27 @@ class WebSearchItemResultStructure(BaseStructure):
     text: str = spec_field("text")
 
 
+class WebSearchItemResultsStructure(BaseStructure):
+    """Results of several web searches executed in a single agent run.
+
+    Used as the output type when search items are batched into one request
+    instead of being run one call per item.
+
+    Attributes
+    ----------
+    item_results : list[WebSearchItemResultStructure]
+        One result per search item, in plan order.
+
+    Examples
+    --------
+    >>> results = WebSearchItemResultsStructure(
+    ...     item_results=[WebSearchItemResultStructure(text="Result")]
+    ... )
+    """
+
+    item_results: list[WebSearchItemResultStructure] = spec_field("item_results")
+
+
 class WebSearchPlanStructure(BaseStructure):
     """Collection of web searches required to satisfy the query.
 
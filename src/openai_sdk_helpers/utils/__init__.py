@@ -18,8 +18,8 @@ coerce_dict(value)
     Convert a value to a string-keyed dictionary.
 coerce_jsonable(value)
     Convert a value into a JSON-serializable representation.
-log(message, level)
-    Log a message with basic configuration.
+log(message, *args, level)
+    Log a message with basic configuration and deferred formatting.
 
 Classes
 -------
@@ -17,6 +17,11 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, TypeVar
 
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 
 def coerce_optional_float(value: object) -> float | None:
     """Return a float when the provided value can be coerced, otherwise None.
@@ -400,7 +405,9 @@ class JSONSerializable:
         """Write serialized JSON data to a file path.
 
         Creates parent directories as needed. Uses customJSONEncoder for
-        handling special types.
+        handling special types. Encodes with ``orjson`` when it is
+        installed, falling back to the standard ``json`` module for values
+        ``orjson`` cannot handle.
 
         Parameters
         ----------
@@ -419,9 +426,22 @@ class JSONSerializable:
         """
         target = Path(filepath)
         check_filepath(fullfilepath=str(target))
+        data = self.to_json()
+        if orjson is not None:
+            try:
+                encoded = orjson.dumps(
+                    data,
+                    default=customJSONEncoder().default,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            except TypeError:
+                pass
+            else:
+                target.write_bytes(encoded)
+                return str(target)
         with open(target, "w", encoding="utf-8") as handle:
             json.dump(
-                self.to_json(),
+                data,
                 handle,
                 indent=2,
                 ensure_ascii=False,
@@ -430,16 +450,21 @@ class JSONSerializable:
         return str(target)
 
 
-def log(message: str, level: int = logging.INFO) -> None:
+def log(message: str, *args: Any, level: int = logging.INFO) -> None:
     """Log a message with a basic configuration.
 
     Configures logging on first use with a simple timestamp format.
-    Subsequent calls use the existing configuration.
+    Subsequent calls use the existing configuration. Like the standard
+    ``logging`` functions, ``message`` is only %-formatted with ``args``
+    when the record is emitted, so hot paths should pass their values as
+    arguments instead of pre-formatting them.
 
     Parameters
     ----------
     message : str
-        Message to emit.
+        Message to emit, optionally with %-style placeholders.
+    *args : Any
+        Values substituted into ``message``.
     level : int, optional
         Logging level (e.g., logging.INFO, logging.WARNING), by default
         logging.INFO.
@@ -448,6 +473,7 @@ def log(message: str, level: int = logging.INFO) -> None:
     --------
     >>> import logging
     >>> log("Test message", level=logging.INFO)  # doctest: +SKIP
+    >>> log("Loaded %d items", 3)  # doctest: +SKIP
     """
     global _configured_logging
     if not _configured_logging:
@@ -455,7 +481,7 @@ def log(message: str, level: int = logging.INFO) -> None:
             level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s"
         )
         _configured_logging = True
-    logging.log(level, message)
+    logging.log(level, message, *args)
 
 
 __all__ = [
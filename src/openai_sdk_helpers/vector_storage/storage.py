@@ -8,6 +8,7 @@ and batch operations.
 from __future__ import annotations
 
 import glob
+import hashlib
 import logging
 import mimetypes
 import os
@@ -141,6 +142,8 @@ class VectorStorage:
 
         self._vector_storage = self._get_or_create_vector_storage(store_name)
         self._existing_files: dict[str, str] | None = {}
+        # SHA-256 of uploaded file contents mapped to their file IDs.
+        self._uploaded_digests: dict[str, str] = {}
 
     @property
     def id(self) -> str:
@@ -236,7 +239,8 @@ class VectorStorage:
         """Upload a single file to the vector store.
 
         Handles text and binary files with automatic encoding detection.
-        Skips upload if file already exists unless overwrite is True.
+        Skips upload if a file with the same name, or the same contents,
+        was already uploaded unless overwrite is True.
 
         Parameters
         ----------
@@ -290,6 +294,14 @@ class VectorStorage:
                 with open(file_path, "rb") as handle:
                     file_data = handle.read()
 
+            digest = hashlib.sha256(file_data).hexdigest()
+            if not overwrite and digest in self._uploaded_digests:
+                return VectorStorageFileInfo(
+                    name=file_name,
+                    id=self._uploaded_digests[digest],
+                    status="existing",
+                )
+
             file = self._client.files.create(
                 file=(file_path, file_data), purpose=purpose  # type: ignore
             )
@@ -305,6 +317,7 @@ class VectorStorage:
             )
 
             self.existing_files[file_name] = file.id
+            self._uploaded_digests[digest] = file.id
 
             return VectorStorageFileInfo(name=file_name, id=file.id, status="success")
         except Exception as exc:
@@ -414,6 +427,10 @@ class VectorStorage:
             to_remove = [k for k, v in self.existing_files.items() if v == file_id]
             for key in to_remove:
                 del self.existing_files[key]
+            for digest in [
+                k for k, v in self._uploaded_digests.items() if v == file_id
+            ]:
+                del self._uploaded_digests[digest]
 
             return VectorStorageFileInfo(
                 name=to_remove[0] if to_remove else "", id=file_id, status="success"
@@ -477,6 +494,7 @@ class VectorStorage:
 
             self._client.vector_stores.delete(self._vector_storage.id)
             self._existing_files = None  # clear cache
+            self._uploaded_digests.clear()
             log(f"Vector store '{self._vector_storage.name}' deleted successfully.")
 
         except Exception as exc:
@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, patch, Mock
 
 import pytest
 from agents import RunContextWrapper
+from jinja2 import Template
 from pydantic import BaseModel
 
 from openai_sdk_helpers.agent.base import AgentBase
@@ -49,6 +50,14 @@ def test_base_agent_initialization(mock_config):
     assert agent.model == "test_model"
 
 
+def test_base_agent_without_template_shares_empty_template():
+    """Test that agents without a prompt share one empty template."""
+    first = AgentBase(config=MockConfig(name="first", model="test_model"))
+    second = AgentBase(config=MockConfig(name="second", model="test_model"))
+    assert first._template is second._template
+    assert first._template.render() == ""
+
+
 def test_base_agent_initialization_with_prompt_dir(mock_config, tmp_path: Path):
     """Test AgentBase initialization with a prompt directory."""
     prompt_dir = tmp_path / "prompts"
@@ -73,6 +82,28 @@ def test_base_agent_initialization_with_absolute_template_path(tmp_path: Path):
     assert agent._template.render(name="Alice") == "Greetings, Alice!"
 
 
+def test_base_agent_reuses_compiled_template(tmp_path: Path):
+    """Test that agents sharing a template file share the compiled template."""
+    import os
+
+    template_file = tmp_path / "shared.jinja"
+    template_file.write_text("Version one")
+    config = MockConfig(
+        name="test_agent", model="test_model", template_path=str(template_file)
+    )
+
+    first = AgentBase(config=config)
+    second = AgentBase(config=config)
+    assert first._template is second._template
+
+    template_file.write_text("Version two")
+    stat = template_file.stat()
+    os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    third = AgentBase(config=config)
+    assert third._template is not first._template
+    assert third._template.render() == "Version two"
+
+
 def test_base_agent_build_prompt_from_jinja(mock_config, mock_run_context_wrapper):
     """Test building a prompt from a Jinja template."""
     agent = AgentBase(config=mock_config)
@@ -83,6 +114,73 @@ def test_base_agent_build_prompt_from_jinja(mock_config, mock_run_context_wrappe
     agent._template.render.assert_called_once_with({"key": "value"})
 
 
+def test_build_prompt_from_jinja_memoizes_render(mock_config):
+    """Test that repeated renders with the same context reuse the output."""
+    agent = AgentBase(config=mock_config)
+    agent._template = MagicMock()
+    agent._template.render.return_value = "Hello, value!"
+    wrapper = RunContextWrapper(context={"key": "value"})
+
+    assert agent.build_prompt_from_jinja(wrapper) == "Hello, value!"
+    assert agent.build_prompt_from_jinja(wrapper) == "Hello, value!"
+    agent._template.render.assert_called_once()
+
+    agent.build_prompt_from_jinja(RunContextWrapper(context={"key": "other"}))
+    assert agent._template.render.call_count == 2
+
+    agent.invalidate_prompt_cache()
+    agent.build_prompt_from_jinja(wrapper)
+    assert agent._template.render.call_count == 3
+
+
+def test_build_prompt_from_jinja_unhashable_context(mock_config):
+    """Test that unhashable context values bypass the render cache."""
+    agent = AgentBase(config=mock_config)
+    agent._template = MagicMock()
+    agent._template.render.return_value = "rendered"
+    wrapper = RunContextWrapper(context={"items": ["a", "b"]})
+
+    agent.build_prompt_from_jinja(wrapper)
+    agent.build_prompt_from_jinja(wrapper)
+    assert agent._template.render.call_count == 2
+
+
+def test_set_run_context_wrapper_updates_default_context(mock_config):
+    """Test that the stored wrapper context is used when none is passed."""
+    agent = AgentBase(
+        config=mock_config,
+        run_context_wrapper=RunContextWrapper(context={"key": "first"}),
+    )
+    agent._template = MagicMock()
+    agent._template.render.return_value = "rendered"
+
+    agent.build_prompt_from_jinja()
+    agent._template.render.assert_called_once_with({"key": "first"})
+
+    agent.set_run_context_wrapper(RunContextWrapper(context={"key": "second"}))
+    agent.build_prompt_from_jinja()
+    agent._template.render.assert_called_with({"key": "second"})
+
+    agent.set_run_context_wrapper(None)
+    agent.build_prompt_from_jinja()
+    assert dict(agent._template.render.call_args.args[0]) == {}
+
+
+def test_build_prompt_from_jinja_renders_compiled_template(tmp_path: Path):
+    """Test that real templates render through the direct fast path."""
+    template_file = tmp_path / "fast.jinja"
+    template_file.write_text("Hello {{ name }}{% if missing.attr %}!{% endif %}")
+    config = MockConfig(
+        name="test_agent", model="test_model", template_path=str(template_file)
+    )
+    agent = AgentBase(config=config)
+
+    wrapper = RunContextWrapper(context={"name": "Ann", "missing": {}})
+    assert agent.build_prompt_from_jinja(wrapper) == "Hello Ann"
+    with pytest.raises(Exception, match="undefined"):
+        agent.build_prompt_from_jinja(RunContextWrapper(context={"name": "Ann"}))
+
+
 @patch("openai_sdk_helpers.agent.base.Agent")
 def test_get_agent(mock_agent, mock_config):
     """Test getting a configured agent instance."""
@@ -95,13 +193,105 @@ def test_get_agent(mock_agent, mock_config):
     )
 
 
-@patch("openai_sdk_helpers.agent.base.Runner")
-@patch("asyncio.run")
-def test_run_agent_sync_no_loop(mock_asyncio_run, mock_runner, mock_config):
-    """Test that _run_agent_sync creates a new event loop when none is running."""
+@patch("openai_sdk_helpers.agent.base.Agent")
+def test_get_agent_static_template_skips_render(mock_agent, tmp_path: Path):
+    """Test that templates without variables are rendered only once."""
+    template_file = tmp_path / "static.jinja"
+    template_file.write_text("Always the same.")
+    config = MockConfig(
+        name="test_agent", model="test_model", template_path=str(template_file)
+    )
+    agent = AgentBase(config=config)
+    assert agent._static_instructions == "Always the same."
+
+    with patch.object(agent, "_build_prompt_from_jinja") as mock_build:
+        agent.get_agent()
+    mock_build.assert_not_called()
+    assert mock_agent.call_args.kwargs["instructions"] == "Always the same."
+
+
+def test_dynamic_template_has_no_static_instructions(tmp_path: Path):
+    """Test that templates referencing variables are rendered per call."""
+    template_file = tmp_path / "dynamic.jinja"
+    template_file.write_text("Hello {{ name }}")
+    config = MockConfig(
+        name="test_agent", model="test_model", template_path=str(template_file)
+    )
+    agent = AgentBase(config=config)
+    assert agent._static_instructions is None
+
+
+@patch("openai_sdk_helpers.agent.base.Agent")
+def test_invalidate_prompt_cache_drops_static_instructions(mock_agent, tmp_path: Path):
+    """Test that a replaced template is used after invalidating the cache."""
+    template_file = tmp_path / "static.jinja"
+    template_file.write_text("Old instructions.")
+    config = MockConfig(
+        name="test_agent", model="test_model", template_path=str(template_file)
+    )
+    agent = AgentBase(config=config)
+    agent.get_agent()
+
+    agent._template = Template("New instructions.")
+    agent.invalidate_prompt_cache()
+    agent.get_agent()
+    assert mock_agent.call_args.kwargs["instructions"] == "New instructions."
+
+
+@patch("openai_sdk_helpers.agent.base.Agent")
+def test_get_agent_honors_prompt_override(mock_agent, tmp_path: Path):
+    """Test that subclasses overriding prompt rendering skip the static path."""
+
+    class CustomAgent(AgentBase):
+        def _build_prompt_from_jinja(self) -> str:
+            return "Custom instructions."
+
+    template_file = tmp_path / "static.jinja"
+    template_file.write_text("Always the same.")
+    config = MockConfig(
+        name="test_agent", model="test_model", template_path=str(template_file)
+    )
+    CustomAgent(config=config).get_agent()
+    assert mock_agent.call_args.kwargs["instructions"] == "Custom instructions."
+
+
+@patch("openai_sdk_helpers.agent.base.Agent")
+def test_get_agent_is_cached(mock_agent, mock_config):
+    """Test that get_agent reuses the agent while instructions are unchanged."""
+    agent = AgentBase(config=mock_config)
+    first = agent.get_agent()
+    second = agent.get_agent()
+    assert first is second
+    mock_agent.assert_called_once()
+
+    agent.invalidate_prompt_cache()
+    agent.get_agent()
+    assert mock_agent.call_count == 2
+
+
+@patch("openai_sdk_helpers.agent.base.Agent")
+def test_get_agent_rebuilds_after_tools_mutated(mock_agent, mock_config):
+    """Test that in-place tool changes produce a new agent."""
+    mock_config.tools = [Mock()]
+    agent = AgentBase(config=mock_config)
+    agent.get_agent()
+    agent.get_agent()
+    mock_agent.assert_called_once()
+
+    new_tool = Mock()
+    mock_config.tools.append(new_tool)
+    agent.get_agent()
+    assert mock_agent.call_count == 2
+    assert mock_agent.call_args.kwargs["tools"][-1] is new_tool
+
+
+@patch("openai_sdk_helpers.agent.runner.Runner")
+@patch("openai_sdk_helpers.agent.runner.run_coroutine_in_background")
+def test_run_agent_sync_no_loop(mock_run_background, mock_runner, mock_config):
+    """Test that run_sync submits the run to the background event loop."""
     agent = AgentBase(config=mock_config)
     agent.run_sync("test_input")
-    mock_asyncio_run.assert_called_once()
+    mock_run_background.assert_called_once()
 
 
 @patch("openai_sdk_helpers.agent.base.run_sync")
@@ -138,3 +328,32 @@ def test_as_tool(mock_config):
             tool_name="test_agent", tool_description=""
         )
         assert result == mock_tool
+
+
+@patch("openai_sdk_helpers.agent.base.Agent")
+def test_get_agent_uses_shared_client(mock_agent, mock_config):
+    """Test that a supplied client is wired into the agent model."""
+    client = MagicMock()
+    agent = AgentBase(config=mock_config, client=client)
+    agent.get_agent()
+    model = mock_agent.call_args.kwargs["model"]
+    assert model.model == "test_model"
+    assert model._client is client
+
+
+def test_render_raises_template_errors_without_rendering_twice():
+    """Test that a failing render is not retried through Template.render."""
+    from types import MappingProxyType
+
+    from openai_sdk_helpers.agent.base import _TEMPLATE_ENV, _render
+
+    calls = []
+
+    def fail() -> str:
+        calls.append(True)
+        raise ValueError("boom")
+
+    template = _TEMPLATE_ENV.from_string("{{ name }} {{ fail() }}")
+    with pytest.raises(ValueError, match="boom"):
+        _render(template, MappingProxyType({"name": "Ann", "fail": fail}))
+    assert calls == [True]
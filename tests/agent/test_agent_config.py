@@ -0,0 +1,26 @@
+"""Tests for AgentConfig normalization."""
+
+from __future__ import annotations
+
+from agents.model_settings import ModelSettings
+
+from openai_sdk_helpers.agent import AgentConfig
+
+
+def test_agent_config_copies_tools_into_list():
+    """Accept any iterable of tools and store an owned list."""
+    tools = ("tool_a", "tool_b")
+    config = AgentConfig(name="agent", tools=tools)
+    assert config.tools == ["tool_a", "tool_b"]
+
+    source = ["tool_a"]
+    config = AgentConfig(name="agent", tools=source)
+    source.append("tool_b")
+    assert config.tools == ["tool_a"]
+
+
+def test_agent_config_converts_model_settings_mapping():
+    """Convert mapping-style model settings into ModelSettings."""
+    config = AgentConfig(name="agent", model_settings={"tool_choice": "required"})
+    assert isinstance(config.model_settings, ModelSettings)
+    assert config.model_settings.tool_choice == "required"
@@ -25,7 +25,7 @@ def test_run_async_returns_coroutine(mock_runner_run, mock_agent):
     asyncio.run(coro)
 
 
-@patch("openai_sdk_helpers.agent.runner.run_coroutine_with_fallback")
+@patch("openai_sdk_helpers.agent.runner.run_coroutine_in_background")
 @patch("openai_sdk_helpers.agent.runner.Runner.run")
 def test_run_sync(mock_runner_run, mock_run_coroutine, mock_agent):
     """Test the run_sync function."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from unittest.mock import patch
 
 from openai_sdk_helpers.agent import utils
@@ -25,3 +26,15 @@ def test_run_coro_sync_with_running_loop(mock_get_running_loop):
     mock_get_running_loop.return_value.is_running.return_value = True
     result = utils.run_coroutine_agent_sync(sample_coro())
     assert result == "test result"
+
+
+def test_run_coro_sync_inside_loop_uses_background_loop():
+    """Reuse the shared background loop instead of a thread per call."""
+
+    async def thread_name():
+        return threading.current_thread().name
+
+    async def main():
+        return utils.run_coroutine_agent_sync(thread_name())
+
+    assert asyncio.run(main()) == "openai-sdk-helpers-loop"
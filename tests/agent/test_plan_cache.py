@@ -0,0 +1,125 @@
+"""Tests for the search plan cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from openai_sdk_helpers.agent.search.plan_cache import PlanCache, normalize_query
+from openai_sdk_helpers.agent.search.web import WebAgentSearch
+from openai_sdk_helpers.structure.web_search import (
+    WebSearchItemStructure,
+    WebSearchPlanStructure,
+)
+
+
+def _plan(query: str = "ai news") -> WebSearchPlanStructure:
+    return WebSearchPlanStructure(
+        searches=[WebSearchItemStructure(reason="latest", query=query)]
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    plan_cache = PlanCache(WebSearchPlanStructure, tmp_path / "plans.sqlite3")
+    yield plan_cache
+    plan_cache.close()
+
+
+def test_normalize_query():
+    assert normalize_query("  Latest   AI\tNews ") == "latest ai news"
+
+
+def test_plan_cache_round_trip(cache):
+    assert cache.get("AI news") is None
+    cache.put("AI news", _plan())
+    assert cache.get("  ai   NEWS ") == _plan()
+
+
+def test_plan_cache_expires_entries(tmp_path):
+    cache = PlanCache(WebSearchPlanStructure, tmp_path / "plans.sqlite3", ttl_seconds=0)
+    with patch("openai_sdk_helpers.agent.search.plan_cache.time.time") as now:
+        now.return_value = 1000
+        cache.put("ai news", _plan())
+        now.return_value = 1001
+        assert cache.get("ai news") is None
+    cache.close()
+
+
+def test_plan_cache_evicts_least_recently_used(tmp_path):
+    size = len(_plan("a").model_dump_json())
+    cache = PlanCache(
+        WebSearchPlanStructure, tmp_path / "plans.sqlite3", max_bytes=size * 2
+    )
+    with patch("openai_sdk_helpers.agent.search.plan_cache.time.time") as now:
+        for ts, query in enumerate(["a", "b", "c"]):
+            now.return_value = ts
+            cache.put(query, _plan(query))
+        assert cache.get("a") is None
+        assert cache.get("b") == _plan("b")
+        assert cache.get("c") == _plan("c")
+    cache.close()
+
+
+def test_plan_cache_similarity_lookup(tmp_path):
+    vectors = {"ai news": [1.0, 0.0], "ai headlines": [0.95, 0.05], "cats": [0, 1]}
+    cache = PlanCache(
+        WebSearchPlanStructure, tmp_path / "plans.sqlite3", embed=vectors.__getitem__
+    )
+    cache.put("AI news", _plan())
+    assert cache.get("AI headlines") == _plan()
+    assert cache.get("cats") is None
+    cache.close()
+
+
+def test_plan_cache_embeds_outside_the_lock(tmp_path):
+    locked: list[bool] = []
+
+    def embed(query: str) -> list[float]:
+        locked.append(cache._lock.locked())
+        return [1.0, 0.0]
+
+    cache = PlanCache(WebSearchPlanStructure, tmp_path / "plans.sqlite3", embed=embed)
+    cache.put("ai news", _plan())
+    assert cache.get("ai headlines") == _plan()
+    assert locked == [False, False]
+    cache.close()
+
+
+def test_plan_cache_get_does_not_prune(tmp_path):
+    cache = PlanCache(WebSearchPlanStructure, tmp_path / "plans.sqlite3", ttl_seconds=0)
+    with patch("openai_sdk_helpers.agent.search.plan_cache.time.time") as now:
+        now.return_value = 1000
+        cache.put("ai news", _plan())
+        now.return_value = 1001
+        assert cache.get("ai news") is None
+    count = cache._conn.execute("SELECT COUNT(*) FROM plan_cache").fetchone()[0]
+    assert count == 1
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_web_agent_search_skips_planner_on_cache_hit(cache, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    cache.put("ai news", _plan())
+    search = WebAgentSearch(default_model="gpt-4o-mini", plan_cache=cache)
+    with (
+        patch(
+            "openai_sdk_helpers.agent.search.web.WebAgentPlanner.run_agent",
+            new_callable=AsyncMock,
+        ) as planner,
+        patch(
+            "openai_sdk_helpers.agent.search.web.WebSearchToolAgent.run_agent",
+            new_callable=AsyncMock,
+            return_value=[],
+        ),
+        patch(
+            "openai_sdk_helpers.agent.search.web.WebAgentWriter.run_agent",
+            new_callable=AsyncMock,
+            return_value=MagicMock(),
+        ),
+        patch("openai_sdk_helpers.agent.search.web.WebSearchStructure"),
+    ):
+        await search.run_agent_async("AI news")
+    planner.assert_not_called()
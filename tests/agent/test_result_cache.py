@@ -0,0 +1,59 @@
+"""Tests for the search item result cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from openai_sdk_helpers.agent.search.result_cache import ResultCache
+from openai_sdk_helpers.agent.search.web import WebSearchToolAgent
+from openai_sdk_helpers.structure.web_search import (
+    WebSearchItemResultStructure,
+    WebSearchItemStructure,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    result_cache = ResultCache(WebSearchItemResultStructure, tmp_path / "r.sqlite3")
+    yield result_cache
+    result_cache.close()
+
+
+def test_result_cache_round_trip(cache):
+    result = WebSearchItemResultStructure(text="found")
+    assert cache.get("q", "r") is None
+    cache.put("q", "r", result)
+    assert cache.get("q", "r") == result
+    assert cache.get("q", "other reason") is None
+
+
+def test_result_cache_expires_entries(tmp_path):
+    cache = ResultCache(
+        WebSearchItemResultStructure, tmp_path / "r.sqlite3", ttl_seconds=10
+    )
+    with patch("openai_sdk_helpers.agent.search.result_cache.time.time") as now:
+        now.return_value = 100
+        cache.put("q", "r", WebSearchItemResultStructure(text="found"))
+        now.return_value = 111
+        assert cache.get("q", "r") is None
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_run_search_uses_result_cache(cache):
+    tool = WebSearchToolAgent(default_model="gpt-4o-mini", result_cache=cache)
+    item = WebSearchItemStructure(reason="r", query="q")
+    with patch(
+        "openai_sdk_helpers.agent.base.AgentBase.run_async",
+        new_callable=AsyncMock,
+        return_value="fresh",
+    ) as mock_run:
+        first = await tool.run_search(item)
+        second = await tool.run_search(item)
+        assert mock_run.await_count == 1
+        assert first == second
+
+        await tool.run_search(item, cache=False)
+        assert mock_run.await_count == 2
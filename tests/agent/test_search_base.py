@@ -263,7 +263,7 @@ class TestSearchWriterClass:
             await writer.run_agent("query", results)
 
             context = mock_run.call_args[1]["context"]
-            assert context["search_results"] == results
+            assert sorted(context["search_results"], key=lambda r: r.text) == results
             assert context["original_query"] == "query"
 
 
@@ -344,3 +344,201 @@ class TestSearchAgentErrorHandling:
 
             context = mock_run.call_args[1]["context"]
             assert len(context["search_results"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_tool_agent_propagates_first_search_error() -> None:
+    """Test that a failing search surfaces its own exception type."""
+    tool = TestSearchToolAgent(default_model="gpt-4o-mini")
+    plan = MockPlanStructure(
+        searches=[MockItemStructure(query="ok"), MockItemStructure(query="bad")]
+    )
+
+    async def _search(item: MockItemStructure) -> MockResultStructure:
+        if item.query == "bad":
+            raise ValueError("search failed")
+        return MockResultStructure(text=item.query)
+
+    with patch.object(tool, "run_search", side_effect=_search):
+        with pytest.raises(ValueError, match="search failed"):
+            await tool.run_agent(plan)
+
+
+def test_writer_run_agent_streamed_passes_context() -> None:
+    """Test that streamed report generation receives the search context."""
+    writer = TestSearchWriter(default_model="gpt-4o-mini")
+    results = [MockResultStructure(text="result")]
+
+    with patch("openai_sdk_helpers.agent.search.base.run_streamed") as mock_stream:
+        streamed = writer.run_agent_streamed("query", results)
+
+    assert streamed is mock_stream.return_value
+    context = mock_stream.call_args.kwargs["context"]
+    assert context == {"original_query": "query", "search_results": results}
+
+
+@pytest.mark.asyncio
+async def test_tool_agent_batch_searches_uses_batch_path() -> None:
+    """Test that batch mode hands every plan item to one batch call."""
+    tool = TestSearchToolAgent(default_model="gpt-4o-mini", batch_searches=True)
+    plan = MockPlanStructure(
+        searches=[
+            MockItemStructure(query="a"),
+            MockItemStructure(query="b"),
+            MockItemStructure(query="a"),
+        ]
+    )
+    a, b = MockResultStructure(text="a"), MockResultStructure(text="b")
+
+    with patch.object(
+        tool, "_batch_run_search", new_callable=AsyncMock, return_value=[a, b]
+    ) as mock_batch:
+        assert await tool.run_agent(plan) == [a, b, a]
+    mock_batch.assert_awaited_once_with(plan.searches[:2])
+
+
+@pytest.mark.asyncio
+async def test_tool_agent_default_batch_runs_each_item() -> None:
+    """Test that the default batch implementation runs items individually."""
+    tool = TestSearchToolAgent(default_model="gpt-4o-mini", batch_searches=True)
+    plan = MockPlanStructure(
+        searches=[MockItemStructure(query="a"), MockItemStructure(query="b")]
+    )
+
+    results = await tool.run_agent(plan)
+    assert [result.text for result in results] == ["result for a", "result for b"]
+
+
+@pytest.mark.asyncio
+async def test_tool_agent_rejects_plan_without_searches() -> None:
+    """Test that malformed plans fail loudly instead of yielding no results."""
+    tool = TestSearchToolAgent(default_model="gpt-4o-mini")
+
+    with pytest.raises(AttributeError):
+        await tool.run_agent(object())  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_tool_agent_deduplicates_plan_items() -> None:
+    """Test that identical plan items are searched only once."""
+    tool = TestSearchToolAgent(default_model="gpt-4o-mini")
+    plan = MockPlanStructure(
+        searches=[
+            MockItemStructure(query="a"),
+            MockItemStructure(query="b"),
+            MockItemStructure(query="a"),
+        ]
+    )
+
+    with patch.object(tool, "run_search", wraps=tool.run_search) as mock_search:
+        results = await tool.run_agent(plan)
+
+    assert mock_search.await_count == 2
+    assert [result.text for result in results] == [
+        "result for a",
+        "result for b",
+        "result for a",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_writer_orders_results_deterministically() -> None:
+    """Test that result order does not change the writer context."""
+    writer = TestSearchWriter(default_model="gpt-4o-mini")
+    results = [MockResultStructure(text=f"result {index}") for index in range(5)]
+
+    with patch.object(writer, "run_async", new_callable=AsyncMock) as mock_run:
+        await writer.run_agent("query", results)
+        await writer.run_agent("query", list(reversed(results)))
+
+    first, second = (call.kwargs["context"] for call in mock_run.call_args_list)
+    assert first == second
+    assert sorted(first["search_results"], key=lambda r: r.text) == results
+
+
+@pytest.mark.asyncio
+async def test_tool_agent_limits_concurrency_across_plans() -> None:
+    """Test that concurrent plans share one concurrency limit."""
+    tool = TestSearchToolAgent(default_model="gpt-4o-mini", max_concurrent_searches=2)
+    active = 0
+    peak = 0
+
+    async def _search(item: MockItemStructure) -> MockResultStructure:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return MockResultStructure(text=item.query)
+
+    plans = [
+        MockPlanStructure(
+            searches=[MockItemStructure(query=f"{plan}-{index}") for index in range(3)]
+        )
+        for plan in range(2)
+    ]
+    with patch.object(tool, "run_search", side_effect=_search):
+        await asyncio.gather(*(tool.run_agent(plan) for plan in plans))
+
+    assert peak <= 2
+
+
+def test_tool_agent_semaphore_follows_event_loop() -> None:
+    """Test that the shared semaphore is recreated for a new event loop."""
+    tool = TestSearchToolAgent(default_model="gpt-4o-mini")
+    plan = MockPlanStructure(searches=[MockItemStructure(query="a")])
+
+    asyncio.run(tool.run_agent(plan))
+    first = tool._semaphore
+    asyncio.run(tool.run_agent(plan))
+    assert tool._semaphore is not first
+
+
+@pytest.mark.asyncio
+async def test_tool_agent_stream_yields_in_completion_order() -> None:
+    """Test that streamed results arrive as their searches finish."""
+    tool = TestSearchToolAgent(default_model="gpt-4o-mini")
+    delays = {"slow": 0.05, "fast": 0.0}
+
+    async def _search(item: MockItemStructure) -> MockResultStructure:
+        await asyncio.sleep(delays[item.query])
+        return MockResultStructure(text=item.query)
+
+    plan = MockPlanStructure(
+        searches=[
+            MockItemStructure(query="slow"),
+            MockItemStructure(query="fast"),
+            MockItemStructure(query="fast"),
+        ]
+    )
+    with patch.object(tool, "run_search", side_effect=_search) as mock_search:
+        results = [result async for result in tool.run_agent_stream(plan)]
+
+    assert [result.text for result in results] == ["fast", "slow"]
+    assert mock_search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_tool_agent_stream_waits_for_cancelled_searches() -> None:
+    """Test that closing the stream early lets pending searches unwind."""
+    tool = TestSearchToolAgent(default_model="gpt-4o-mini")
+    cleaned_up: list[str] = []
+
+    async def _search(item: MockItemStructure) -> MockResultStructure:
+        try:
+            if item.query == "slow":
+                await asyncio.sleep(10)
+            return MockResultStructure(text=item.query)
+        finally:
+            cleaned_up.append(item.query)
+
+    plan = MockPlanStructure(
+        searches=[MockItemStructure(query="fast"), MockItemStructure(query="slow")]
+    )
+    with patch.object(tool, "run_search", side_effect=_search):
+        stream = tool.run_agent_stream(plan)
+        first = await stream.__anext__()
+        await stream.aclose()
+
+    assert first.text == "fast"
+    assert sorted(cleaned_up) == ["fast", "slow"]
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from openai_sdk_helpers.agent.summarizer import SummarizerAgent
-from openai_sdk_helpers.agent.translator import TranslatorAgent
-from openai_sdk_helpers.structure import SummaryStructure
+from openai_sdk_helpers.agent.translator import TranslatorAgent, translation_context
+from openai_sdk_helpers.agent.translator_batch import BatchTranslator
+from openai_sdk_helpers.structure import SummaryStructure, TranslationBatchStructure
 
 
 @pytest.mark.anyio
@@ -121,3 +123,134 @@ def test_translator_run_sync_forwards_context():
     )
     fake_result.final_output_as.assert_called_once_with(str)
     assert result == "translated"
+
+
+def test_translator_run_sync_applies_translation_context():
+    """Values from translation_context should reach the prompt context."""
+
+    agent = TranslatorAgent(default_model="gpt-4o-mini")
+    fake_agent = MagicMock()
+    fake_result = MagicMock()
+    fake_result.final_output_as.return_value = "translated"
+
+    with (
+        patch.object(agent, "get_agent", return_value=fake_agent),
+        patch(
+            "openai_sdk_helpers.agent.base.Runner.run", return_value=fake_result
+        ) as mock_run_sync,
+        translation_context({"formality": "formal", "glossary": "none"}),
+    ):
+        agent.run_sync(
+            "Hola", target_language="English", context={"formality": "casual"}
+        )
+
+    mock_run_sync.assert_called_once_with(
+        fake_agent,
+        "Hola",
+        context={
+            "formality": "casual",
+            "glossary": "none",
+            "target_language": "English",
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_translator_run_agent_many_preserves_order():
+    """TranslatorAgent.run_agent_many should translate texts concurrently."""
+
+    agent = TranslatorAgent(default_model="gpt-4o-mini")
+
+    async def _translate(input, context, output_type):
+        return f"{context['target_language']}:{input}"
+
+    with patch.object(agent, "run_async", side_effect=_translate) as mock_run:
+        result = await agent.run_agent_many(
+            ["one", "two", "three"], target_language="French", max_concurrency=2
+        )
+
+    assert result == ["French:one", "French:two", "French:three"]
+    assert mock_run.await_count == 3
+
+
+def test_translator_run_many_sync():
+    """TranslatorAgent.run_many_sync should return translations in order."""
+
+    agent = TranslatorAgent(default_model="gpt-4o-mini")
+
+    with patch.object(
+        agent, "run_async", new_callable=AsyncMock, side_effect=["uno", "dos"]
+    ):
+        result = agent.run_many_sync(["one", "two"], target_language="Spanish")
+
+    assert result == ["uno", "dos"]
+
+
+@pytest.mark.asyncio
+async def test_translator_run_agent_batch_uses_one_run():
+    """TranslatorAgent.run_agent_batch should translate texts in one run."""
+
+    agent = TranslatorAgent(default_model="gpt-4o-mini")
+    output = TranslationBatchStructure(translations=["un", "deux"])
+
+    with patch(
+        "openai_sdk_helpers.agent.translator.run_async",
+        new_callable=AsyncMock,
+        return_value=output,
+    ) as mock_run:
+        result = await agent.run_agent_batch(["one", "two"], "French")
+
+    assert result == ["un", "deux"]
+    mock_run.assert_awaited_once()
+    assert mock_run.call_args.kwargs["input"] == "1. one\n2. two"
+
+
+@pytest.mark.asyncio
+async def test_batch_translator_coalesces_requests():
+    """BatchTranslator should send concurrent requests as one batch."""
+
+    translator = MagicMock()
+    translator.run_agent_batch = AsyncMock(return_value=["un", "deux"])
+    batcher = BatchTranslator(translator, window=0.01)
+
+    result = await asyncio.gather(
+        batcher.translate("one", "French"), batcher.translate("two", "French")
+    )
+
+    assert result == ["un", "deux"]
+    translator.run_agent_batch.assert_awaited_once_with(["one", "two"], "French")
+
+
+@pytest.mark.asyncio
+async def test_batch_translator_propagates_errors():
+    """BatchTranslator should fail every request of a failed batch."""
+
+    translator = MagicMock()
+    translator.run_agent_batch = AsyncMock(side_effect=RuntimeError("boom"))
+    batcher = BatchTranslator(translator, max_batch_size=1)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await batcher.translate("one", "French")
+
+
+@pytest.mark.asyncio
+async def test_batch_translator_cancels_requests_of_cancelled_batch():
+    """BatchTranslator should cancel the requests of a cancelled batch."""
+
+    started = asyncio.Event()
+
+    async def _hang(texts, target_language):
+        started.set()
+        await asyncio.Event().wait()
+
+    translator = MagicMock()
+    translator.run_agent_batch = _hang
+    batcher = BatchTranslator(translator, max_batch_size=1)
+
+    request = asyncio.ensure_future(batcher.translate("one", "French"))
+    await started.wait()
+    for task in list(batcher._tasks):
+        task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await request
@@ -0,0 +1,56 @@
+"""Tests for the translation cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from openai_sdk_helpers.agent.translation_cache import TranslationCache
+from openai_sdk_helpers.agent.translator import TranslatorAgent
+
+
+def test_translation_cache_round_trip():
+    cache = TranslationCache()
+    assert cache.get("Hello", "French", "m") is None
+    cache.put("Hello", "French", "m", "Bonjour")
+    assert cache.get("Hello", "French", "m") == "Bonjour"
+    assert cache.get("Hello", "French", "other") is None
+    assert cache.get("Hello", "German", "m") is None
+
+
+def test_translation_cache_evicts_least_recently_used():
+    cache = TranslationCache(max_entries=2)
+    cache.put("a", "fr", "m", "A")
+    cache.put("b", "fr", "m", "B")
+    cache.get("a", "fr", "m")
+    cache.put("c", "fr", "m", "C")
+    assert cache.get("a", "fr", "m") == "A"
+    assert cache.get("b", "fr", "m") is None
+
+
+def test_translation_cache_persists_between_instances(tmp_path):
+    path = tmp_path / "t.sqlite3"
+    first = TranslationCache(persistent=True, path=path)
+    first.put("Hello", "French", "m", "Bonjour")
+    first.close()
+
+    second = TranslationCache(persistent=True, path=path)
+    assert second.get("Hello", "French", "m") == "Bonjour"
+    second.clear()
+    assert second.get("Hello", "French", "m") is None
+    second.close()
+
+
+@pytest.mark.anyio
+async def test_translator_answers_repeats_from_cache():
+    agent = TranslatorAgent(default_model="gpt-4o-mini", cache=TranslationCache())
+
+    with patch.object(
+        agent, "run_async", new_callable=AsyncMock, return_value="Bonjour"
+    ) as mock_run:
+        assert await agent.run_agent("Hello", "French") == "Bonjour"
+        assert await agent.run_agent("Hello", "French") == "Bonjour"
+        await agent.run_agent("Hello", "French", context={"tone": "formal"})
+
+    assert mock_run.await_count == 2
@@ -0,0 +1,276 @@
+"""Tests for the web search workflow."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from openai_sdk_helpers.agent.search.web import WebAgentSearch
+
+_WEB = "openai_sdk_helpers.agent.search.web"
+
+
+@pytest.fixture
+def stub_stages(monkeypatch):
+    """Replace the LLM-backed stages of the workflow with mocks."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    with (
+        patch(f"{_WEB}.WebAgentPlanner.run_agent", new_callable=AsyncMock),
+        patch(
+            f"{_WEB}.WebSearchToolAgent.run_agent",
+            new_callable=AsyncMock,
+            return_value=[],
+        ),
+        patch(
+            f"{_WEB}.WebAgentWriter.run_agent",
+            new_callable=AsyncMock,
+            return_value=MagicMock(),
+        ),
+        patch(f"{_WEB}.WebSearchStructure"),
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_web_agent_search_reuses_agents(stub_stages):
+    async with WebAgentSearch(default_model="gpt-4o-mini") as search:
+        await search.run_agent_async("first")
+        planner, tool, writer = search._planner, search._tool, search._writer
+        await search.run_agent_async("second")
+        assert search._planner is planner
+        assert search._tool is tool
+        assert search._writer is writer
+    assert search._planner is None
+
+
+@pytest.mark.asyncio
+async def test_web_agent_search_rebuilds_agents_for_new_client(stub_stages):
+    search = WebAgentSearch(default_model="gpt-4o-mini")
+    await search.run_agent_async("first")
+    planner = search._planner
+    search._client = MagicMock()
+    await search.run_agent_async("second")
+    assert search._planner is not planner
+
+
+@pytest.mark.asyncio
+async def test_web_agent_search_streams_writer_events(stub_stages):
+    async def _events():
+        yield "first"
+        yield "second"
+
+    streamed = MagicMock()
+    streamed.stream_events = _events
+    search = WebAgentSearch(default_model="gpt-4o-mini")
+    with patch(
+        f"{_WEB}.WebAgentWriter.run_agent_streamed", return_value=streamed
+    ) as writer:
+        events = [event async for event in search.run_agent_stream("query")]
+    assert events == ["first", "second"]
+    writer.assert_called_once_with("query", [])
+
+
+@pytest.mark.asyncio
+async def test_web_agent_search_stream_keeps_trace_out_of_consumer(stub_stages):
+    from agents import get_current_trace
+
+    traced: list[bool] = []
+
+    async def _events():
+        traced.append(get_current_trace() is not None)
+        yield "first"
+        yield "second"
+
+    streamed = MagicMock()
+    streamed.stream_events = _events
+    search = WebAgentSearch(default_model="gpt-4o-mini")
+    with patch(f"{_WEB}.WebAgentWriter.run_agent_streamed", return_value=streamed):
+        async for _ in search.run_agent_stream("query"):
+            assert get_current_trace() is None
+    assert traced == [True]
+
+
+@pytest.mark.asyncio
+async def test_web_agent_search_stream_propagates_errors(stub_stages):
+    with patch(
+        f"{_WEB}.WebAgentWriter.run_agent_streamed",
+        side_effect=RuntimeError("boom"),
+    ):
+        search = WebAgentSearch(default_model="gpt-4o-mini")
+        with pytest.raises(RuntimeError, match="boom"):
+            async for _ in search.run_agent_stream("query"):
+                pass
+
+
+@pytest.mark.asyncio
+async def test_web_search_tool_batches_items_into_one_run():
+    from openai_sdk_helpers.agent.search.web import WebSearchToolAgent
+    from openai_sdk_helpers.structure.web_search import (
+        WebSearchItemResultStructure,
+        WebSearchItemResultsStructure,
+        WebSearchItemStructure,
+    )
+
+    tool = WebSearchToolAgent(default_model="gpt-4o-mini", batch_searches=True)
+    items = [
+        WebSearchItemStructure(reason="r1", query="q1"),
+        WebSearchItemStructure(reason="r2", query="q2"),
+    ]
+    output = WebSearchItemResultsStructure(
+        item_results=[
+            WebSearchItemResultStructure(text="t1"),
+            WebSearchItemResultStructure(text="t2"),
+        ]
+    )
+    with patch(
+        f"{_WEB}.run_async", new_callable=AsyncMock, return_value=output
+    ) as mock_run:
+        results = await tool._batch_run_search(items)
+
+    assert [result.text for result in results] == ["t1", "t2"]
+    mock_run.assert_awaited_once()
+    kwargs = mock_run.call_args.kwargs
+    assert kwargs["agent"].output_type is WebSearchItemResultsStructure
+    assert "1. q1 (reason: r1)" in kwargs["input"]
+
+
+@pytest.mark.asyncio
+async def test_web_search_tool_batch_falls_back_on_result_count_mismatch():
+    from openai_sdk_helpers.agent.search.web import WebSearchToolAgent
+    from openai_sdk_helpers.structure.web_search import (
+        WebSearchItemResultStructure,
+        WebSearchItemResultsStructure,
+        WebSearchItemStructure,
+    )
+
+    tool = WebSearchToolAgent(default_model="gpt-4o-mini", batch_searches=True)
+    items = [
+        WebSearchItemStructure(reason="r1", query="q1"),
+        WebSearchItemStructure(reason="r2", query="q2"),
+    ]
+    output = WebSearchItemResultsStructure(
+        item_results=[WebSearchItemResultStructure(text="merged")]
+    )
+
+    async def _search(item):
+        return WebSearchItemResultStructure(text=f"single {item.query}")
+
+    with (
+        patch(f"{_WEB}.run_async", new_callable=AsyncMock, return_value=output),
+        patch.object(tool, "run_search", side_effect=_search),
+    ):
+        results = await tool._batch_run_search(items)
+
+    assert [result.text for result in results] == ["single q1", "single q2"]
+
+
+@pytest.mark.asyncio
+async def test_web_search_tool_batch_uses_result_cache(tmp_path):
+    from openai_sdk_helpers.agent.search.result_cache import ResultCache
+    from openai_sdk_helpers.agent.search.web import WebSearchToolAgent
+    from openai_sdk_helpers.structure.web_search import (
+        WebSearchItemResultStructure,
+        WebSearchItemResultsStructure,
+        WebSearchItemStructure,
+    )
+
+    cache = ResultCache(WebSearchItemResultStructure, tmp_path / "results.db")
+    cache.put("q1", "r1", WebSearchItemResultStructure(text="cached"))
+    tool = WebSearchToolAgent(
+        default_model="gpt-4o-mini", batch_searches=True, result_cache=cache
+    )
+    items = [
+        WebSearchItemStructure(reason="r1", query="q1"),
+        WebSearchItemStructure(reason="r2", query="q2"),
+    ]
+    output = WebSearchItemResultsStructure(
+        item_results=[WebSearchItemResultStructure(text="fresh")]
+    )
+    with patch(
+        f"{_WEB}.run_async", new_callable=AsyncMock, return_value=output
+    ) as mock_run:
+        results = await tool._batch_run_search(items)
+        assert [result.text for result in results] == ["cached", "fresh"]
+        assert "q1" not in mock_run.call_args.kwargs["input"]
+
+        again = await tool._batch_run_search(items)
+    assert [result.text for result in again] == ["cached", "fresh"]
+    mock_run.assert_awaited_once()
+    cache.close()
+
+
+def test_coerce_item_result_variants():
+    from openai_sdk_helpers.agent.search.web import WebSearchToolAgent
+    from openai_sdk_helpers.structure.web_search import WebSearchItemResultStructure
+
+    existing = WebSearchItemResultStructure(text="kept")
+    assert WebSearchToolAgent._coerce_item_result(existing) is existing
+
+    first = WebSearchToolAgent._coerce_item_result("No results")
+    assert first.text == "No results"
+    second = WebSearchToolAgent._coerce_item_result("No results")
+    assert second == first
+    assert second is not first
+
+    assert WebSearchToolAgent._coerce_item_result(42).text == "42"
+
+
+def test_has_custom_validators():
+    from pydantic import BaseModel, field_validator
+
+    from openai_sdk_helpers.agent.search.web import _has_custom_validators
+    from openai_sdk_helpers.structure.web_search import WebSearchItemResultStructure
+
+    class _Validated(BaseModel):
+        text: str
+
+        @field_validator("text")
+        @classmethod
+        def _strip(cls, value: str) -> str:
+            return value.strip()
+
+    assert _has_custom_validators(_Validated)
+    assert not _has_custom_validators(WebSearchItemResultStructure)
+
+
+@pytest.mark.asyncio
+async def test_run_search_shares_context_for_repeated_items():
+    from openai_sdk_helpers.agent.search.web import WebSearchToolAgent
+    from openai_sdk_helpers.structure.web_search import WebSearchItemStructure
+
+    tool = WebSearchToolAgent(default_model="gpt-4o-mini")
+    item = WebSearchItemStructure(reason="r", query="q")
+    with patch(
+        "openai_sdk_helpers.agent.base.AgentBase.run_async",
+        new_callable=AsyncMock,
+        return_value="text",
+    ) as mock_run:
+        await tool.run_search(item)
+        await tool.run_search(WebSearchItemStructure(reason="r", query="q"))
+
+    first, second = (call.kwargs["context"] for call in mock_run.call_args_list)
+    assert first is second
+    assert dict(first) == {"search_term": "q", "reason": "r"}
+
+
+@pytest.mark.asyncio
+async def test_web_agent_search_joins_open_trace(stub_stages):
+    search = WebAgentSearch(default_model="gpt-4o-mini")
+    with (
+        patch(f"{_WEB}.get_current_trace", return_value=MagicMock()),
+        patch(f"{_WEB}.trace") as new_trace,
+    ):
+        await search.run_agent_async("query")
+    new_trace.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_web_agent_search_opens_trace_when_none_active(stub_stages):
+    search = WebAgentSearch(default_model="gpt-4o-mini")
+    with (
+        patch(f"{_WEB}.get_current_trace", return_value=None),
+        patch(f"{_WEB}.trace") as new_trace,
+    ):
+        await search.run_agent_async("query")
+    new_trace.assert_called_once()
@@ -7,6 +7,13 @@ from unittest.mock import MagicMock
 import pytest
 
 from openai_sdk_helpers.config import OpenAISettings
+from openai_sdk_helpers.response import base as response_base
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache() -> None:
+    """Drop clients shared between responses so each test sees its own mock."""
+    response_base._CLIENTS.clear()
 
 
 @pytest.fixture
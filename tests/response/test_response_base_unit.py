@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from types import SimpleNamespace
 from typing import Any, cast
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from openai_sdk_helpers.config import OpenAISettings
 from openai_sdk_helpers.response import attach_vector_store
-from openai_sdk_helpers.response.base import BaseResponse
+from openai_sdk_helpers.response.base import (
+    PREWARM_TIMEOUT,
+    BaseResponse,
+    _partition_tool_calls,
+    _system_content,
+    _upload_attachments,
+)
 from openai_sdk_helpers.response.messages import ResponseMessage
 
 
@@ -138,3 +147,452 @@ def test_get_last_message_handles_missing_role(response_base):
     )
 
     assert response_base.get_last_assistant_message() is None
+
+
+def test_partition_tool_calls_groups_consecutive_safe_calls():
+    """Group back-to-back safe calls and isolate every other call."""
+
+    calls = [
+        SimpleNamespace(name=name)
+        for name in ("search", "search", "write", "search", "fetch")
+    ]
+
+    batches = _partition_tool_calls(cast(Any, calls), {"search", "fetch"})
+
+    assert [[call.name for call in batch] for batch in batches] == [
+        ["search", "search"],
+        ["write"],
+        ["search", "fetch"],
+    ]
+
+
+def test_execute_tool_calls_runs_safe_handlers_concurrently(openai_settings):
+    """Run concurrency-safe async handlers together and keep result order."""
+
+    in_flight = 0
+    peak = 0
+
+    async def lookup(call: Any) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return f'{{"id": "{call.call_id}"}}'
+
+    response = BaseResponse(
+        instructions="test instructions",
+        tools=[],
+        output_structure=None,
+        tool_handlers={"lookup": lookup},
+        openai_settings=openai_settings,
+        concurrency_safe_tools={"lookup"},
+    )
+    calls = [SimpleNamespace(name="lookup", call_id=str(i)) for i in range(3)]
+
+    results = asyncio.run(response._execute_tool_calls(cast(Any, calls)))
+
+    assert results == ['{"id": "0"}', '{"id": "1"}', '{"id": "2"}']
+    assert peak == 3
+
+
+def test_execute_tool_calls_rejects_unknown_tool(response_base):
+    """Raise before running any handler when a tool is not registered."""
+
+    with pytest.raises(ValueError):
+        asyncio.run(
+            response_base._execute_tool_calls(
+                cast(Any, [SimpleNamespace(name="missing")])
+            )
+        )
+
+
+def test_responses_share_client_for_same_settings(openai_settings):
+    """Reuse one client for responses built from identical settings."""
+
+    def build(settings: OpenAISettings) -> BaseResponse:
+        return BaseResponse(
+            instructions="test instructions",
+            tools=[],
+            output_structure=None,
+            tool_handlers={},
+            openai_settings=settings,
+        )
+
+    with patch.object(
+        OpenAISettings, "create_client", side_effect=lambda: MagicMock()
+    ) as create_client:
+        first = build(openai_settings)
+        second = build(openai_settings.model_copy())
+        custom = build(
+            openai_settings.model_copy(
+                update={"extra_client_kwargs": {"default_headers": {"X": "1"}}}
+            )
+        )
+
+    assert first._client is second._client
+    assert custom._client is not first._client
+    assert create_client.call_count == 2
+
+
+def test_run_sync_inside_running_loop_uses_background_loop(response_base):
+    """Hand run_sync calls made under a running loop to the shared loop."""
+
+    async def fake_run_async(content: Any, attachments: Any = None) -> str:
+        return threading.current_thread().name
+
+    async def main() -> Any:
+        return response_base.run_sync("hello")
+
+    with patch.object(response_base, "run_async", side_effect=fake_run_async):
+        first = asyncio.run(main())
+        second = asyncio.run(main())
+
+    assert first == second == "openai-sdk-helpers-loop"
+
+
+def test_response_cache_reuses_identical_requests(openai_settings):
+    """Skip the API call when an identical request was already answered."""
+
+    cache: dict[str, Any] = {}
+
+    def build() -> BaseResponse:
+        return BaseResponse(
+            instructions="test instructions",
+            tools=[],
+            output_structure=None,
+            tool_handlers={},
+            openai_settings=openai_settings,
+            response_cache=cache,
+        )
+
+    first = build()
+    api_response = SimpleNamespace(output=[MagicMock()], output_text="")
+    first._client.responses.create.return_value = api_response
+
+    asyncio.run(first.run_async("hello"))
+    asyncio.run(build().run_async("hello"))
+    asyncio.run(build().run_async("something else"))
+
+    assert len(cache) == 2
+    assert first._client.responses.create.call_count == 2
+
+
+def test_run_async_saves_once_per_run(openai_settings):
+    """Coalesce the saves for every message added during one run."""
+
+    from openai.types.responses.response_function_tool_call import (
+        ResponseFunctionToolCall,
+    )
+
+    calls = [
+        ResponseFunctionToolCall(
+            type="function_call", call_id=str(i), name="echo", arguments="{}"
+        )
+        for i in range(3)
+    ]
+    response_base = BaseResponse(
+        instructions="test instructions",
+        tools=[],
+        output_structure=None,
+        tool_handlers={"echo": lambda call: {"id": call.call_id}},
+        openai_settings=openai_settings,
+    )
+    response_base._client.responses.create.return_value = SimpleNamespace(output=calls)
+
+    with (
+        patch.object(response_base, "save") as save,
+        patch("builtins.print"),
+    ):
+        asyncio.run(response_base.run_async("hello"))
+
+    save.assert_called_once_with()
+    assert len(response_base.messages.messages) == 2 + 2 * len(calls)
+
+
+def test_handler_table_classifies_handlers_once(openai_settings):
+    """Record at construction whether each handler is a coroutine function."""
+
+    async def async_handler(call: Any) -> str:
+        return "{}"
+
+    response = BaseResponse(
+        instructions="test instructions",
+        tools=[],
+        output_structure=None,
+        tool_handlers={"a": async_handler, "s": lambda call: "{}"},
+        openai_settings=openai_settings,
+    )
+
+    assert response._handler_table == {
+        "a": (async_handler, True),
+        "s": (response._tool_handlers["s"], False),
+    }
+
+
+def test_upload_attachments_runs_concurrently_in_order():
+    """Upload attachments in parallel and return results in input order."""
+
+    barrier = threading.Barrier(3, timeout=5)
+    storage = MagicMock()
+
+    def upload_file(path: str) -> SimpleNamespace:
+        barrier.wait()  # Deadlocks unless all three uploads run together.
+        return SimpleNamespace(id=f"file-{path}")
+
+    storage.upload_file.side_effect = upload_file
+
+    uploaded = asyncio.run(_upload_attachments(storage, ["a", "b", "c"]))
+
+    assert [item.id for item in uploaded] == ["file-a", "file-b", "file-c"]
+
+
+def test_tools_are_copied_and_file_search_tracked(openai_settings):
+    """Keep the caller's tools list intact and track file_search once."""
+
+    tools: list[dict[str, Any]] = [{"type": "function", "name": "lookup"}]
+    response = BaseResponse(
+        instructions="test instructions",
+        tools=tools,
+        output_structure=None,
+        tool_handlers={},
+        openai_settings=openai_settings,
+    )
+    assert response._has_file_search is False
+
+    response._client.vector_stores.list.return_value.data = [
+        SimpleNamespace(id="vs_1", name="store-one"),
+    ]
+    attach_vector_store(response, "store-one")
+
+    assert response._has_file_search is True
+    assert tools == [{"type": "function", "name": "lookup"}]
+
+
+def test_streamed_safe_tool_starts_before_response_completes(openai_settings):
+    """Start concurrency-safe handlers while the stream is still open."""
+
+    from openai.types.responses.response_function_tool_call import (
+        ResponseFunctionToolCall,
+    )
+
+    call = ResponseFunctionToolCall(
+        type="function_call", call_id="0", name="lookup", arguments="{}"
+    )
+    handler_started = threading.Event()
+
+    async def lookup(call: Any) -> str:
+        handler_started.set()
+        return '{"ok": true}'
+
+    class FakeStream:
+        def __enter__(self) -> FakeStream:
+            return self
+
+        def __exit__(self, *exc: Any) -> None:
+            return None
+
+        def __iter__(self):
+            yield SimpleNamespace(type="response.output_item.done", item=call)
+            assert handler_started.wait(timeout=5)
+            yield SimpleNamespace(type="response.completed")
+
+        def get_final_response(self) -> Any:
+            return SimpleNamespace(output=[call])
+
+    response = BaseResponse(
+        instructions="test instructions",
+        tools=[],
+        output_structure=None,
+        tool_handlers={"lookup": lookup},
+        openai_settings=openai_settings,
+        concurrency_safe_tools={"lookup"},
+        stream=True,
+    )
+    response._client.responses.stream.return_value = FakeStream()
+
+    with patch("builtins.print"):
+        result = asyncio.run(response.run_async("hello"))
+
+    assert result == {"ok": True}
+    response._client.responses.create.assert_not_called()
+
+
+def test_save_target_is_resolved_once(response_base, tmp_path):
+    """Reuse the resolved save target until the save location changes."""
+
+    response_base._save_path = tmp_path
+    target = response_base._get_save_target()
+
+    assert target == tmp_path / f"{response_base.uuid}.json"
+    assert response_base._get_save_target() is target
+
+    response_base._save_path = tmp_path / "session.json"
+    assert response_base._get_save_target() == tmp_path / "session.json"
+
+
+def test_sessions_share_system_content(openai_settings):
+    """Reuse one system content list for sessions with the same instructions."""
+
+    def build() -> BaseResponse:
+        return BaseResponse(
+            instructions="shared instructions",
+            tools=[],
+            output_structure=None,
+            tool_handlers={},
+            openai_settings=openai_settings,
+        )
+
+    first, second = build(), build()
+
+    content = _system_content("shared instructions")
+    assert first.messages.messages[0].content["content"] is content
+    assert second.messages.messages[0].content["content"] is content
+
+
+def test_build_input_processes_content_off_the_loop(openai_settings):
+    """Run the process_content callback on a worker thread."""
+
+    threads: list[threading.Thread] = []
+
+    def process(text: str) -> tuple[str, list[str]]:
+        threads.append(threading.current_thread())
+        return text.upper(), []
+
+    response = BaseResponse(
+        instructions="test instructions",
+        tools=[],
+        output_structure=None,
+        tool_handlers={},
+        openai_settings=openai_settings,
+        process_content=process,
+    )
+
+    asyncio.run(response._build_input(["a", "b"]))
+
+    assert threads and threading.main_thread() not in threads
+    user_messages = [m for m in response.messages.messages if m.role == "user"]
+    assert [m.content["content"][0]["text"] for m in user_messages] == ["A", "B"]
+
+
+def test_new_client_is_prewarmed_once(openai_settings, mock_openai_client):
+    """Send one background preflight request per newly created client."""
+
+    mock_openai_client.base_url = "https://api.example.test/v1/"
+
+    def build() -> BaseResponse:
+        return BaseResponse(
+            instructions="test instructions",
+            tools=[],
+            output_structure=None,
+            tool_handlers={},
+            openai_settings=openai_settings,
+        )
+
+    with patch("openai_sdk_helpers.response.base.threading.Thread") as thread_cls:
+        build()
+        build()
+
+    thread_cls.assert_called_once()
+    thread_cls.call_args.kwargs["target"]()
+    mock_openai_client._client.head.assert_called_once_with(
+        "https://api.example.test/v1/", timeout=PREWARM_TIMEOUT
+    )
+
+
+def test_concurrent_runs_overlap_api_requests(openai_settings):
+    """Send the API request off the event loop so sessions overlap."""
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def create(**kwargs: Any) -> Any:
+        barrier.wait()
+        return SimpleNamespace(output=[])
+
+    def build() -> BaseResponse:
+        return BaseResponse(
+            instructions="test instructions",
+            tools=[],
+            output_structure=None,
+            tool_handlers={},
+            openai_settings=openai_settings,
+        )
+
+    first, second = build(), build()
+    first._client.responses.create.side_effect = create
+
+    async def main() -> list[Any]:
+        return await asyncio.gather(
+            first.run_async("a"), second.run_async("b"), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+
+    assert all(
+        isinstance(result, RuntimeError) and "No output" in str(result)
+        for result in results
+    )
+
+
+def test_tool_handler_may_return_json_bytes(openai_settings):
+    """Decode JSON bytes from a handler without re-encoding the result."""
+
+    from openai.types.responses.response_function_tool_call import (
+        ResponseFunctionToolCall,
+    )
+
+    call = ResponseFunctionToolCall(
+        type="function_call", call_id="0", name="lookup", arguments="{}"
+    )
+    response = BaseResponse(
+        instructions="test instructions",
+        tools=[],
+        output_structure=None,
+        tool_handlers={"lookup": lambda call: b'{"ok": true}'},
+        openai_settings=openai_settings,
+    )
+    response._client.responses.create.return_value = SimpleNamespace(output=[call])
+
+    with patch("builtins.print"):
+        result = asyncio.run(response.run_async("hello"))
+
+    assert result == {"ok": True}
+    assert response.messages.messages[-1].content["output"] == '{"ok": true}'
+
+
+def test_cacheable_tool_results_are_reused(openai_settings):
+    """Skip handlers of cacheable tools for repeated arguments."""
+
+    calls: list[str] = []
+
+    def lookup(call: Any) -> dict[str, str]:
+        calls.append(call.arguments)
+        return {"value": call.arguments}
+
+    response = BaseResponse(
+        instructions="test instructions",
+        tools=[],
+        output_structure=None,
+        tool_handlers={"lookup": lookup, "write": lookup},
+        openai_settings=openai_settings,
+        cacheable_tools={"lookup"},
+    )
+
+    def call(name: str, arguments: str) -> Any:
+        return SimpleNamespace(name=name, call_id="0", arguments=arguments)
+
+    results = asyncio.run(
+        response._execute_tool_calls(
+            [
+                call("lookup", '{"q": 1}'),
+                call("lookup", '{"q": 1}'),
+                call("lookup", '{"q": 2}'),
+                call("write", '{"q": 1}'),
+                call("write", '{"q": 1}'),
+            ]
+        )
+    )
+
+    assert calls == ['{"q": 1}', '{"q": 2}', '{"q": 1}', '{"q": 1}']
+    assert results[1] == results[0] == {"value": '{"q": 1}'}
+    assert results[1] is not results[0]
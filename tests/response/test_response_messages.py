@@ -0,0 +1,65 @@
+"""Tests for the ResponseMessages container."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from openai_sdk_helpers.response.messages import ResponseMessage, ResponseMessages
+
+
+def _user(text: str) -> dict:
+    return {"role": "user", "content": text}
+
+
+def test_to_openai_payload_converts_only_new_messages():
+    """Convert each message once across successive payload builds."""
+
+    messages = ResponseMessages()
+    messages.add_user_message(_user("first"))
+    first = messages.messages[0]
+    first.to_openai_format = MagicMock(wraps=first.to_openai_format)
+
+    assert messages.to_openai_payload() == [_user("first")]
+    messages.add_assistant_message(MagicMock(), {})
+    messages.add_user_message(_user("second"))
+
+    assert messages.to_openai_payload() == [_user("first"), _user("second")]
+    first.to_openai_format.assert_called_once()
+
+
+def test_to_openai_payload_rebuilds_after_history_changes():
+    """Rebuild the payload when messages are removed or replaced."""
+
+    messages = ResponseMessages()
+    messages.add_user_message(_user("first"))
+    messages.add_user_message(_user("second"))
+    payload = messages.to_openai_payload()
+    payload.append(_user("not stored"))
+
+    messages.messages.pop()
+    assert messages.to_openai_payload() == [_user("first")]
+
+    messages.messages = [ResponseMessage(role="user", content=_user("fresh"))]
+    assert messages.to_openai_payload() == [_user("fresh")]
+
+
+def test_to_json_serializes_each_message_once():
+    """Reuse serialized messages across saves and match the generic output."""
+
+    messages = ResponseMessages()
+    messages.add_user_message(_user("first"))
+    first = messages.messages[0]
+    first.to_json = MagicMock(wraps=first.to_json)
+
+    messages.to_json()
+    messages.add_user_message(_user("second"))
+    serialized = messages.to_json()
+
+    first.to_json.assert_called_once()
+    assert serialized == {
+        "messages": [message.to_json() for message in messages.messages]
+    }
+    assert [m["content"] for m in serialized["messages"]] == [
+        _user("first"),
+        _user("second"),
+    ]
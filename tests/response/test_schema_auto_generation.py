@@ -130,3 +130,26 @@ def test_schema_used_only_when_no_tools(openai_settings):
         call_kwargs = mock_create.call_args[1]
         assert "text" not in call_kwargs
         assert "tools" in call_kwargs
+
+
+def test_response_format_built_once_per_session(openai_settings):
+    """Reuse the response format computed at construction for every request."""
+    instance = BaseResponse(
+        instructions="Test instructions",
+        tools=None,
+        output_structure=DummyOutputStructure,
+        tool_handlers={},
+        openai_settings=openai_settings,
+    )
+
+    with (
+        patch.object(DummyOutputStructure, "response_format") as response_format,
+        patch.object(instance._client.responses, "create") as mock_create,
+    ):
+        mock_create.return_value = Mock(output=[])
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                instance.run_sync("Test content")
+
+    response_format.assert_not_called()
+    assert mock_create.call_args[1]["text"] == DummyOutputStructure.response_format()
@@ -0,0 +1,69 @@
+"""Tests for tool call helpers."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from openai_sdk_helpers.response.tool_call import (
+    loads_json,
+    parse_tool_arguments,
+    serialize_tool_result,
+)
+
+
+class _Item(BaseModel):
+    """Sample tool result model."""
+
+    name: str
+    score: float
+
+
+def test_loads_json_matches_stdlib():
+    assert loads_json('{"a": [1, 2.5, null, "x"]}') == {"a": [1, 2.5, None, "x"]}
+    assert loads_json(bytearray(b'{"a": 1}')) == {"a": 1}
+    assert loads_json("NaN") != loads_json("NaN")  # stdlib-only literal
+    with pytest.raises(json.JSONDecodeError):
+        loads_json("{not json")
+
+
+def test_parse_tool_arguments_accepts_single_quotes():
+    """Fall back to literal_eval for Python-style dictionaries."""
+    assert parse_tool_arguments("{'key': 'value'}") == {"key": "value"}
+
+
+def test_parse_tool_arguments_rejects_garbage():
+    """Raise ValueError when arguments cannot be parsed."""
+    with pytest.raises(ValueError):
+        parse_tool_arguments("not json")
+
+
+def test_serialize_tool_result_passes_strings_through():
+    """Return strings unchanged."""
+    assert serialize_tool_result('{"a": 1}') == '{"a": 1}'
+
+
+def test_serialize_tool_result_plain_values():
+    """Serialize dictionaries with the json module."""
+    assert json.loads(serialize_tool_result({"a": [1, 2]})) == {"a": [1, 2]}
+
+
+def test_serialize_tool_result_models():
+    """Serialize Pydantic models and lists of models."""
+    item = _Item(name="a", score=1.5)
+    assert json.loads(serialize_tool_result(item)) == {"name": "a", "score": 1.5}
+    assert json.loads(serialize_tool_result([item, item])) == [
+        {"name": "a", "score": 1.5},
+        {"name": "a", "score": 1.5},
+    ]
+
+
+def test_serialize_tool_result_falls_back_for_helper_types():
+    """Serialize non-string keys and helper types such as paths."""
+    assert json.loads(serialize_tool_result({1: "one"})) == {"1": "one"}
+    assert json.loads(serialize_tool_result({"path": Path("/tmp/x")})) == {
+        "path": "/tmp/x"
+    }
@@ -145,3 +145,23 @@ def test_execute_forwards_task_context_alongside_history():
 
     assert validator_call[2] == ["tool: safety-check", "scoped"]
     assert "tool: safety-check" in validator_call[1]
+
+
+def test_execute_accepts_string_registry_keys():
+    """Resolve registries keyed by enum values or member names."""
+
+    plan = PlanStructure(
+        tasks=[
+            TaskStructure(task_type=AgentEnum.DESIGNER, prompt="Design agent"),
+            TaskStructure(task_type=AgentEnum.BUILDER, prompt="Build agent"),
+        ]
+    )
+
+    results = plan.execute(
+        {
+            "AgentDesigner": lambda prompt: "design",
+            "BUILDER": lambda prompt: "build",
+        }
+    )
+
+    assert results == ["design", "build"]
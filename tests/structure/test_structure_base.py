@@ -119,6 +119,18 @@ def test_convenience_wrappers_for_response_helpers():
     assert completion_format == expected_format
 
 
+def test_response_format_is_cached_per_class():
+    """Build the response format once per structure class."""
+
+    class ChildStructure(DummyStructure):
+        extra: Optional[str] = Field(None, description="An extra field.")
+
+    assert DummyStructure.response_format() is DummyStructure.response_format()
+    child_format = ChildStructure.response_format()
+    assert child_format is not DummyStructure.response_format()
+    assert child_format["format"]["name"] == "ChildStructure"
+
+
 def test_to_json():
     """Test the to_json method."""
     instance = DummyStructure(name="Test", age=42, color=Color.RED, tags=["a", "b"])
@@ -152,6 +164,16 @@ def test_spec_field_allow_null_false():
     assert field.description is None
 
 
+def test_from_raw_input_accepts_json():
+    """Decode JSON text and bytes before validating them."""
+    payload = '{"name": "Test", "age": 42, "color": "red"}'
+
+    for data in (payload, payload.encode()):
+        instance = DummyStructure.from_raw_input(data)
+        assert instance.name == "Test"
+        assert instance.color == Color.RED
+
+
 def test_from_raw_input(caplog):
     """Test the from_raw_input method."""
     # Test with valid string enum value
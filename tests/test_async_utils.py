@@ -1,12 +1,18 @@
 """Tests for async utilities module."""
 
 import asyncio
+import contextvars
+import threading
+from unittest.mock import patch
 
 import pytest
 
 from openai_sdk_helpers.async_utils import (
+    run_coroutine_in_background,
+    run_coroutine_in_thread_runner,
     run_coroutine_thread_safe,
     run_coroutine_with_fallback,
+    shutdown_sync_runner,
 )
 from openai_sdk_helpers.errors import AsyncExecutionError
 
@@ -72,3 +78,103 @@ class TestAsyncUtils:
         result = run_coroutine_thread_safe(returns_dict())
         assert isinstance(result, dict)
         assert result["key"] == 42
+
+    def test_run_coroutine_in_background_reuses_loop(self) -> None:
+        """Should run successive coroutines on the same background loop."""
+
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        first = run_coroutine_in_background(current_loop())
+        second = run_coroutine_in_background(current_loop())
+        assert first is second
+        assert first.is_running()
+
+    @pytest.mark.asyncio
+    async def test_run_coroutine_in_background_from_running_loop(self) -> None:
+        """Should not nest when called while another loop is running."""
+
+        async def sample_coro() -> str:
+            await asyncio.sleep(0.01)
+            return "result"
+
+        assert run_coroutine_in_background(sample_coro()) == "result"
+
+    def test_run_coroutine_in_background_nested(self) -> None:
+        """Should fall back to a thread when called from the background loop."""
+
+        async def inner() -> str:
+            return "inner"
+
+        async def outer() -> str:
+            return run_coroutine_in_background(inner())
+
+        assert run_coroutine_in_background(outer()) == "inner"
+
+    def test_run_coroutine_in_background_timeout(self) -> None:
+        """Should raise AsyncExecutionError on timeout."""
+
+        async def slow_coro() -> None:
+            await asyncio.sleep(10)
+
+        with pytest.raises(AsyncExecutionError, match="timed out"):
+            run_coroutine_in_background(slow_coro(), timeout=0.1)
+
+    def test_run_coroutine_in_thread_runner_reuses_loop(self) -> None:
+        """Should reuse the thread's loop until the runners are shut down."""
+
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        first = run_coroutine_in_thread_runner(current_loop())
+        assert run_coroutine_in_thread_runner(current_loop()) is first
+
+        shutdown_sync_runner()
+        assert first.is_closed()
+        assert run_coroutine_in_thread_runner(current_loop()) is not first
+
+    def test_run_coroutine_in_thread_runner_closes_worker_thread_loops(self) -> None:
+        """Should not keep a loop alive for threads other than the main one."""
+        loops: list[asyncio.AbstractEventLoop] = []
+
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        def worker() -> None:
+            loops.append(run_coroutine_in_thread_runner(current_loop()))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert loops[0].is_closed()
+
+    def test_run_coroutine_in_thread_runner_sees_current_context(self) -> None:
+        """Should run each call in the caller's current context."""
+        var: contextvars.ContextVar[str] = contextvars.ContextVar(
+            "var", default="unset"
+        )
+
+        async def read_var() -> str:
+            return var.get()
+
+        assert run_coroutine_in_thread_runner(read_var()) == "unset"
+        token = var.set("set")
+        try:
+            assert run_coroutine_in_thread_runner(read_var()) == "set"
+        finally:
+            var.reset(token)
+
+    def test_run_coroutine_in_background_nested_without_timeout(self) -> None:
+        """Should pass an explicit None timeout through on the nested path."""
+
+        async def outer() -> float | None:
+            with patch(
+                "openai_sdk_helpers.async_utils.run_coroutine_thread_safe",
+                return_value=None,
+            ) as thread_safe:
+                coro = asyncio.sleep(0)
+                run_coroutine_in_background(coro, timeout=None)
+                coro.close()
+            return thread_safe.call_args.kwargs["timeout"]
+
+        assert run_coroutine_in_background(outer()) is None
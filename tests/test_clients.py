@@ -0,0 +1,65 @@
+"""Tests for shared OpenAI clients."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from openai import DEFAULT_CONNECTION_LIMITS, DefaultAsyncHttpxClient
+
+from openai_sdk_helpers._clients import (
+    DEFAULT_POOL_LIMITS,
+    _build_client,
+    _build_http_client,
+    get_async_openai,
+)
+
+
+@pytest.fixture(autouse=True)
+def _api_key(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+
+def test_get_async_openai_reuses_client_per_loop():
+    async def _pair():
+        return get_async_openai(), get_async_openai()
+
+    first, second = asyncio.run(_pair())
+    assert first is second
+
+    other, _ = asyncio.run(_pair())
+    assert other is not first
+
+
+def test_get_async_openai_without_running_loop():
+    assert get_async_openai() is get_async_openai()
+
+
+def test_build_http_client_uses_aiohttp_when_requested(monkeypatch):
+    monkeypatch.setenv("OPENAI_SDK_HELPERS_AIOHTTP", "1")
+    aiohttp_client = MagicMock()
+    with patch("openai.DefaultAioHttpClient", aiohttp_client, create=True):
+        assert _build_http_client() is aiohttp_client.return_value
+
+
+def test_build_http_client_falls_back_without_aiohttp(monkeypatch):
+    monkeypatch.setenv("OPENAI_SDK_HELPERS_AIOHTTP", "1")
+    unavailable = MagicMock(side_effect=RuntimeError("aiohttp extra missing"))
+    with patch("openai.DefaultAioHttpClient", unavailable, create=True):
+        client = _build_http_client()
+    assert client is not unavailable.return_value
+
+
+def test_build_client_uses_pooled_sdk_http_client():
+    with patch(
+        "openai_sdk_helpers._clients.DefaultAsyncHttpxClient",
+        wraps=DefaultAsyncHttpxClient,
+    ) as client_cls:
+        client = _build_client()
+
+    assert isinstance(client._client, DefaultAsyncHttpxClient)
+    limits = client_cls.call_args.kwargs["limits"]
+    assert type(limits) is type(DEFAULT_CONNECTION_LIMITS)
+    assert limits.max_connections == DEFAULT_POOL_LIMITS["max_connections"]
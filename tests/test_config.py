@@ -1,5 +1,8 @@
+from unittest.mock import MagicMock
+
 import pytest
 
+from openai_sdk_helpers._clients import DEFAULT_POOL_LIMITS, _get_ssl_context
 from openai_sdk_helpers.config import OpenAISettings
 
 
@@ -88,6 +91,52 @@ def test_create_client_uses_kwargs(monkeypatch):
     assert client.max_retries == 3
 
 
+def test_create_client_reuses_ssl_context(monkeypatch):
+    openai_cls = MagicMock()
+    http_client_cls = MagicMock()
+    monkeypatch.setattr("openai_sdk_helpers.config.OpenAI", openai_cls)
+    monkeypatch.setattr("openai_sdk_helpers.config.DefaultHttpxClient", http_client_cls)
+    settings = OpenAISettings(api_key="key")
+
+    settings.create_client()
+    settings.create_client()
+
+    assert [call.kwargs["verify"] for call in http_client_cls.call_args_list] == [
+        _get_ssl_context(),
+        _get_ssl_context(),
+    ]
+    assert openai_cls.call_args.kwargs["http_client"] is http_client_cls.return_value
+
+
+def test_create_client_applies_pool_limits(monkeypatch):
+    monkeypatch.setattr("openai_sdk_helpers.config.OpenAI", MagicMock())
+    http_client_cls = MagicMock()
+    monkeypatch.setattr("openai_sdk_helpers.config.DefaultHttpxClient", http_client_cls)
+    settings = OpenAISettings(api_key="key", pool_kwargs={"max_connections": 32})
+
+    settings.create_client()
+
+    limits = http_client_cls.call_args.kwargs["limits"]
+    assert limits.max_connections == 32
+    assert (
+        limits.max_keepalive_connections
+        == DEFAULT_POOL_LIMITS["max_keepalive_connections"]
+    )
+
+
+def test_create_client_keeps_explicit_http_client(monkeypatch):
+    openai_cls = MagicMock()
+    monkeypatch.setattr("openai_sdk_helpers.config.OpenAI", openai_cls)
+    http_client = object()
+    settings = OpenAISettings(
+        api_key="key", extra_client_kwargs={"http_client": http_client}
+    )
+
+    settings.create_client()
+
+    assert openai_cls.call_args.kwargs["http_client"] is http_client
+
+
 def test_extra_client_kwargs_do_not_mutate_source():
     extra = {"default_headers": {"X-Trace": "abc"}}
     settings = OpenAISettings(api_key="key", extra_client_kwargs=extra)
@@ -1,13 +1,17 @@
 """Tests for context manager utilities module."""
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from openai_sdk_helpers.context_manager import (
+    _IS_COROUTINE_CLOSE,
     AsyncManagedResource,
     ManagedResource,
     ensure_closed,
     ensure_closed_async,
 )
+from openai_sdk_helpers.logging_config import LoggerFactory
 
 
 class TestResource(ManagedResource):
@@ -76,6 +80,17 @@ class TestManagedResource:
         resource.close()
         assert resource.close_called == 2
 
+    def test_slotted_subclass_has_no_instance_dict(self) -> None:
+        """Subclasses declaring __slots__ should not carry a __dict__."""
+
+        class SlottedResource(ManagedResource):
+            __slots__ = ("connection",)
+
+            def __init__(self) -> None:
+                self.connection = object()
+
+        assert not hasattr(SlottedResource(), "__dict__")
+
 
 class TestAsyncManagedResource:
     """Test asynchronous resource management."""
@@ -114,6 +129,19 @@ class TestAsyncManagedResource:
             async with resource:
                 raise RuntimeError("Test error")
 
+    @pytest.mark.asyncio
+    async def test_aclose_all_closes_every_resource(self) -> None:
+        """Should close all resources even when one of them fails."""
+
+        class FailingResource(AsyncManagedResource):
+            async def close(self) -> None:
+                raise RuntimeError("Close failed")
+
+        resources = [TestAsyncResource(), FailingResource(), TestAsyncResource()]
+        await AsyncManagedResource.aclose_all(resources)
+        assert resources[0].closed
+        assert resources[2].closed
+
 
 class TestEnsureClosed:
     """Test ensure_closed helper."""
@@ -155,6 +183,22 @@ class TestEnsureClosed:
         resource = FailingResource()
         ensure_closed(resource)  # Should not raise
 
+    def test_logs_cleanup_error_with_deferred_formatting(self) -> None:
+        """Should pass the exception as an argument rather than preformatting."""
+
+        class FailingResource:
+            def close(self):
+                raise RuntimeError("Close failed")
+
+        logger = MagicMock()
+        with patch.object(LoggerFactory, "get_logger", return_value=logger):
+            ensure_closed(FailingResource())
+
+        message, name, exc = logger.warning.call_args.args
+        assert message == "Error closing %s: %s"
+        assert name == "FailingResource"
+        assert isinstance(exc, RuntimeError)
+
 
 class TestEnsureClosedAsync:
     """Test ensure_closed_async helper."""
@@ -204,3 +248,14 @@ class TestEnsureClosedAsync:
 
         resource = FailingResource()
         await ensure_closed_async(resource)  # Should not raise
+
+    @pytest.mark.asyncio
+    async def test_caches_coroutine_check_per_class(self) -> None:
+        """Should remember whether a class's close method is async."""
+
+        class AsyncCloseableResource:
+            async def close(self):
+                pass
+
+        await ensure_closed_async(AsyncCloseableResource())
+        assert _IS_COROUTINE_CLOSE[AsyncCloseableResource.close] is True
@@ -31,3 +31,25 @@ def test_top_level_exports():
 
     assert hasattr(sdk, "AgentBase")
     assert hasattr(sdk, "BaseResponse")
+
+
+def test_top_level_exports_are_lazy():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, openai_sdk_helpers as sdk;"
+        "assert 'openai_sdk_helpers.agent' not in sys.modules;"
+        "sdk.AgentBase;"
+        "assert 'openai_sdk_helpers.agent' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_unknown_top_level_attribute_raises():
+    import pytest
+
+    import openai_sdk_helpers as sdk
+
+    with pytest.raises(AttributeError):
+        sdk.DoesNotExist
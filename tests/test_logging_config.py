@@ -1,6 +1,7 @@
 """Tests for logging configuration module."""
 
 import logging
+from unittest.mock import patch
 
 import pytest
 
@@ -53,3 +54,10 @@ class TestLoggerFactory:
         LoggerFactory.configure()
         logger = LoggerFactory.get_logger("no_propagate")
         assert logger.propagate is False
+
+    def test_get_logger_caches_configured_logger(self) -> None:
+        """Repeat lookups should not reach logging.getLogger."""
+        logger = LoggerFactory.get_logger("cached")
+        with patch.object(logging, "getLogger") as get_logger:
+            assert LoggerFactory.get_logger("cached") is logger
+        get_logger.assert_not_called()
@@ -0,0 +1,36 @@
+"""Tests for optional uvloop installation."""
+
+from __future__ import annotations
+
+import sys
+import types
+
+import pytest
+
+from openai_sdk_helpers import _loop
+
+
+@pytest.fixture(autouse=True)
+def _reset_installed(monkeypatch):
+    monkeypatch.setattr(_loop, "_installed", False)
+
+
+def test_install_uvloop_skips_windows(monkeypatch):
+    monkeypatch.setattr(_loop.sys, "platform", "win32")
+    assert _loop.install_uvloop() is False
+
+
+def test_install_uvloop_without_package(monkeypatch):
+    monkeypatch.setattr(_loop.sys, "platform", "linux")
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    assert _loop.install_uvloop() is False
+
+
+def test_install_uvloop_installs_once(monkeypatch):
+    calls = []
+    fake = types.SimpleNamespace(install=lambda: calls.append(True))
+    monkeypatch.setattr(_loop.sys, "platform", "linux")
+    monkeypatch.setitem(sys.modules, "uvloop", fake)
+    assert _loop.install_uvloop() is True
+    assert _loop.install_uvloop() is True
+    assert calls == [True]
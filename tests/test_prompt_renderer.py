@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from openai_sdk_helpers.prompt import PromptRenderer
+from openai_sdk_helpers.prompt import base as prompt_base
 
 
 def test_prompt_renderer_renders_template(tmp_path):
@@ -56,3 +61,76 @@ def test_prompt_renderer_ships_builtin_templates():
     content = template_path.read_text().strip()
 
     assert "summarize" in content.lower()
+
+
+def test_prompt_renderer_shares_environment_and_reloads(tmp_path):
+    template_file = tmp_path / "cached.jinja"
+    template_file.write_text("First {{ name }}")
+
+    first = PromptRenderer(base_dir=tmp_path)
+    second = PromptRenderer(base_dir=tmp_path)
+    assert first._env is second._env
+    assert first.render("cached.jinja", {"name": "run"}) == "First run"
+
+    template_file.write_text("Second {{ name }}")
+    stat = template_file.stat()
+    os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+    assert second.render("cached.jinja", {"name": "run"}) == "Second run"
+
+
+def test_prompt_renderer_missing_template(tmp_path):
+    renderer = PromptRenderer(base_dir=tmp_path)
+    with pytest.raises(FileNotFoundError):
+        renderer.render("missing.jinja")
+
+
+def test_prompt_renderer_warms_builtin_templates_once(monkeypatch):
+    monkeypatch.setattr(prompt_base, "_WARMED_DIRS", set())
+
+    renderer = PromptRenderer()
+    assert str(renderer.base_dir) in prompt_base._WARMED_DIRS
+    with patch.object(renderer._env, "get_template") as get_template:
+        PromptRenderer()
+    get_template.assert_not_called()
+
+
+def test_prompt_renderer_does_not_scan_custom_directories(tmp_path):
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "warm.jinja").write_text("Hi {{ name }}")
+
+    with patch.object(Path, "rglob") as rglob:
+        renderer = PromptRenderer(base_dir=tmp_path)
+    rglob.assert_not_called()
+    assert renderer.render("nested/warm.jinja", {"name": "Ann"}) == "Hi Ann"
+
+
+def test_prompt_renderer_minijinja_falls_back_to_jinja(tmp_path, monkeypatch):
+    pytest.importorskip("minijinja")
+    monkeypatch.setenv("OPENAI_SDK_HELPERS_MINIJINJA", "1")
+    (tmp_path / "simple.jinja").write_text("Hello {{ name }}")
+
+    renderer = PromptRenderer(base_dir=tmp_path)
+    assert renderer.render("simple.jinja", {"name": "Ann"}) == "Hello Ann"
+    with pytest.raises(FileNotFoundError):
+        renderer.render("missing.jinja")
+
+
+def test_prompt_renderer_rejects_traversal_every_time(tmp_path):
+    from openai_sdk_helpers.errors import InputValidationError
+
+    renderer = PromptRenderer(base_dir=tmp_path)
+    for _ in range(2):
+        with pytest.raises(InputValidationError):
+            renderer.render("../outside.jinja")
+
+
+def test_prompt_renderer_formats_simple_templates_without_jinja(tmp_path):
+    (tmp_path / "simple.jinja").write_text("Hi {{ name }}, {literal} {{ missing }}\n")
+    (tmp_path / "complex.jinja").write_text("{{ name | upper }}")
+
+    renderer = PromptRenderer(base_dir=tmp_path)
+    with patch("jinja2.Template.render") as jinja_render:
+        rendered = renderer.render("simple.jinja", {"name": "Ann"})
+    jinja_render.assert_not_called()
+    assert rendered == "Hi Ann, {literal} "
+    assert renderer.render("complex.jinja", {"name": "Ann"}) == "ANN"
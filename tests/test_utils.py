@@ -129,3 +129,18 @@ def test_coerce_jsonable_serializes_structures_and_dataclasses():
     assert serialized["structure"]["message"] == "hello"
     assert serialized["wrapper"]["content"] == "a/b"
     assert json.dumps(serialized)
+
+
+def test_get_data_path_is_cached(monkeypatch, tmp_path):
+    monkeypatch.setattr(env_mod.Path, "home", lambda: tmp_path)
+    first = get_data_path("cached_mod")
+    monkeypatch.setattr(env_mod.Path, "home", lambda: tmp_path / "other")
+    assert get_data_path("cached_mod") is first
+
+
+def test_log_defers_formatting_to_logging(caplog):
+    caplog.set_level("INFO")
+    log("loaded %d items from %s", 3, "cache")
+    record = next(r for r in caplog.records if r.msg == "loaded %d items from %s")
+    assert record.args == (3, "cache")
+    assert record.getMessage() == "loaded 3 items from cache"
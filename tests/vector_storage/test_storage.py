@@ -117,6 +117,26 @@ def test_upload_and_delete_file(tmp_path, dummy_client, monkeypatch):
     assert storage.existing_files == {}
 
 
+def test_upload_file_reuses_identical_contents(tmp_path, dummy_client, monkeypatch):
+    monkeypatch.setenv("OPENAI_MODEL", "test-model")
+    storage = VectorStorage("dedup-store", client=dummy_client)
+
+    first = tmp_path / "a.txt"
+    first.write_text("same")
+    copy = tmp_path / "copy.txt"
+    copy.write_text("same")
+
+    uploaded = storage.upload_file(str(first))
+    reused = storage.upload_file(str(copy))
+
+    assert reused.status == "existing"
+    assert reused.id == uploaded.id
+    assert len(dummy_client.files_created) == 1
+
+    storage.delete_file(uploaded.id)
+    assert storage.upload_file(str(copy)).status == "success"
+
+
 def test_upload_files_skips_existing(tmp_path, dummy_client, monkeypatch):
     monkeypatch.setenv("OPENAI_MODEL", "test-model")
     storage = VectorStorage("batch-store", client=dummy_client)